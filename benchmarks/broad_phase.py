@@ -0,0 +1,140 @@
+"""
+broad_phase.py -- Compare the ObjectsManage broad phases (spatial hash vs
+sweep-and-prune) across body counts and scene layouts.
+
+Each scene is simulated once and its per-step positions recorded, then every
+broad phase is timed on the same recording, so sweep-and-prune sees the same
+frame-to-frame coherence it would in the sandbox.
+
+Usage:
+    python benchmarks/broad_phase.py [--counts 250 1000 4000] [--steps 120] [--json out.json]
+
+Scenes:
+    spread  bodies scattered over the play area, drifting without gravity
+    pile    bodies dropped under gravity and settled into a pile on the floor
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+os.chdir(PROJECT_ROOT)  # fonts in pong/constants.py use relative paths
+
+import numpy as np
+from pong_BETA.object_manage import (
+    ObjectsManage, Box, Circle, BROAD_PHASES, PLAY_W, FIXED_DT, _shape_arrays,
+)
+from pong.constants import HEIGHT
+
+DEFAULT_COUNTS = [250, 500, 1000, 2000, 4000]
+SCENES = ('spread', 'pile')
+BODY_SIZE = 8           # box side / ball diameter (px)
+PILE_SETTLE_STEPS = 360 # steps of falling before recording a pile
+
+
+def build_scene(scene, count, seed=0):
+    """Create an ObjectsManage holding `count` boxes and balls laid out for `scene`."""
+    rng = np.random.default_rng(seed)
+    world = ObjectsManage(bounds=((0, 0), (PLAY_W, HEIGHT)))
+    gravity = (0.0, 900.0) if scene == 'pile' else (0.0, 0.0)
+    if scene == 'pile':
+        # Drop from a loose lattice so bodies don't start overlapping
+        cols = int(PLAY_W // (BODY_SIZE + 3))
+        spots = [((c + 0.5) * (BODY_SIZE + 3), HEIGHT - (r + 0.5) * (BODY_SIZE + 3) - 40)
+                 for r in range(count // cols + 1) for c in range(cols)][:count]
+    else:
+        spots = rng.uniform((BODY_SIZE, BODY_SIZE), (PLAY_W - BODY_SIZE, HEIGHT - BODY_SIZE),
+                            size=(count, 2))
+    for k, spot in enumerate(spots):
+        vel = rng.normal(0.0, 60.0, 2)
+        if k % 2:
+            world.add(Box(pos=spot, size=BODY_SIZE, vel=vel, gravity=gravity))
+        else:
+            world.add(Circle(pos=spot, radius=BODY_SIZE / 2, vel=vel, gravity=gravity))
+    if scene == 'pile':
+        for _ in range(PILE_SETTLE_STEPS):
+            world.update(FIXED_DT)
+    return world
+
+
+def record(world, steps):
+    """Step the world and return the position array of every step."""
+    frames = []
+    for _ in range(steps):
+        world.update(FIXED_DT)
+        frames.append(np.array([o.pos for o in world.objects], dtype=float))
+    return frames
+
+
+def time_broad_phase(name, frames, half):
+    """Run one broad phase over the recorded frames; returns timing and pair stats."""
+    bp = BROAD_PHASES[name]()
+    bp.query_pairs(frames[0], half)  # first call builds sort order / warms caches
+    times, candidates, pairs = [], [], []
+    for pos in frames:
+        t0 = time.perf_counter()
+        i, _ = bp.query_pairs(pos, half)
+        times.append(time.perf_counter() - t0)
+        candidates.append(bp.pair_count)
+        pairs.append(len(i))
+    times_ms = np.array(times) * 1000.0
+    return {
+        'mean_ms': float(times_ms.mean()),
+        'p95_ms': float(np.percentile(times_ms, 95)),
+        'candidates': float(np.mean(candidates)),
+        'pairs': float(np.mean(pairs)),
+    }
+
+
+def run(counts, steps, scenes=SCENES):
+    results = []
+    for scene in scenes:
+        for count in counts:
+            world = build_scene(scene, count)
+            frames = record(world, steps)
+            half, _, _ = _shape_arrays(world.objects)
+            row = {'scene': scene, 'bodies': count}
+            for name in BROAD_PHASES:
+                row[name] = time_broad_phase(name, frames, half)
+            results.append(row)
+            print_row(row)
+    return results
+
+
+def print_header():
+    names = list(BROAD_PHASES)
+    cols = ''.join(f'{n + " ms":>12}{n + " cand":>12}' for n in names)
+    print(f'{"scene":<8}{"bodies":>8}{"pairs":>10}{cols}{"winner":>10}')
+
+
+def print_row(row):
+    names = list(BROAD_PHASES)
+    cols = ''.join(f'{row[n]["mean_ms"]:>12.3f}{row[n]["candidates"]:>12.0f}' for n in names)
+    winner = min(names, key=lambda n: row[n]['mean_ms'])
+    print(f'{row["scene"]:<8}{row["bodies"]:>8}{row[names[0]]["pairs"]:>10.0f}{cols}{winner:>10}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ObjectsManage broad phases')
+    parser.add_argument('--counts', type=int, nargs='+', default=DEFAULT_COUNTS,
+                        help='Body counts to test')
+    parser.add_argument('--steps', type=int, default=120,
+                        help='Recorded steps per scene (at FIXED_DT)')
+    parser.add_argument('--scenes', nargs='+', choices=SCENES, default=list(SCENES))
+    parser.add_argument('--json', metavar='PATH', help='Also write results as JSON')
+    args = parser.parse_args()
+
+    print_header()
+    results = run(args.counts, args.steps, args.scenes)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'steps': args.steps, 'results': results}, f, indent=2)
+        print(f'Wrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""
+compare.py -- Performance regression gate for the scenario benchmarks.
+
+Runs the scenarios from scenarios.py several times, compares each scenario's
+simulation and render cost against a baseline JSON file, and exits non-zero
+if any of them got slower by more than the threshold with a significant
+one-sided Mann-Whitney U test over the per-run means. With a single sample
+on either side (e.g. a baseline written by scenarios.py --json) the
+threshold alone decides.
+
+Usage:
+    python benchmarks/compare.py --save baseline.json              # record a baseline
+    python benchmarks/compare.py baseline.json [--runs 5] [--threshold 0.10]
+                                 [--alpha 0.05] [--scenarios ...] [--save current.json]
+
+Baselines are only meaningful on the machine that wrote them; a differing
+platform or processor is reported as a warning.
+"""
+import os
+import sys
+import json
+import math
+import argparse
+from collections import defaultdict
+from functools import lru_cache
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import numpy as np
+from scenarios import SCENARIOS, DEFAULT_FRAMES, run_scenario, machine_metadata
+
+METRICS = ('sim_ms_mean', 'render_ms_mean')   # lower is better
+DEFAULT_RUNS = 5
+DEFAULT_THRESHOLD = 0.10    # relative slowdown of the median that counts
+DEFAULT_ALPHA = 0.05
+
+
+# -------------------- Statistics --------------------
+
+@lru_cache(maxsize=None)
+def _u_count(n, m, u):
+    """Orderings of n + m distinct values whose U statistic for the n-sample is u."""
+    if u < 0:
+        return 0
+    if n == 0 or m == 0:
+        return 1 if u == 0 else 0
+    # The largest value belongs to the n-sample (beats all m) or to the m-sample
+    return _u_count(n - 1, m, u - m) + _u_count(n, m - 1, u)
+
+
+def mann_whitney_greater(current, baseline):
+    """
+    One-sided Mann-Whitney U test that `current` tends to be larger.
+
+    Returns:
+        p-value, or None with fewer than two samples on either side. Exact
+        for small samples (no tie correction), normal approximation above 20.
+    """
+    n, m = len(current), len(baseline)
+    if n < 2 or m < 2:
+        return None
+    u = sum(1.0 if c > b else 0.5 if c == b else 0.0 for c in current for b in baseline)
+    if n + m <= 20:
+        total = math.comb(n + m, n)
+        # P(U >= u); half-integer U from ties rounds towards the conservative side
+        start = math.ceil(u - 1e-9)
+        return sum(_u_count(n, m, k) for k in range(start, n * m + 1)) / total
+    mean = n * m / 2.0
+    sd = math.sqrt(n * m * (n + m + 1) / 12.0)
+    z = (u - 0.5 - mean) / sd
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+# -------------------- Baselines --------------------
+
+def load_samples(path):
+    """{scenario: [result row, ...]} plus metadata from a benchmark JSON file."""
+    with open(path) as f:
+        data = json.load(f)
+    samples = defaultdict(list)
+    for row in data.get('results', []):
+        samples[row['scenario']].append(row)
+    return samples, data.get('meta', {}), data.get('frames')
+
+
+def run_samples(scenarios, runs, frames):
+    samples = defaultdict(list)
+    for i in range(runs):
+        for name in scenarios:
+            # A different seed per run so runs are independent samples
+            samples[name].append(run_scenario(name, frames, seed=i))
+        print(f'run {i + 1}/{runs} done', file=sys.stderr)
+    return samples
+
+
+def compare(baseline, current, threshold, alpha):
+    """Rows of the diff table; each has 'status' ok / faster / REGRESSED / noisy / new."""
+    rows = []
+    for name, cur_rows in current.items():
+        for metric in METRICS:
+            cur = [r[metric] for r in cur_rows]
+            base = [r[metric] for r in baseline.get(name, [])]
+            row = {'scenario': name, 'metric': metric, 'current': float(np.median(cur)),
+                   'runs': len(cur)}
+            if not base:
+                row.update(baseline=None, change=None, p=None, status='new')
+                rows.append(row)
+                continue
+            base_med = float(np.median(base))
+            change = row['current'] / base_med - 1.0 if base_med > 0 else 0.0
+            p = mann_whitney_greater(cur, base)
+            if change > threshold:
+                status = 'REGRESSED' if p is None or p <= alpha else 'noisy'
+            elif change < -threshold:
+                status = 'faster'
+            else:
+                status = 'ok'
+            row.update(baseline=base_med, change=change, p=p, status=status)
+            rows.append(row)
+    return rows
+
+
+def print_table(rows):
+    print(f'{"scenario":<18}{"metric":<16}{"baseline":>10}{"current":>10}'
+          f'{"change":>9}{"p":>8}  status')
+    for r in rows:
+        base = f'{r["baseline"]:.3f}' if r['baseline'] is not None else '-'
+        change = f'{r["change"] * 100:+.1f}%' if r['change'] is not None else '-'
+        p = f'{r["p"]:.3f}' if r['p'] is not None else '-'
+        print(f'{r["scenario"]:<18}{r["metric"]:<16}{base:>10}{r["current"]:>10.3f}'
+              f'{change:>9}{p:>8}  {r["status"]}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare scenario benchmarks against a baseline')
+    parser.add_argument('baseline', nargs='?', help='Baseline JSON (from --save or scenarios.py --json)')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='Runs of each scenario')
+    parser.add_argument('--frames', type=int, default=None,
+                        help=f'Measured frames per run (default: the baseline\'s, else {DEFAULT_FRAMES})')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=None,
+                        help='Scenarios to run (default: those in the baseline, else all)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Relative slowdown of the median that fails (0.10 = 10%%)')
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA,
+                        help='Significance level of the Mann-Whitney U test')
+    parser.add_argument('--save', metavar='PATH', help='Write this run as a baseline file')
+    args = parser.parse_args()
+    if not args.baseline and not args.save:
+        parser.error('give a baseline to compare against, or --save to record one')
+
+    baseline, base_meta, base_frames = ({}, {}, None)
+    if args.baseline:
+        baseline, base_meta, base_frames = load_samples(args.baseline)
+    frames = args.frames or base_frames or DEFAULT_FRAMES
+    scenarios = args.scenarios or [s for s in SCENARIOS if s in baseline] or list(SCENARIOS)
+
+    meta = machine_metadata()
+    for key in ('platform', 'processor', 'python', 'pygame'):
+        if base_meta.get(key) not in (None, meta[key]):
+            print(f'warning: baseline {key} {base_meta[key]!r} differs from {meta[key]!r}',
+                  file=sys.stderr)
+    if base_frames and base_frames != frames:
+        print(f'warning: baseline used {base_frames} frames per run, this run {frames}',
+              file=sys.stderr)
+
+    current = run_samples(scenarios, args.runs, frames)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'meta': meta, 'frames': frames, 'runs': args.runs,
+                       'results': [row for name in scenarios for row in current[name]]},
+                      f, indent=2)
+        print(f'Wrote {args.save}')
+
+    if not args.baseline:
+        return 0
+    rows = compare(baseline, current, args.threshold, args.alpha)
+    print_table(rows)
+    regressed = [r for r in rows if r['status'] == 'REGRESSED']
+    if regressed:
+        print(f'{len(regressed)} regression(s) beyond {args.threshold:.0%}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
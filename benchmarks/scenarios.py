@@ -0,0 +1,447 @@
+"""
+scenarios.py -- Headless benchmark of the real game loops under scripted play.
+
+Each scenario runs one mode's main() under the SDL dummy video driver with a
+non-sleeping clock and frame scheduler, scripted key presses for the left player (it tracks the
+ball; the right side is the AI), and a per-frame hook that stages the load
+(particle storms, multi-ball, blood, a late Crazy-mode clock). Frame timing
+comes from the mode's own profiler marks via a frame recording, so the
+simulation phases (events, ai, physics, powerups, cursed, combat, juice) and
+the render phases (world, effects, flip) are measured separately. The
+pong.metrics registry is enabled as well, so each result also carries the
+subsystem counters per frame (AI predictions, collision tests, particles
+emitted/culled, Surfaces built, update times).
+
+Usage:
+    python benchmarks/scenarios.py [--frames 600] [--scenarios classic_rally multiball]
+                                   [--json out.json]
+
+Scenarios:
+    classic_rally    long Classic rally, left bot vs Impossible AI
+    spin_rally       Pongception rally, the left player winding up and swinging at full
+                     speed against the ball's travel (ball spin is reported and must
+                     pass the threshold where the spin arcs are drawn)
+    particle_storm   Classic with juice particle bursts every frame at full budget
+    multiball        Classic with chaos multi-ball refilled every two seconds
+    cursed_lightning Cursed with the left player charging lightning, then a charged
+                     push and pull (force particles must appear), and blood sprays
+    crazy_5min       Crazy mode with its clock set to five minutes in
+"""
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import platform
+import importlib
+import subprocess
+from collections import Counter
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+os.chdir(PROJECT_ROOT)  # fonts in pong/constants.py use relative paths
+
+import numpy as np
+import pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+from pong.constants import FPS
+from pong.settings import GameSettings
+from pong.powerups import PowerUpType
+from pong.ball import SPIN_ARC_THRESHOLD
+from pong.cursed_combat import CHARGE_FORCE_TIME
+from pong.profiler import PHASE_NAMES
+from pong import frame_recorder, frame_scheduler, metrics
+
+SIM_PHASES = ('events', 'ai', 'physics', 'powerups', 'cursed', 'combat', 'juice')
+RENDER_PHASES = ('world', 'effects', 'flip')
+WARMUP_FRAMES = 60
+DEFAULT_FRAMES = 600
+SWING_DISTANCE = 40     # px from the paddle face where the spin_rally player swings
+WINDUP_OFFSET = 0.35    # paddle heights the wind-up leaves the ball off-centre
+CHARGE_FRAMES = int(CHARGE_FORCE_TIME * FPS) + 5  # frames a charged force key is held
+
+
+class StopScenario(Exception):
+    """Raised from the display update once a scenario has run its frames."""
+
+
+class ScenarioError(RuntimeError):
+    """A scenario did not produce the load it exists to measure."""
+
+
+class FakeClock:
+    """pygame Clock stand-in that never sleeps and reports a perfect frame."""
+
+    def __init__(self):
+        self._ms = 1000 // FPS
+
+    def tick(self, framerate=0):
+        return self._ms
+
+    def get_time(self):
+        return self._ms
+
+    def get_fps(self):
+        return float(FPS)
+
+
+class FrameTime:
+    """
+    Stand-in for a mode module's time import: monotonic() advances one
+    perfect frame per displayed frame, so hold-to-charge timings depend on
+    frames rather than on how fast the machine runs them.
+    """
+
+    def __init__(self, count):
+        self._count = count
+
+    def monotonic(self):
+        return self._count[0] / FPS
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+class Scene:
+    """Game objects captured as the mode constructs them."""
+
+    def __init__(self):
+        self.objects = {}
+        self.stats = {}     # name -> per-frame values recorded by hooks
+
+    def record(self, name, value):
+        self.stats.setdefault(name, []).append(value)
+
+    def first(self, name):
+        found = self.objects.get(name)
+        return found[0] if found else None
+
+    def last(self, name):
+        found = self.objects.get(name)
+        return found[-1] if found else None
+
+
+class ScriptedKeys:
+    """
+    pygame.key.get_pressed() stand-in: the left player follows the ball with
+    W/S, plus any keys the scenario holds this frame. A hook that steers the
+    paddle itself clears follow for that frame.
+    """
+
+    def __init__(self, scene, held=()):
+        self.scene = scene
+        self.held = set(held)
+        self.follow = True
+
+    def __getitem__(self, key):
+        if key in self.held:
+            return True
+        if not self.follow or key not in (pygame.K_w, pygame.K_s):
+            return False
+        paddles = self.scene.objects.get('Paddle')
+        ball = self.scene.first('Ball')
+        if not paddles or ball is None:
+            return False
+        paddle = paddles[0]
+        center = paddle.pos[1] + paddle.height / 2
+        dead = paddle.height * 0.2
+        if key == pygame.K_w:
+            return ball.pos[1] < center - dead
+        return ball.pos[1] > center + dead
+
+
+# -------------------- Scenario hooks --------------------
+
+def _spin(scene, frame, keys):
+    # While the ball approaches, the left player winds up with the ball off
+    # the paddle centre, then swings at full speed against the ball's
+    # vertical travel. The paddle meets the ball near its top speed and the
+    # contact impulse adds to it, so PhysicsRules' spin (half the paddle
+    # velocity) gets past the arc threshold
+    ball = scene.first('Ball')
+    paddles = scene.objects.get('Paddle')
+    if ball is None or not paddles:
+        return
+    paddle = paddles[0]
+    if ball.vel[0] < 0:
+        keys.follow = False
+        up = ball.vel[1] >= 0
+        if ball.pos[0] - (paddle.pos[0] + paddle.width) < SWING_DISTANCE:
+            keys.held.add(pygame.K_w if up else pygame.K_s)
+        else:
+            offset = WINDUP_OFFSET * paddle.height
+            target = ball.pos[1] + (offset if up else -offset) - paddle.height / 2
+            if paddle.pos[1] > target + 6:
+                keys.held.add(pygame.K_w)
+            elif paddle.pos[1] < target - 6:
+                keys.held.add(pygame.K_s)
+    if frame >= WARMUP_FRAMES:
+        scene.record('ball_spin', abs(ball.spin))
+
+
+def _storm(scene, frame):
+    juice = scene.first('JuiceManager')
+    ball = scene.first('Ball')
+    if juice and ball:
+        juice.particles.emit(ball.pos[0], ball.pos[1], count=80, color=(255, 200, 80),
+                             speed=5, life=1.0, size=4)
+
+
+def _multiball(scene, frame):
+    pu_mgr = scene.first('PowerUpManager')
+    if pu_mgr and frame % 120 == 0:
+        pu_mgr._apply(PowerUpType.MULTI_BALL, 'left')
+
+
+def _key_event(kind, key):
+    pygame.event.post(pygame.event.Event(kind, key=key, mod=0))
+
+
+def _cursed(scene, frame, keys):
+    # Hold push+pull (F+Q) long enough to fire lightning and let go, then
+    # charge and release a push (F) and a pull (Q). Force fires on KEYDOWN/
+    # KEYUP events, so those are posted alongside the held keys
+    t = frame % (150 + 2 * CHARGE_FRAMES + 20)
+    push_at, pull_at = 140, 150 + CHARGE_FRAMES + 10
+    if t < 130:
+        keys.held.update((pygame.K_f, pygame.K_q))
+    elif t == 130:
+        _key_event(pygame.KEYUP, pygame.K_f)
+        _key_event(pygame.KEYUP, pygame.K_q)
+    for key, start in ((pygame.K_f, push_at), (pygame.K_q, pull_at)):
+        if t == start:
+            _key_event(pygame.KEYDOWN, key)
+        if start <= t < start + CHARGE_FRAMES:
+            keys.held.add(key)
+        elif t == start + CHARGE_FRAMES:
+            _key_event(pygame.KEYUP, key)
+    force = scene.first('ForceEffectSystem')
+    if force is not None and frame >= WARMUP_FRAMES:
+        scene.record('force_particles', len(force))
+    combat = scene.first('CursedCombatManager')
+    if combat and frame % 20 == 0:
+        x = random.uniform(200, combat._screen_w - 200)
+        combat.blood.emit_slash(x, random.uniform(200, 600), random.choice((-1.0, 1.0)), count=40)
+
+
+def _crazy(scene, frame):
+    crazy = scene.last('CrazyModeManager')
+    if crazy and frame == 0:
+        crazy.total_time = 300.0
+        crazy.round_number = 10 ** 6  # keep the win screen away
+
+
+SCENARIOS = {
+    'classic_rally':    {'mode': 'classic', 'settings': {}},
+    'spin_rally':       {'mode': 'pongception', 'settings': {}, 'keys_hook': _spin,
+                         'expect_above': {'ball_spin': SPIN_ARC_THRESHOLD}},
+    'particle_storm':   {'mode': 'classic', 'settings': {}, 'hook': _storm},
+    'multiball':        {'mode': 'classic', 'settings': {'multiball_chaos': True}, 'hook': _multiball},
+    'cursed_lightning': {'mode': 'cursed', 'settings': {}, 'keys_hook': _cursed,
+                         'expect_above': {'force_particles': 0}},
+    'crazy_5min':       {'mode': 'crazy', 'settings': {}, 'hook': _crazy},
+}
+
+# Captured per mode module, if the module imports them
+CAPTURED = ('Ball', 'Paddle', 'JuiceManager', 'PowerUpManager', 'CursedCombatManager',
+            'CrazyModeManager', 'ForceEffectSystem')
+
+
+def _settings(overrides):
+    s = GameSettings()
+    s.ai_difficulty = 10
+    s.winning_score = 10 ** 6
+    s.power_ups_enabled = True
+    s.particles_enabled = True
+    s.auto_quality = False  # measure a fixed detail level
+    s.dirty_rects = False
+    s.render_scale = 1.0
+    s.profiler = False
+    s.record_frames = False
+    for key, value in overrides.items():
+        setattr(s, key, value)
+    return s
+
+
+def _capturing(cls, name, scene):
+    def __init__(self, *args, **kwargs):
+        cls.__init__(self, *args, **kwargs)
+        scene.objects.setdefault(name, []).append(self)
+    return type(cls.__name__, (cls,), {'__init__': __init__})
+
+
+async def _no_countdown(*args, **kwargs):
+    return None
+
+
+async def _no_wait(idle=False):
+    return None
+
+
+def run_scenario(name, frames, seed=0):
+    """Run one scenario; returns its result row."""
+    spec = SCENARIOS[name]
+    module = importlib.import_module(f"versions.{spec['mode']}.main")
+    scene = Scene()
+    random.seed(seed)
+    np.random.seed(seed)
+
+    saved_module = {attr: getattr(module, attr) for attr in CAPTURED + ('countdown', 'time')
+                    if hasattr(module, attr)}
+    saved_pygame = (pygame.display.update, pygame.key.get_pressed, pygame.time.Clock)
+    saved_next_frame = frame_scheduler.next_frame
+    count = [0]
+    keys = ScriptedKeys(scene)
+    reg = metrics.enable()
+    reg.reset()
+    measured_from = [reg.snapshot()]
+
+    def get_pressed():
+        keys.held.clear()
+        keys.follow = True
+        if 'keys_hook' in spec:
+            spec['keys_hook'](scene, count[0], keys)
+        return keys
+
+    def update(*args):
+        if 'hook' in spec:
+            spec['hook'](scene, count[0])
+        count[0] += 1
+        if count[0] == WARMUP_FRAMES:
+            measured_from[0] = reg.snapshot()
+        if count[0] >= frames + WARMUP_FRAMES:
+            raise StopScenario
+        saved_pygame[0](*args)
+
+    for attr in CAPTURED:
+        if attr in saved_module:
+            setattr(module, attr, _capturing(saved_module[attr], attr, scene))
+    module.countdown = _no_countdown
+    if 'time' in saved_module:
+        module.time = FrameTime(count)
+    pygame.display.update = update
+    pygame.key.get_pressed = get_pressed
+    pygame.time.Clock = FakeClock
+    frame_scheduler.next_frame = _no_wait
+    rec = frame_recorder.start(PHASE_NAMES, capacity=frames + WARMUP_FRAMES)
+    t0 = time.perf_counter()
+    try:
+        settings = _settings(spec['settings'])
+        if spec['mode'] == 'sandbox':
+            asyncio.run(module.main(settings=settings))
+        else:
+            asyncio.run(module.main(vs_ai=True, settings=settings))
+    except StopScenario:
+        pass
+    finally:
+        wall = time.perf_counter() - t0
+        frame_recorder.stop(save=False)
+        counters = metrics.per_frame(measured_from[0], reg.snapshot())
+        metrics.disable()
+        for attr, value in saved_module.items():
+            setattr(module, attr, value)
+        pygame.display.update, pygame.key.get_pressed, pygame.time.Clock = saved_pygame
+        frame_scheduler.next_frame = saved_next_frame
+    row = summarize(name, spec['mode'], rec.rows()[WARMUP_FRAMES:], wall, counters, scene.stats)
+    for stat, floor in spec.get('expect_above', {}).items():
+        peak = row['stats'].get(stat, {}).get('peak', 0)
+        if not peak > floor:
+            raise ScenarioError(f"{name}: {stat} peaked at {peak:.2f}, not above {floor}, "
+                                "so the scenario is not measuring it")
+    return row
+
+
+def summarize(name, mode, rows, wall, counters=None, stats=None):
+    sim = np.array([sum(r[f'{p}_ms'] for p in SIM_PHASES) for r in rows])
+    render = np.array([sum(r[f'{p}_ms'] for p in RENDER_PHASES) for r in rows])
+    frame = np.array([r['frame_ms'] for r in rows])
+    peaks = {c: max((r[c] for r in rows), default=0) for c in frame_recorder.COUNTERS}
+    tags = Counter(tag for r in rows for tag in r['tags'])
+    return {
+        'scenario': name,
+        'mode': mode,
+        'frames': len(rows),
+        'wall_s': round(wall, 3),
+        'sim_ms_mean': float(sim.mean()),
+        'sim_ms_p95': float(np.percentile(sim, 95)),
+        'sim_steps_per_s': float(1000.0 / sim.mean()),
+        'render_ms_mean': float(render.mean()),
+        'render_ms_p95': float(np.percentile(render, 95)),
+        'render_fps': float(1000.0 / render.mean()),
+        'frame_ms_mean': float(frame.mean()),
+        'fps': float(1000.0 / frame.mean()),
+        'peak_counts': peaks,
+        'tagged_events': dict(tags),
+        'metrics': {k: round(v, 4) for k, v in (counters or {}).items()},
+        'stats': {k: {'mean': float(np.mean(v)), 'peak': float(np.max(v))}
+                  for k, v in (stats or {}).items() if v},
+    }
+
+
+def machine_metadata():
+    """Interpreter, library and host details, plus the git commit if available."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'pygame': pygame.version.ver,
+        'sdl': '.'.join(map(str, pygame.get_sdl_version())),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+    }
+
+
+def print_header():
+    print(f'{"scenario":<18}{"mode":<13}{"sim ms":>9}{"steps/s":>10}'
+          f'{"render ms":>11}{"render fps":>12}{"fps":>9}')
+
+
+def print_row(row):
+    print(f'{row["scenario"]:<18}{row["mode"]:<13}{row["sim_ms_mean"]:>9.3f}'
+          f'{row["sim_steps_per_s"]:>10.0f}{row["render_ms_mean"]:>11.3f}'
+          f'{row["render_fps"]:>12.0f}{row["fps"]:>9.0f}')
+    for stat, s in row.get('stats', {}).items():
+        print(f'{"":<18}{stat} mean {s["mean"]:.2f}, peak {s["peak"]:.2f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the game loops with scripted scenarios')
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAMES,
+                        help=f'Measured frames per scenario (after {WARMUP_FRAMES} warm-up frames)')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--json', metavar='PATH', help='Also write results as JSON')
+    args = parser.parse_args()
+
+    print_header()
+    results = []
+    for name in args.scenarios:
+        row = run_scenario(name, args.frames)
+        results.append(row)
+        print_row(row)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'meta': machine_metadata(), 'frames': args.frames,
+                       'results': results}, f, indent=2)
+        print(f'Wrote {args.json}')
+
+
+if __name__ == '__main__':
+    main()
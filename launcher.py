@@ -1,18 +1,33 @@
-import asyncio
-import pygame
 import sys
 import os
 
+if '--profile-startup' in sys.argv:
+    # Loaded by path: importing it through the pong package would import
+    # pygame and pong.constants before the clock starts
+    import importlib.util
+    _spec = importlib.util.spec_from_file_location(
+        'pong.startup_profile',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pong', 'startup_profile.py'))
+    _startup = sys.modules['pong.startup_profile'] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_startup)
+    _startup.start()
+
+import asyncio
+import pygame
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), './')))
 
+from pong import startup_profile
+
 if not pygame.get_init():
-    pygame.init()
+    with startup_profile.span('pygame.init'):
+        pygame.init()
 
 from pong.constants import *
 from pong.menu import draw_menu, handle_menu_click, GAME_MODES, get_mode_box_rects, ball_menu
 from pong.settings import GameSettings, SettingsMenu
 from pong.touch import TouchHandler
-from pong import audio
+from pong import audio, frame_scheduler
 from versions.classic.main import main as run_classic
 from versions.pongception.main import main as run_pongception
 from versions.BETA.main import main as run_BETA
@@ -68,10 +83,12 @@ def set_window_icon():
 
 
 async def launcher():
-    WIN = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("PongWithIssues")
-    set_window_icon()
-    audio.init()
+    with startup_profile.span('window'):
+        WIN = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("PongWithIssues")
+        set_window_icon()
+    with startup_profile.span('audio.init'):
+        audio.init()
     clock = pygame.time.Clock()
 
     selected_mode = 0  # Classic = 0, Pongception = 1, BETA = 2, Sandbox = 3
@@ -80,7 +97,8 @@ async def launcher():
 
     # Game settings (load saved or use defaults)
     settings = GameSettings()
-    settings.load()
+    with startup_profile.span('GameSettings.load'):
+        settings.load()
     settings_menu = SettingsMenu(settings)
     # Apply loaded audio settings
     audio.set_volume(master=settings.master_volume, sfx=settings.sfx_volume)
@@ -174,7 +192,8 @@ async def launcher():
                             elif _VS_BACK_RECT.collidepoint(tap_x, tap_y):
                                 choosing = False
                         touch.clear_taps()
-                        await asyncio.sleep(0)
+                        # Static screen: no clock here, so pace it at the idle rate
+                        await frame_scheduler.next_frame(idle=True)
                     if vs_ai is None:
                         continue
                     if selected_mode == 0:
@@ -186,7 +205,7 @@ async def launcher():
                     elif selected_mode == 4:
                         await run_crazy(vs_ai=vs_ai, settings=settings)
                 elif selected_mode == 2:
-                    await run_BETA()
+                    await run_BETA(settings=settings)
                 elif selected_mode == 5:
                     await run_sandbox(settings=settings)
                 # Reset display after returning from game
@@ -194,8 +213,10 @@ async def launcher():
                 set_window_icon()
 
             draw_menu(WIN, selected_mode)
+            # --profile-startup: report once the first menu frame is up
+            startup_profile.finish()
 
-        await asyncio.sleep(0)
+        await frame_scheduler.next_frame()
 
     pygame.quit()
 
@@ -5,6 +5,7 @@ Automatically sets up a virtual environment, installs dependencies,
 and starts the game. Works on Linux, macOS, and Windows.
 
 Usage: python play.py   (or python3 play.py)
+       python play.py --profile-startup   (time the game's cold start)
 """
 
 import sys
@@ -108,7 +109,8 @@ def launch_game():
     os.chdir(PROJECT_ROOT)
     env = os.environ.copy()
     env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
-    result = subprocess.call([py, launcher], env=env)
+    # Pass through launcher flags such as --profile-startup
+    result = subprocess.call([py, launcher] + sys.argv[1:], env=env)
     return result
 
 
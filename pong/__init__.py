@@ -12,7 +12,7 @@ from pong.constants import (
 )
 from pong.ball import Ball
 from pong.paddle import Paddle
-from pong.utilities import handle_ball_collision
+from pong.contacts import resolve_contacts, paddle_hits
 
 
 class GameInfo:
@@ -58,35 +58,11 @@ class Game:
 
     def _handle_collision(self):
         """Handle ball-wall and ball-paddle collisions, track hits."""
-        ball = self.ball
-        lp = self.left_paddle
-        rp = self.right_paddle
-
-        # Wall bounce (top/bottom)
-        if ball.pos[1] - ball.radius <= 0:
-            ball.vel[1] = abs(ball.vel[1])
-        elif ball.pos[1] + ball.radius >= self.height:
-            ball.vel[1] = -abs(ball.vel[1])
-
-        # Left paddle collision
-        if (ball.vel[0] < 0
-                and lp.pos[0] <= ball.pos[0] - ball.radius <= lp.pos[0] + lp.width
-                and lp.pos[1] <= ball.pos[1] <= lp.pos[1] + lp.height):
-            ball.vel[0] = abs(ball.vel[0])
-            mid = lp.pos[1] + lp.height / 2
-            diff = ball.pos[1] - mid
-            ball.vel[1] = diff / (lp.height / 2) * abs(ball.vel[0])
-            self.left_hits += 1
-
-        # Right paddle collision
-        if (ball.vel[0] > 0
-                and rp.pos[0] <= ball.pos[0] + ball.radius <= rp.pos[0] + rp.width
-                and rp.pos[1] <= ball.pos[1] <= rp.pos[1] + rp.height):
-            ball.vel[0] = -abs(ball.vel[0])
-            mid = rp.pos[1] + rp.height / 2
-            diff = ball.pos[1] - mid
-            ball.vel[1] = diff / (rp.height / 2) * abs(ball.vel[0])
-            self.right_hits += 1
+        contacts = resolve_contacts(self.ball, self.left_paddle, self.right_paddle,
+                                    'training', self.height)
+        self.left_hits += len(paddle_hits(contacts, 'left'))
+        self.right_hits += len(paddle_hits(contacts, 'right'))
+        return contacts
 
     def loop(self):
         """Advance one frame. Returns GameInfo."""
@@ -10,6 +10,7 @@ import time
 import pygame
 import numpy as np
 from pong.constants import WIDTH, HEIGHT, FONT_TINY_DIGITAL, DARK_GREY
+from pong import metrics
 
 
 class Ability:
@@ -84,6 +85,8 @@ class ForcePush(Ability):
         if self._applied or self._origin is None:
             return
         self._applied = True
+        metrics.count('abilities.applied')
+        metrics.count('abilities.targets_tested', len(objects))
 
         for obj, multiplier in objects:
             if obj is grabbed_obj:
@@ -138,6 +141,8 @@ class ForcePull(Ability):
         if self._applied or self._origin is None:
             return
         self._applied = True
+        metrics.count('abilities.applied')
+        metrics.count('abilities.targets_tested', len(objects))
 
         for obj, multiplier in objects:
             if obj is grabbed_obj:
@@ -212,6 +217,7 @@ class AbilityManager:
     def get(self, side, key_name):
         return self._abilities[side].get(key_name)
 
+    @metrics.timed('abilities.update')
     def update(self, dt, targets_func=None):
         """Update all abilities. targets_func(side) returns [(obj, mult), ...] for force application."""
         for side in ('left', 'right'):
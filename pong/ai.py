@@ -17,6 +17,7 @@ Parameters per level:
 
 import numpy as np
 from pong.constants import HEIGHT, WIDTH, BALL_RADIUS
+from pong import metrics
 
 
 # ----- Difficulty level names (for UI display) -----
@@ -151,7 +152,7 @@ def _predict_ball_y(ball, target_x, spin_awareness=1.0):
 
     max_steps = 600  # ~10 seconds at 60fps, safety limit
 
-    for _ in range(max_steps):
+    for step in range(max_steps):
         # Magnus effect: spin curves the ball vertically
         sim_vy += spin * 0.1
 
@@ -167,13 +168,14 @@ def _predict_ball_y(ball, target_x, spin_awareness=1.0):
             sim_y = radius
             sim_vy *= -1
 
-        # Did we reach the target?
+        # Did we reach the target? (falls through at the step limit)
         if sim_vx > 0 and sim_x >= target_x:
-            return sim_y
+            break
         elif sim_vx < 0 and sim_x <= target_x:
-            return sim_y
+            break
 
-    return sim_y  # fallback
+    metrics.count('ai.prediction_steps', step + 1)
+    return sim_y
 
 
 # ----- Main AI function -----
@@ -193,6 +195,7 @@ def ai_move_paddle(paddle, ball, difficulty=5):
     # Clamp to valid range
     level = max(1, min(10, int(round(difficulty))))
     params = DIFFICULTY_PRESETS[level]
+    metrics.count('ai.calls')
 
     paddle_center = paddle.pos[1] + paddle.height / 2
     dead_zone = paddle.height * params['dead_zone_factor']
@@ -208,6 +211,7 @@ def ai_move_paddle(paddle, ball, difficulty=5):
 
         # Determine target Y based on prediction skill
         if params['prediction_skill'] > 0:
+            metrics.count('ai.predictions')
             predicted_y = _predict_ball_y(
                 ball,
                 paddle.pos[0],
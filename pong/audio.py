@@ -8,6 +8,7 @@ Falls back silently if audio initialization fails.
 
 import sys
 import numpy as np
+from pong import startup_profile
 
 try:
     import pygame
@@ -332,7 +333,8 @@ class SoundManager:
 
         try:
             if not pygame.mixer.get_init():
-                pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2, buffer=512)
+                with startup_profile.span('mixer init'):
+                    pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2, buffer=512)
             self._available = True
         except Exception:
             # Audio init can fail in some web environments or headless setups
@@ -363,7 +365,8 @@ class SoundManager:
 
         for name, gen_func in generators.items():
             try:
-                self._sounds[name] = gen_func()
+                with startup_profile.span(f'synth {name}'):
+                    self._sounds[name] = gen_func()
             except Exception:
                 # If a single sound fails to generate, skip it silently
                 pass
@@ -418,6 +421,21 @@ def play(name):
         _manager.play(name)
 
 
+def play_contacts(contacts):
+    """Play the sound for each kind of contact in a frame's contact list.
+
+    Each kind sounds once per frame, however many balls made it.
+    """
+    if _manager is None:
+        return
+    played = set()
+    for c in contacts:
+        name = c.kind.value
+        if name not in played:
+            played.add(name)
+            _manager.play(name)
+
+
 def set_volume(master=None, sfx=None, music=None):
     """Update global volume levels."""
     if _manager is not None:
@@ -7,6 +7,15 @@ import numpy as np
 import math
 from pong.physics_object import PhysicsObject
 from pong.constants import *
+from pong.render_cache import circle_sprite, arc_sprite
+from pong.dirty_rects import DIRTY_PAD, circle_rect
+
+# Fire colors for the trail (from dark to bright)
+FIRE_COLORS = [DARK_RED, SCARLET, ORANGE_RED, ORANGE, GOLD, YELLOW, WHITE]
+ALL_FIRE_COLORS = [DARK_RED, SCARLET, ORANGE_RED, ORANGE, GOLD, YELLOW, WHITE, GOLD, YELLOW, WHITE]
+
+# |spin| above which the spin arcs are drawn
+SPIN_ARC_THRESHOLD = 4
 
 class Ball(PhysicsObject):
     """
@@ -37,29 +46,53 @@ class Ball(PhysicsObject):
 
         self.trail = []
         self.max_trail = 10
+        self.aura_layers = 3  # glow rings when fast (lowered by pong.quality)
         self.original_pos = np.array([x, y], dtype=float)
         self.original_vel = np.array(vel, dtype=float)
 
-    def draw(self, win):
+    def draw(self, win, scale=1.0):
         """
         Draws the ball on the game window.
         Uses simple circle for classic mode, fire effects for physics mode.
+        scale shrinks positions and sizes for an internal-resolution target.
         """
         if self.mode == 'classic':
-            self._draw_classic(win)
+            self._draw_classic(win, scale)
         else:
-            self._draw_physics(win)
+            self._draw_physics(win, scale)
+
+    def draw_bounds(self, pad=DIRTY_PAD):
+        """
+        Screen rect covering everything draw() paints this frame.
 
-    def _draw_classic(self, win):
+        In physics mode that is the trail, the aura when fast (its outer
+        ring reaches radius * (1.2 + 0.25 * aura_layers)) and the spin arcs,
+        which stay inside the ball's own square.
+        """
+        r = self.radius
+        if self.mode == 'classic':
+            return circle_rect(self.pos, r, pad)
+        if self.speed > 6:
+            r = max(r, int(self.radius * (1.2 + 0.25 * self.aura_layers)))
+        rect = circle_rect(self.pos, r, pad)
+        if self.trail:
+            rect.unionall_ip([circle_rect(p, self.radius, pad) for p in self.trail])
+        return rect
+
+    def _draw_classic(self, win, scale=1.0):
         """Simple classic mode drawing - just a circle"""
-        pygame.draw.circle(win, self.color, (int(self.pos[0]), int(self.pos[1])), self.radius)
+        r = self.radius if scale == 1.0 else max(1, round(self.radius * scale))
+        pygame.draw.circle(win, self.color, (int(self.pos[0] * scale), int(self.pos[1] * scale)), r)
 
-    def _draw_physics(self, win):
-        """Physics mode drawing with fire trail, aura, and spin effects"""
-        # Fire colors for the trail (from dark to bright)
-        FIRE_COLORS = [DARK_RED, SCARLET, ORANGE_RED, ORANGE, GOLD, YELLOW, WHITE]
-        ALL_FIRE_COLORS = [DARK_RED, SCARLET, ORANGE_RED, ORANGE, GOLD, YELLOW, WHITE, GOLD, YELLOW, WHITE]
+    def _draw_physics(self, win, scale=1.0):
+        """Physics mode drawing with fire trail, aura, and spin effects.
+
+        Trail, aura and arc shapes come from the shared sprite cache
+        (render_cache), so steady-state frames allocate no Surfaces.
+        """
         color_cycle_len = len(ALL_FIRE_COLORS)
+        ball_r = self.radius if scale == 1.0 else max(1, round(self.radius * scale))
+        cx, cy = int(self.pos[0] * scale), int(self.pos[1] * scale)
 
         speed = self.speed
         max_speed = 30
@@ -73,50 +106,42 @@ class Ball(PhysicsObject):
             trail_t = i / max(len(self.trail)-1, 1)
             flicker = np.random.randint(-15, 16) if speed > 7 else 0
             alpha = int(max(35, 140 - i * 18 + flicker))
-            radius = max(2, int(self.radius * (1 - trail_t * 0.8)))
+            radius = max(2, int(ball_r * (1 - trail_t * 0.8)))
 
             cidx = int((color_idx + i) % color_cycle_len)
             trail_color = ALL_FIRE_COLORS[cidx]
-            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surface, (*trail_color, alpha), (radius, radius), radius)
-            win.blit(surface, (pos[0] - radius, pos[1] - radius))
+            win.blit(circle_sprite(radius, trail_color, alpha),
+                     (int(pos[0] * scale) - radius, int(pos[1] * scale) - radius))
 
         # --- 2. Glowing aura if fast ---
         if speed > 6:
-            for layer in range(3, 0, -1):
-                aura_r = int(self.radius * (1.2 + 0.25 * layer))
+            for layer in range(self.aura_layers, 0, -1):
+                aura_r = int(ball_r * (1.2 + 0.25 * layer))
                 aura_alpha = 25 * layer + int(min(50, speed * 2))
                 aura_color = FIRE_COLORS[min(len(FIRE_COLORS) - 1, color_idx + layer)]
-                surf = pygame.Surface((aura_r * 2, aura_r * 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, (*aura_color, aura_alpha), (aura_r, aura_r), aura_r)
-                win.blit(surf, (int(self.pos[0]) - aura_r, int(self.pos[1]) - aura_r))
+                win.blit(circle_sprite(aura_r, aura_color, aura_alpha),
+                         (cx - aura_r, cy - aura_r))
 
         # --- 3. Spin arc effect ---
-        if abs(self.spin) > 4:
+        if abs(self.spin) > SPIN_ARC_THRESHOLD:
             direction = 0 if self.spin > 0 else math.pi
-            arc_rect = pygame.Rect(int(self.pos[0] - self.radius), int(self.pos[1] - self.radius),
-                                   self.radius * 2, self.radius * 2)
             arc_len = math.pi + min(math.pi * 0.8, (speed / max_speed) * math.pi * 0.8)
             base_thick = int(5 + min(18, (speed / max_speed) * 22))
+            topleft = (cx - ball_r, cy - ball_r)
 
             for j in range(5):
                 arc_alpha = 60 + int((np.sin(pygame.time.get_ticks() / 40 + j) + 1) * 80) if speed > 8 else 50 + j*10
                 arc_color = ALL_FIRE_COLORS[(color_idx + j) % color_cycle_len]
-                thick = base_thick + j * 2
-                arc_surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-                pygame.draw.arc(arc_surf, (*arc_color, min(255, arc_alpha)),
-                                pygame.Rect(0, 0, self.radius * 2, self.radius * 2),
-                                direction, direction + arc_len, thick)
-                win.blit(arc_surf, (int(self.pos[0]) - self.radius, int(self.pos[1]) - self.radius),
-                         special_flags=pygame.BLEND_ADD)
+                thick = max(1, int((base_thick + j * 2) * scale))
+                win.blit(arc_sprite(ball_r, arc_color, arc_alpha, direction, arc_len, thick),
+                         topleft, special_flags=pygame.BLEND_ADD)
 
         # --- 4. Main ball (core) ---
         if speed > 21:
             for k in range(2):
-                pygame.draw.circle(win, WHITE if k else core_color,
-                                   (int(self.pos[0]), int(self.pos[1])), self.radius - k, 0)
+                pygame.draw.circle(win, WHITE if k else core_color, (cx, cy), ball_r - k, 0)
         else:
-            pygame.draw.circle(win, core_color, (int(self.pos[0]), int(self.pos[1])), self.radius)
+            pygame.draw.circle(win, core_color, (cx, cy), ball_r)
 
     def move(self):
         """Updates velocity and position. Physics mode applies Magnus effect."""
@@ -129,8 +154,7 @@ class Ball(PhysicsObject):
         if self.mode == 'physics':
             # Trail only for physics mode
             self.trail.insert(0, (int(self.pos[0]), int(self.pos[1])))
-            if len(self.trail) > self.max_trail:
-                self.trail.pop()
+            del self.trail[self.max_trail:]
         self.move()
 
     def bounce_box(self, width, height):
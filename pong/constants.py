@@ -5,19 +5,22 @@ constants.py -- All game-wide settings and fixed values for PongWithIssues.
 import sys
 import numpy as np
 import pygame
-pygame.font.init()
+from pong import startup_profile
 
 # -------------------- Fonts --------------------
 
-# Digital fonts (custom)
-FONT_TINY_DIGITAL   = pygame.font.Font("pong/FONTS/digital-7.ttf", 14)
-FONT_SMALL_DIGITAL  = pygame.font.Font("pong/FONTS/digital-7.ttf", 20)
-FONT_MEDIUM_DIGITAL  = pygame.font.Font("pong/FONTS/digital-7.ttf", 30)
-FONT_DEFAULT_DIGITAL = pygame.font.Font("pong/FONTS/digital-7.ttf", 35)
-FONT_LARGE_DIGITAL  = pygame.font.Font("pong/FONTS/digital-7.ttf", 45)
-FONT_BIG_DIGITAL    = pygame.font.Font("pong/FONTS/digital-7.ttf", 65)
-FONT_TITLE_DIGITAL  = pygame.font.Font("pong/FONTS/digital-7.ttf", 80)
-ASCII_FONT = pygame.font.Font("pong/FONTS/LiberationMono-Bold.ttf", 24)
+with startup_profile.span('fonts'):
+    pygame.font.init()
+
+    # Digital fonts (custom)
+    FONT_TINY_DIGITAL   = pygame.font.Font("pong/FONTS/digital-7.ttf", 14)
+    FONT_SMALL_DIGITAL  = pygame.font.Font("pong/FONTS/digital-7.ttf", 20)
+    FONT_MEDIUM_DIGITAL  = pygame.font.Font("pong/FONTS/digital-7.ttf", 30)
+    FONT_DEFAULT_DIGITAL = pygame.font.Font("pong/FONTS/digital-7.ttf", 35)
+    FONT_LARGE_DIGITAL  = pygame.font.Font("pong/FONTS/digital-7.ttf", 45)
+    FONT_BIG_DIGITAL    = pygame.font.Font("pong/FONTS/digital-7.ttf", 65)
+    FONT_TITLE_DIGITAL  = pygame.font.Font("pong/FONTS/digital-7.ttf", 80)
+    ASCII_FONT = pygame.font.Font("pong/FONTS/LiberationMono-Bold.ttf", 24)
 
 # Larger score/mode fonts on web (Pygbag) for small-screen readability
 if sys.platform == "emscripten":
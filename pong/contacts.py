@@ -0,0 +1,422 @@
+"""
+contacts.py -- Unified ball/wall/paddle contact pipeline.
+
+One pass per frame gathers every contact for every ball, resolves it with
+the active mode's rule set, and returns a typed list of Contact records.
+Audio, juice and power-ups consume that list (see audio.play_contacts,
+JuiceManager.on_contacts, PowerUpManager.on_contacts) instead of each game
+loop guessing hits from velocity sign flips.
+
+Rule sets:
+    classic   Classic / Crazy / Sandbox: direction-gated paddles, clamped deflection
+    physics   Pongception: impulse + spin transfer, offset deflection
+    cursed    Cursed: closest-point hits from any side, velocity transfer, recoil
+    training  AI training Game: plain reflection, hit counting
+
+Multi-ball extras live in a BallBatch and go through resolve_batch_contacts,
+which applies the same rules to whole arrays at once.
+"""
+
+from abc import ABC, abstractmethod
+from enum import Enum
+
+import numpy as np
+from pong.constants import *
+
+CURSED_SPIN_FACTOR = 0.25
+
+
+class ContactKind(Enum):
+    # Values double as the sound names played for each kind
+    WALL = "wall_bounce"
+    PADDLE = "paddle_hit"
+
+
+class Contact:
+    """
+    A resolved ball contact.
+
+    kind: ContactKind.WALL or ContactKind.PADDLE
+    side: 'top'/'bottom' for walls, 'left'/'right' for paddles
+    x, y: contact point (paddle face / wall line at the ball)
+    speed: ball speed after the response
+    """
+    __slots__ = ('kind', 'side', 'ball', 'paddle', 'x', 'y', 'speed')
+
+    def __init__(self, kind, side, ball, x, y, paddle=None):
+        self.kind = kind
+        self.side = side
+        self.ball = ball
+        self.paddle = paddle
+        self.x = x
+        self.y = y
+        self.speed = float(np.hypot(ball.vel[0], ball.vel[1]))
+
+    @property
+    def is_paddle(self):
+        return self.kind is ContactKind.PADDLE
+
+    @property
+    def is_wall(self):
+        return self.kind is ContactKind.WALL
+
+    def __repr__(self):
+        return f"Contact({self.kind.name}, {self.side}, ({self.x:.1f}, {self.y:.1f}))"
+
+
+# -------------------- Rule sets --------------------
+
+class ContactRules(ABC):
+    """
+    Base rule set. Subclasses must implement how a ball responds to each
+    paddle (paddle() and paddle_batch()) and may override the top and
+    bottom wall response; the pipeline handles gathering and reporting.
+    """
+    name = "base"
+
+    def wall(self, ball, height):
+        """Resolve top/bottom walls. Returns 'top', 'bottom' or None."""
+        if ball.pos[1] - ball.radius <= 0:
+            ball.pos[1] = ball.radius
+            if ball.vel[1] < 0:
+                ball.vel[1] = -ball.vel[1]
+                return 'top'
+        elif ball.pos[1] + ball.radius >= height:
+            ball.pos[1] = height - ball.radius
+            if ball.vel[1] > 0:
+                ball.vel[1] = -ball.vel[1]
+                return 'bottom'
+        return None
+
+    @abstractmethod
+    def paddle(self, ball, paddle, side):
+        """Resolve one paddle. Returns True if the ball was hit."""
+
+    # Batch versions work on a BallBatch's arrays in place and return hit masks
+
+    def wall_batch(self, pos, vel, radius, height):
+        """Vectorized wall(). Returns (top, bottom) masks."""
+        top = pos[:, 1] - radius <= 0
+        bottom = ~top & (pos[:, 1] + radius >= height)
+        pos[top, 1] = radius[top]
+        pos[bottom, 1] = height - radius[bottom]
+        top &= vel[:, 1] < 0
+        bottom &= vel[:, 1] > 0
+        vel[top | bottom, 1] *= -1
+        return top, bottom
+
+    @abstractmethod
+    def paddle_batch(self, pos, vel, spin, radius, paddle, side):
+        """Vectorized paddle(). Returns the hit mask."""
+
+
+class ClassicRules(ContactRules):
+    """Classic Pong: bounce only toward the paddle, angle from hit offset."""
+    name = "classic"
+
+    def wall(self, ball, height):
+        # Classic never corrects position; it only turns the ball around
+        if ball.pos[1] - ball.radius <= 0 and ball.vel[1] < 0:
+            ball.vel[1] = -ball.vel[1]
+            return 'top'
+        if ball.pos[1] + ball.radius >= height and ball.vel[1] > 0:
+            ball.vel[1] = -ball.vel[1]
+            return 'bottom'
+        return None
+
+    def paddle(self, ball, paddle, side):
+        if side == 'left':
+            if ball.vel[0] >= 0 or ball.pos[0] - ball.radius > paddle.pos[0] + paddle.width:
+                return False
+        else:
+            if ball.vel[0] <= 0 or ball.pos[0] + ball.radius < paddle.pos[0]:
+                return False
+        if not (paddle.pos[1] <= ball.pos[1] <= paddle.pos[1] + paddle.height):
+            return False
+
+        ball.vel[0] *= -1
+        middle_y = paddle.pos[1] + paddle.height / 2
+        difference_in_y = middle_y - ball.pos[1]
+        reduction_factor = (paddle.height / 2) / abs(ball.vel[0])
+        y_vel = difference_in_y / reduction_factor
+        ball.vel[1] = max(-MAX_DEFLECTION_SPEED, min(MAX_DEFLECTION_SPEED, -y_vel))
+        return True
+
+    def wall_batch(self, pos, vel, radius, height):
+        top = (pos[:, 1] - radius <= 0) & (vel[:, 1] < 0)
+        bottom = (pos[:, 1] + radius >= height) & (vel[:, 1] > 0)
+        vel[top | bottom, 1] *= -1
+        return top, bottom
+
+    def paddle_batch(self, pos, vel, spin, radius, paddle, side):
+        hit = _facing_paddle(pos, vel, radius, paddle, side)
+        if hit.any():
+            vel[hit, 0] *= -1
+            half_h = paddle.height / 2
+            difference_in_y = paddle.pos[1] + half_h - pos[hit, 1]
+            y_vel = difference_in_y * np.abs(vel[hit, 0]) / half_h
+            vel[hit, 1] = np.clip(-y_vel, -MAX_DEFLECTION_SPEED, MAX_DEFLECTION_SPEED)
+        return hit
+
+
+class PhysicsRules(ContactRules):
+    """Pongception: impulse and spin transfer from the paddle."""
+    name = "physics"
+
+    def paddle(self, ball, paddle, side):
+        if side == 'left':
+            if ball.vel[0] >= 0 or ball.pos[0] - ball.radius > paddle.pos[0] + paddle.width:
+                return False
+        else:
+            if ball.vel[0] <= 0 or ball.pos[0] + ball.radius < paddle.pos[0]:
+                return False
+        if not (paddle.pos[1] <= ball.pos[1] <= paddle.pos[1] + paddle.height):
+            return False
+
+        # Y-direction impulse and spin transfer
+        relative_velocity = ball.vel[1] - paddle.vel[1]
+        impulse = 2 * ball.mass * relative_velocity
+        ball.apply_impulse([0, -impulse])
+        paddle.apply_impulse([0, -impulse * 0.1])
+        ball.spin = paddle.vel[1] * 0.5
+
+        # Angle deflection logic
+        middle_y = paddle.pos[1] + paddle.height / 2
+        normalized_offset = (ball.pos[1] - middle_y) / (paddle.height / 2)
+        ball.vel[1] = normalized_offset * MAX_DEFLECTION_SPEED + paddle.vel[1] * SPIN_FACTOR
+
+        ball.vel[0] = abs(ball.vel[0]) if side == 'left' else -abs(ball.vel[0])
+        return True
+
+    def paddle_batch(self, pos, vel, spin, radius, paddle, side):
+        hit = _facing_paddle(pos, vel, radius, paddle, side)
+        if hit.any():
+            # Every ball hitting this frame pushes the paddle; the ball's own
+            # y impulse is overwritten by the deflection below
+            impulse = 2 * (vel[hit, 1] - paddle.vel[1])
+            paddle.apply_impulse([0, -impulse.sum() * 0.1])
+            spin[hit] = paddle.vel[1] * 0.5
+            middle_y = paddle.pos[1] + paddle.height / 2
+            normalized_offset = (pos[hit, 1] - middle_y) / (paddle.height / 2)
+            vel[hit, 1] = normalized_offset * MAX_DEFLECTION_SPEED + paddle.vel[1] * SPIN_FACTOR
+            vel[hit, 0] = np.abs(vel[hit, 0]) if side == 'left' else -np.abs(vel[hit, 0])
+        return hit
+
+
+class CursedRules(ContactRules):
+    """
+    Cursed: either paddle can hit the ball from any side, charging paddles
+    fire it like a cannon, and the paddle recoils. Same paddle can hit
+    repeatedly.
+    """
+    name = "cursed"
+
+    def paddle(self, ball, paddle, side):
+        px, py = paddle.pos[0], paddle.pos[1]
+        pw, ph = paddle.width, paddle.height
+
+        # Closest point on the paddle rect to the ball centre
+        closest_x = max(px, min(ball.pos[0], px + pw))
+        closest_y = max(py, min(ball.pos[1], py + ph))
+        dx = ball.pos[0] - closest_x
+        dy = ball.pos[1] - closest_y
+        dist_sq = dx * dx + dy * dy
+        if dist_sq >= ball.radius * ball.radius:
+            return False
+
+        # Normal from paddle to ball; push the ball out
+        dist = max(dist_sq ** 0.5, 0.01)
+        nx = dx / dist
+        ny = dy / dist
+        overlap = ball.radius - dist
+        ball.pos[0] += nx * overlap
+        ball.pos[1] += ny * overlap
+
+        # Only bounce if the ball is moving INTO the paddle
+        rel_dot = (ball.vel[0] - paddle.vel[0]) * nx + (ball.vel[1] - paddle.vel[1]) * ny
+        if rel_dot >= 0:
+            return False
+
+        ball.vel[0] -= 2 * rel_dot * nx
+        ball.vel[1] -= 2 * rel_dot * ny
+
+        # Transfer 80% of paddle velocity to the ball (INSANE power)
+        if np.linalg.norm(paddle.vel) > 1.0:
+            ball.vel[0] += paddle.vel[0] * 0.8
+            ball.vel[1] += paddle.vel[1] * 0.4
+
+        ball.spin = paddle.vel[1] * CURSED_SPIN_FACTOR
+
+        # Angle deflection based on where the ball hit the paddle
+        if ph > 0:
+            ball.vel[1] += (ball.pos[1] - (py + ph / 2)) / (ph / 2) * 2.0
+
+        # Paddle recoil proportional to ball speed
+        recoil = np.linalg.norm(ball.vel) * 0.25
+        paddle.apply_impulse([-nx * recoil, -ny * recoil])
+        return True
+
+    def paddle_batch(self, pos, vel, spin, radius, paddle, side):
+        px, py = paddle.pos[0], paddle.pos[1]
+        pw, ph = paddle.width, paddle.height
+        d = pos - np.column_stack((np.clip(pos[:, 0], px, px + pw),
+                                   np.clip(pos[:, 1], py, py + ph)))
+        dist_sq = np.einsum('ij,ij->i', d, d)
+        touching = dist_sq < radius * radius
+        if not touching.any():
+            return touching
+
+        dist = np.maximum(np.sqrt(dist_sq[touching]), 0.01)
+        n = d[touching] / dist[:, None]
+        pos[touching] += n * (radius[touching] - dist)[:, None]
+
+        rel_dot = np.einsum('ij,ij->i', vel[touching] - paddle.vel, n)
+        into = rel_dot < 0
+        hit = np.zeros_like(touching)
+        hit[np.flatnonzero(touching)[into]] = True
+        if not into.any():
+            return hit
+
+        n = n[into]
+        v = vel[hit] - 2 * rel_dot[into, None] * n
+        if np.linalg.norm(paddle.vel) > 1.0:
+            v += paddle.vel * (0.8, 0.4)
+        if ph > 0:
+            v[:, 1] += (pos[hit, 1] - (py + ph / 2)) / (ph / 2) * 2.0
+        vel[hit] = v
+        spin[hit] = paddle.vel[1] * CURSED_SPIN_FACTOR
+
+        recoil = np.linalg.norm(v, axis=1) * 0.25
+        paddle.apply_impulse(-(n * recoil[:, None]).sum(axis=0))
+        return hit
+
+
+class TrainingRules(ContactRules):
+    """AI training Game: reflect with angle proportional to hit offset."""
+    name = "training"
+
+    def wall(self, ball, height):
+        if ball.pos[1] - ball.radius <= 0 and ball.vel[1] < 0:
+            ball.vel[1] = abs(ball.vel[1])
+            return 'top'
+        if ball.pos[1] + ball.radius >= height and ball.vel[1] > 0:
+            ball.vel[1] = -abs(ball.vel[1])
+            return 'bottom'
+        return None
+
+    def paddle(self, ball, paddle, side):
+        if side == 'left':
+            edge = ball.pos[0] - ball.radius
+            if ball.vel[0] >= 0:
+                return False
+        else:
+            edge = ball.pos[0] + ball.radius
+            if ball.vel[0] <= 0:
+                return False
+        if not (paddle.pos[0] <= edge <= paddle.pos[0] + paddle.width
+                and paddle.pos[1] <= ball.pos[1] <= paddle.pos[1] + paddle.height):
+            return False
+
+        ball.vel[0] = abs(ball.vel[0]) if side == 'left' else -abs(ball.vel[0])
+        mid = paddle.pos[1] + paddle.height / 2
+        ball.vel[1] = (ball.pos[1] - mid) / (paddle.height / 2) * abs(ball.vel[0])
+        return True
+
+    def paddle_batch(self, pos, vel, spin, radius, paddle, side):
+        if side == 'left':
+            edge = pos[:, 0] - radius
+            hit = vel[:, 0] < 0
+        else:
+            edge = pos[:, 0] + radius
+            hit = vel[:, 0] > 0
+        hit &= ((paddle.pos[0] <= edge) & (edge <= paddle.pos[0] + paddle.width)
+                & (paddle.pos[1] <= pos[:, 1]) & (pos[:, 1] <= paddle.pos[1] + paddle.height))
+        if hit.any():
+            speed_x = np.abs(vel[hit, 0])
+            vel[hit, 0] = speed_x if side == 'left' else -speed_x
+            mid = paddle.pos[1] + paddle.height / 2
+            vel[hit, 1] = (pos[hit, 1] - mid) / (paddle.height / 2) * speed_x
+        return hit
+
+
+def _facing_paddle(pos, vel, radius, paddle, side):
+    """Mask of balls moving toward `paddle` and overlapping its face (classic/physics)."""
+    in_y = (paddle.pos[1] <= pos[:, 1]) & (pos[:, 1] <= paddle.pos[1] + paddle.height)
+    if side == 'left':
+        return in_y & (vel[:, 0] < 0) & (pos[:, 0] - radius <= paddle.pos[0] + paddle.width)
+    return in_y & (vel[:, 0] > 0) & (pos[:, 0] + radius >= paddle.pos[0])
+
+
+RULES = {
+    rules.name: rules()
+    for rules in (ClassicRules, PhysicsRules, CursedRules, TrainingRules)
+}
+
+
+def get_rules(name):
+    """Look up a rule set by name ('classic', 'physics', 'cursed', 'training')."""
+    return RULES[name]
+
+
+# -------------------- Pipeline --------------------
+
+def resolve_contacts(balls, left_paddle, right_paddle, rules, height=None):
+    """
+    Resolve walls and paddles for every ball in one pass.
+
+    Args:
+        balls: a Ball or an iterable of balls (main ball + extra balls).
+        left_paddle, right_paddle: the two paddles.
+        rules: a ContactRules instance or a rule set name.
+        height: arena height (defaults to HEIGHT; Cursed passes its own).
+
+    Returns:
+        list[Contact] in resolution order.
+    """
+    if isinstance(rules, str):
+        rules = RULES[rules]
+    if hasattr(balls, 'pos'):
+        balls = (balls,)
+    H = height or HEIGHT
+    paddles = ((left_paddle, 'left'), (right_paddle, 'right'))
+    contacts = []
+
+    for ball in balls:
+        wall = rules.wall(ball, H)
+        if wall is not None:
+            wall_y = ball.radius if wall == 'top' else H - ball.radius
+            contacts.append(Contact(ContactKind.WALL, wall, ball, ball.pos[0], wall_y))
+
+        for paddle, side in paddles:
+            if rules.paddle(ball, paddle, side):
+                face_x = paddle.pos[0] + paddle.width if side == 'left' else paddle.pos[0]
+                contacts.append(Contact(ContactKind.PADDLE, side, ball,
+                                        face_x, ball.pos[1], paddle=paddle))
+    return contacts
+
+
+def resolve_batch_contacts(batch, left_paddle, right_paddle, rules, height=None):
+    """
+    Vectorized resolve_contacts() for a BallBatch (pong.multiball).
+
+    Returns:
+        dict of hit masks over the batch: 'top', 'bottom', 'left', 'right'.
+    """
+    if isinstance(rules, str):
+        rules = RULES[rules]
+    pos, vel, spin, radius = batch.pos, batch.vel, batch.spin, batch.radius
+    top, bottom = rules.wall_batch(pos, vel, radius, height or HEIGHT)
+    left = rules.paddle_batch(pos, vel, spin, radius, left_paddle, 'left')
+    right = rules.paddle_batch(pos, vel, spin, radius, right_paddle, 'right')
+    return {'top': top, 'bottom': bottom, 'left': left, 'right': right}
+
+
+def contacts_of(contacts, ball):
+    """Only the contacts made by `ball`."""
+    return [c for c in contacts if c.ball is ball]
+
+
+def paddle_hits(contacts, side=None):
+    """Paddle contacts, optionally only those on `side`."""
+    return [c for c in contacts
+            if c.kind is ContactKind.PADDLE and (side is None or c.side == side)]
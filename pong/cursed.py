@@ -9,6 +9,8 @@ import time
 import pygame
 import numpy as np
 from pong.constants import *
+from pong import frame_recorder, metrics
+from pong.render_cache import render_text
 
 
 # ---------------------------------------------------------------------------
@@ -104,8 +106,7 @@ class _Announcement:
             alpha = int(255 * (1.0 - (progress - 0.6) / 0.4))
             alpha = max(0, alpha)
 
-        font = FONT_BIG_DIGITAL
-        rendered = font.render(self.text, True, self.color)
+        rendered = render_text(FONT_BIG_DIGITAL, self.text, self.color)
         w = max(1, int(rendered.get_width() * scale))
         h = max(1, int(rendered.get_height() * scale))
         scaled = pygame.transform.smoothscale(rendered, (w, h))
@@ -189,6 +190,7 @@ class CursedEventManager:
         """Check if a named event is currently active."""
         return any(e.name == name for e in self.active_events)
 
+    @metrics.timed('cursed.update')
     def update(self, ball, left_paddle, right_paddle, pu_mgr=None):
         """
         Per-frame update. Decrements timer, triggers new events,
@@ -225,6 +227,7 @@ class CursedEventManager:
 
         # Remove dead announcements
         self.announcements = [a for a in self.announcements if a.alive()]
+        metrics.gauge('cursed.active_events', len(self.active_events))
 
     def _trigger_random(self, ball, left_paddle, right_paddle, pu_mgr):
         """Pick a random event and trigger it."""
@@ -240,6 +243,8 @@ class CursedEventManager:
         color = event_def['color']
 
         self.total_events_triggered += 1
+        metrics.count('cursed.triggered')
+        frame_recorder.note(name)
 
         # Announce
         self.announcements.append(_Announcement(name + "!", color))
@@ -382,7 +387,7 @@ class CursedEventManager:
 
             # Short label
             short = event.name[:3]
-            label = FONT_TINY_DIGITAL.render(short, True, color)
+            label = render_text(FONT_TINY_DIGITAL, short, color)
             surface.blit(label, (x, y))
             # Timer bar
             pygame.draw.rect(surface, DARK_GREY, (x, y + 16, bar_w, bar_h))
@@ -21,7 +21,9 @@ import time
 import pygame
 import numpy as np
 from pong.constants import *
-from pong import audio
+from pong import audio, frame_recorder, metrics
+from pong.particle_pool import ParticlePool
+from pong.render_cache import LRUCache
 
 
 # ---- Blood colors ----
@@ -124,158 +126,212 @@ def _point_near_path(px, py, path, threshold=15):
 # Blood Particle System
 # -----------------------------------------------------------------------
 
-class BloodParticle:
-    __slots__ = ('x', 'y', 'vx', 'vy', 'color', 'life', 'max_life',
-                 'size', 'splat', 'splat_size')
+_SLASH_COLORS = np.array([BLOOD_RED, BLOOD_DARK, BLOOD_BRIGHT, BLOOD_DRIP,
+                          (200, 0, 0), (160, 10, 10)], dtype=np.uint8)
+_DRIP_COLORS = np.array([BLOOD_RED, BLOOD_DARK, BLOOD_DRIP], dtype=np.uint8)
+_IMPACT_COLORS = np.array([BLOOD_RED, BLOOD_BRIGHT, (200, 30, 30)], dtype=np.uint8)
+_HIT_COLORS = np.array([BLOOD_RED, BLOOD_DARK, BLOOD_BRIGHT], dtype=np.uint8)
 
-    def __init__(self, x, y, vx, vy, color, life, size):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.size = size
-        self.splat = False
-        self.splat_size = 0
+
+def _pick(colors, count):
+    """`count` random rows of a colour table."""
+    return colors[np.random.randint(len(colors), size=count)]
 
 
 class BloodSystem:
-    """Gore particle system. Blood droplets fly, drip, and splat on surfaces."""
+    """Gore particle system. Blood droplets fly, drip, and splat on surfaces.
+
+    Droplets live in a ParticlePool, so a frame is one vectorized age /
+    integrate / floor-collision pass. Splats are permanent: each one is
+    painted once into a transparent decal strip along the floor, so drawing
+    every pool costs a single blit.
+    """
 
     MAX_PARTICLES = 500
     GRAVITY = 200  # heavier than normal particles
+    DECAL_BAND = 40  # height of the floor strip splats can land in
 
-    def __init__(self, screen_h=None):
-        self._particles = []
-        self._splats = []  # permanent blood pools on surfaces
+    def __init__(self, screen_h=None, screen_w=None):
+        self._pool = ParticlePool(capacity=self.MAX_PARTICLES)
+        self.max_particles = self.MAX_PARTICLES  # lowered by pong.quality
         self._last_time = time.monotonic()
         self._screen_h = screen_h or HEIGHT
+        self._screen_w = screen_w or WIDTH
+        self._decal_top = self._screen_h - self.DECAL_BAND
+        self._decal = pygame.Surface((self._screen_w, self.DECAL_BAND), pygame.SRCALPHA)
+        self._scaled_decal = None   # (scale, splat_count, surface)
+        self.splat_count = 0
+
+    def __len__(self):
+        return len(self._pool)
+
+    def _splat(self, idx, min_size, max_size):
+        """Bake permanent blood pools for the given particle indices into the decal layer."""
+        if not len(idx):
+            return
+        pool = self._pool
+        sizes = np.random.randint(min_size, max_size + 1, size=len(idx))
+        top = self._decal_top
+        for (x, y), color, size in zip(pool.pos[idx].astype(int).tolist(),
+                                       pool.color[idx].tolist(), sizes.tolist()):
+            pygame.draw.circle(self._decal, color, (x, y - top), size)
+        self.splat_count += len(idx)
 
     def emit_slash(self, x, y, direction_x, count=40):
         """Emit blood from a sword slash. direction_x: 1 or -1."""
-        colors = [BLOOD_RED, BLOOD_DARK, BLOOD_BRIGHT, BLOOD_DRIP,
-                  (200, 0, 0), (160, 10, 10)]
-        for _ in range(count):
-            angle = random.uniform(-1.2, 1.2)
-            spd = random.uniform(80, 350)
-            vx = math.cos(angle) * spd * direction_x
-            vy = math.sin(angle) * spd - random.uniform(50, 200)
-            color = random.choice(colors)
-            life = random.uniform(0.8, 2.5)
-            size = random.randint(2, 6)
-            self._particles.append(
-                BloodParticle(x, y, vx, vy, color, life, size))
+        metrics.count('blood.emitted', count)
+        angle = np.random.uniform(-1.2, 1.2, count)
+        spd = np.random.uniform(80, 350, count)
+        self._pool.add(x, y,
+                       np.cos(angle) * spd * direction_x,
+                       np.sin(angle) * spd - np.random.uniform(50, 200, count),
+                       _pick(_SLASH_COLORS, count),
+                       np.random.uniform(0.8, 2.5, count),
+                       np.random.randint(2, 7, count))
 
     def emit_drip(self, x, y, count=5):
         """Continuous drip from a bleeding paddle."""
-        for _ in range(count):
-            vx = random.uniform(-15, 15)
-            vy = random.uniform(20, 80)
-            color = random.choice([BLOOD_RED, BLOOD_DARK, BLOOD_DRIP])
-            life = random.uniform(1.0, 3.0)
-            size = random.randint(1, 3)
-            self._particles.append(
-                BloodParticle(x + random.uniform(-5, 5), y, vx, vy,
-                              color, life, size))
+        metrics.count('blood.emitted', count)
+        self._pool.add(x + np.random.uniform(-5, 5, count), y,
+                       np.random.uniform(-15, 15, count),
+                       np.random.uniform(20, 80, count),
+                       _pick(_DRIP_COLORS, count),
+                       np.random.uniform(1.0, 3.0, count),
+                       np.random.randint(1, 4, count))
 
     def emit_impact(self, x, y, count=20):
         """Blood burst from a high-speed paddle ram."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            spd = random.uniform(40, 200)
-            vx = math.cos(angle) * spd
-            vy = math.sin(angle) * spd
-            color = random.choice([BLOOD_RED, BLOOD_BRIGHT, (200, 30, 30)])
-            life = random.uniform(0.5, 1.5)
-            size = random.randint(2, 5)
-            self._particles.append(
-                BloodParticle(x, y, vx, vy, color, life, size))
+        metrics.count('blood.emitted', count)
+        angle = np.random.uniform(0, 2 * math.pi, count)
+        spd = np.random.uniform(40, 200, count)
+        self._pool.add(x, y, np.cos(angle) * spd, np.sin(angle) * spd,
+                       _pick(_IMPACT_COLORS, count),
+                       np.random.uniform(0.5, 1.5, count),
+                       np.random.randint(2, 6, count))
 
     def emit_hit(self, x, y, count=15):
         """Medium blood burst for a sword hit (not kill)."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            spd = random.uniform(30, 150)
-            vx = math.cos(angle) * spd
-            vy = math.sin(angle) * spd - random.uniform(20, 80)
-            color = random.choice([BLOOD_RED, BLOOD_DARK, BLOOD_BRIGHT])
-            life = random.uniform(0.5, 1.8)
-            size = random.randint(1, 4)
-            self._particles.append(
-                BloodParticle(x, y, vx, vy, color, life, size))
+        metrics.count('blood.emitted', count)
+        angle = np.random.uniform(0, 2 * math.pi, count)
+        spd = np.random.uniform(30, 150, count)
+        self._pool.add(x, y, np.cos(angle) * spd,
+                       np.sin(angle) * spd - np.random.uniform(20, 80, count),
+                       _pick(_HIT_COLORS, count),
+                       np.random.uniform(0.5, 1.8, count),
+                       np.random.randint(1, 5, count))
 
     def update(self):
         now = time.monotonic()
         dt = now - self._last_time
         self._last_time = now
-        if dt <= 0:
+        pool = self._pool
+        if dt <= 0 or not len(pool):
             return
 
         H = self._screen_h
-        grav = self.GRAVITY * dt
-        alive = []
-        for p in self._particles:
-            p.life -= dt
-            if p.life <= 0:
-                # Convert to permanent splat
-                if p.y >= H - 20 and not p.splat:
-                    self._splats.append(
-                        (int(p.x), int(p.y), p.color, random.randint(2, 5)))
-                continue
-            p.x += p.vx * dt
-            p.y += p.vy * dt
-            p.vy += grav
-
-            # Floor collision — splat and slow
-            if p.y >= H - 5:
-                p.y = H - 5
-                p.vy = -abs(p.vy) * 0.2
-                p.vx *= 0.5
-                if not p.splat:
-                    p.splat = True
-                    p.splat_size = random.randint(3, 7)
-                    self._splats.append(
-                        (int(p.x), int(p.y), p.color, p.splat_size))
-
-            alive.append(p)
+        n_before = len(pool)
+        # Expired droplets near the floor leave a small pool behind
+        dead = pool.age(dt)
+        if dead.any():
+            near_floor = dead & (pool.pos[:pool.n, 1] >= H - 20) & ~pool.landed[:pool.n]
+            self._splat(np.flatnonzero(near_floor), 2, 5)
+            pool.keep(~dead)
+
+        pool.integrate(dt, gravity=self.GRAVITY)
+
+        # Floor collision — splat (once per droplet) and slow
+        hit = pool.collide_floor(H - 5, bounce=0.2, friction=0.5)
+        landed = pool.landed[:pool.n]
+        new = np.flatnonzero(hit & ~landed)
+        landed[new] = True
+        self._splat(new, 3, 7)
 
         # Budget
-        overflow = len(alive) - self.MAX_PARTICLES
-        if overflow > 0:
-            del alive[:overflow]
-        self._particles = alive
-
-        # Limit permanent splats
-        if len(self._splats) > 300:
-            self._splats = self._splats[-200:]
-
-    def draw(self, surface):
-        # Draw permanent blood pools first (underneath)
-        for sx, sy, color, size in self._splats:
-            pygame.draw.circle(surface, color, (sx, sy), size)
-
-        # Draw active blood particles
-        for p in self._particles:
-            ratio = max(p.life / p.max_life, 0.0)
-            cur_size = max(int(p.size * ratio), 1)
-            # Elongate fast-moving particles (blood streaks)
-            speed = math.sqrt(p.vx * p.vx + p.vy * p.vy)
-            if speed > 100 and cur_size >= 2:
-                dx = p.vx / speed * cur_size * 2
-                dy = p.vy / speed * cur_size * 2
-                pygame.draw.line(surface, p.color,
-                                 (int(p.x - dx), int(p.y - dy)),
-                                 (int(p.x + dx), int(p.y + dy)),
-                                 max(cur_size - 1, 1))
-            else:
-                pygame.draw.circle(surface, p.color,
-                                   (int(p.x), int(p.y)), cur_size)
+        pool.trim(self.max_particles)
+        metrics.count('blood.culled', n_before - len(pool))
+        metrics.gauge('blood.droplets', len(pool))
+
+    def _decal_at(self, scale):
+        """The decal layer at `scale`, rescaled only when new splats landed."""
+        if scale == 1.0:
+            return self._decal
+        cached = self._scaled_decal
+        if cached is None or cached[0] != scale or cached[1] != self.splat_count:
+            size = (max(1, round(self._screen_w * scale)), max(1, round(self.DECAL_BAND * scale)))
+            cached = self._scaled_decal = (scale, self.splat_count,
+                                           pygame.transform.smoothscale(self._decal, size))
+        return cached[2]
+
+    def draw(self, surface, scale=1.0):
+        """Draw pools and droplets (scale shrinks them for an internal-resolution target)."""
+        # Permanent blood pools first (underneath)
+        if self.splat_count:
+            surface.blit(self._decal_at(scale), (0, round(self._decal_top * scale)))
+
+        # Active droplets; fast ones are elongated into streaks
+        self._pool.draw_streaks(surface, min_speed=100, stretch=2, min_size=2, width_delta=-1,
+                                scale=scale)
 
     def reset(self):
-        self._particles.clear()
-        self._splats.clear()
+        self._pool.clear()
+        self._decal.fill((0, 0, 0, 0))
+        self._scaled_decal = None
+        self.splat_count = 0
+
+
+# -----------------------------------------------------------------------
+# Lightsaber glow sprites
+# -----------------------------------------------------------------------
+
+SABER_ANGLE_STEPS = 180      # 2 degree buckets
+SABER_PROGRESS_STEPS = 20    # ignite animation frames
+SABER_ALPHA_STEPS = 4        # swing-speed glow levels across [0.7, 1.0]
+SABER_GLOW_CACHE_SIZE = 256
+_saber_glows = LRUCache(SABER_GLOW_CACHE_SIZE)
+
+
+def _saber_glow(color, angle, progress, alpha_mult):
+    """
+    Pre-rendered blade glow (outer glow, mid glow, core, tip hotspot).
+
+    The angle, ignite progress and swing-speed alpha are quantized so a
+    held or slowly swung saber reuses one sprite.
+
+    Returns:
+        (surface, (ox, oy)): blit at hilt position minus (ox, oy).
+    """
+    a_step = round(angle % (2 * math.pi) / (2 * math.pi) * SABER_ANGLE_STEPS) % SABER_ANGLE_STEPS
+    p_step = max(1, round(progress * SABER_PROGRESS_STEPS))
+    m_step = round((min(max(alpha_mult, 0.7), 1.0) - 0.7) / 0.3 * (SABER_ALPHA_STEPS - 1))
+    key = (tuple(color[:3]), a_step, p_step, m_step)
+    cached = _saber_glows.get(key)
+    if cached is not None:
+        return cached
+
+    angle = a_step / SABER_ANGLE_STEPS * 2 * math.pi
+    blade_len = SWORD_LENGTH * p_step / SABER_PROGRESS_STEPS
+    mult = 0.7 + 0.3 * m_step / (SABER_ALPHA_STEPS - 1)
+    dx, dy = math.cos(angle) * blade_len, math.sin(angle) * blade_len
+    pad = 12  # half the outer glow width, plus anti-aliasing
+    ox, oy = int(max(0, -dx)) + pad, int(max(0, -dy)) + pad
+    gs = pygame.Surface((int(abs(dx)) + pad * 2 + 1, int(abs(dy)) + pad * 2 + 1), pygame.SRCALPHA)
+    tip = (int(ox + dx), int(oy + dy))
+    pr, pg, pb = color[:3]
+
+    # Layer 1: Outer glow — thick, low alpha
+    pygame.draw.line(gs, (pr, pg, pb, int(30 * mult)), (ox, oy), tip, 20)
+    # Layer 2: Mid glow — medium
+    pygame.draw.line(gs, (pr, pg, pb, int(80 * mult)), (ox, oy), tip, 10)
+    # Layer 3: Core blade — white tinted with paddle color
+    core = (min(255, pr // 2 + 128), min(255, pg // 2 + 128), min(255, pb // 2 + 128), int(240 * mult))
+    pygame.draw.line(gs, core, (ox, oy), tip, 4)
+    # Layer 4: Tip hotspot — small bright circle
+    tip_color = (min(255, pr + 100), min(255, pg + 100), min(255, pb + 100), int(200 * mult))
+    pygame.draw.circle(gs, tip_color, tip, 5)
+
+    result = (gs, (ox, oy))
+    _saber_glows.put(key, result)
+    return result
 
 
 # -----------------------------------------------------------------------
@@ -304,10 +360,6 @@ class Sword:
         self.blocking = False
         self._swing_kicked = False
 
-        # Pre-allocate glow surface to avoid per-frame allocation
-        glow_size = int(SWORD_LENGTH * 2 + 60)
-        self._glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-
     def _base_angle(self):
         """Left paddle sword points RIGHT (0), right paddle points LEFT (pi)."""
         return 0.0 if self.is_left else math.pi
@@ -437,47 +489,14 @@ class Sword:
         cy = int(paddle.pos[1] + paddle.height / 2)
         final_angle = self._base_angle() + self.angle
 
-        blade_len = SWORD_LENGTH * self.ignite_progress
-        tip_x = cx + math.cos(final_angle) * blade_len
-        tip_y = cy + math.sin(final_angle) * blade_len
-
         # Swing speed intensifies glow
         speed_ratio = min(abs(self.angular_velocity) / 10.0, 1.0)
         base_alpha_mult = 0.7 + 0.3 * speed_ratio
 
-        pr, pg, pb = self.paddle_color[:3]
-
-        # Draw lightsaber glow layers on pre-allocated SRCALPHA surface
-        gs = self._glow_surf
-        gs.fill((0, 0, 0, 0))
-        gw, gh = gs.get_size()
-        gcx, gcy = gw // 2, gh // 2
-        local_tip_x = gcx + math.cos(final_angle) * blade_len
-        local_tip_y = gcy + math.sin(final_angle) * blade_len
-
-        # Layer 1: Outer glow — thick, low alpha
-        outer_alpha = int(30 * base_alpha_mult)
-        pygame.draw.line(gs, (pr, pg, pb, outer_alpha),
-                         (gcx, gcy), (int(local_tip_x), int(local_tip_y)), 20)
-
-        # Layer 2: Mid glow — medium
-        mid_alpha = int(80 * base_alpha_mult)
-        pygame.draw.line(gs, (pr, pg, pb, mid_alpha),
-                         (gcx, gcy), (int(local_tip_x), int(local_tip_y)), 10)
-
-        # Layer 3: Core blade — white tinted with paddle color
-        core_r = min(255, pr // 2 + 128)
-        core_g = min(255, pg // 2 + 128)
-        core_b = min(255, pb // 2 + 128)
-        core_alpha = int(240 * base_alpha_mult)
-        pygame.draw.line(gs, (core_r, core_g, core_b, core_alpha),
-                         (gcx, gcy), (int(local_tip_x), int(local_tip_y)), 4)
-
-        # Layer 4: Tip hotspot — small bright circle
-        tip_color = (min(255, pr + 100), min(255, pg + 100), min(255, pb + 100), int(200 * base_alpha_mult))
-        pygame.draw.circle(gs, tip_color, (int(local_tip_x), int(local_tip_y)), 5)
-
-        surface.blit(gs, (cx - gcx, cy - gcy))
+        # Lightsaber glow layers come from the sprite cache
+        glow, (ox, oy) = _saber_glow(self.paddle_color, final_angle,
+                                     self.ignite_progress, base_alpha_mult)
+        surface.blit(glow, (cx - ox, cy - oy))
 
         # Ignition sparks during animation
         if self.ignite_progress < 1.0 and self._ignite_dir > 0:
@@ -588,7 +607,7 @@ class CursedCombatManager:
     def __init__(self, left_color=None, right_color=None, screen_w=None, screen_h=None):
         self._screen_w = screen_w or WIDTH
         self._screen_h = screen_h or HEIGHT
-        self.blood = BloodSystem(screen_h=self._screen_h)
+        self.blood = BloodSystem(screen_h=self._screen_h, screen_w=self._screen_w)
         self._left_color = left_color
         self._right_color = right_color
         self.left_sword = Sword(is_left=True, paddle_color=left_color)
@@ -674,6 +693,7 @@ class CursedCombatManager:
         dist = math.sqrt((tx - ax) ** 2 + (ty - ay) ** 2)
 
         audio.play('lightning_strike')
+        frame_recorder.note('lightning')
 
         # Create bolt visual
         color = self._left_color if side == 'left' else self._right_color
@@ -803,6 +823,7 @@ class CursedCombatManager:
             # Check intersection with target paddle rect
             pr = pygame.Rect(int(target.pos[0]), int(target.pos[1]),
                              int(target.width), int(target.height))
+            metrics.count('combat.sword_tests')
             if pr.clipline(sx, sy, tx, ty):
                 sword.register_hit()
                 self._apply_damage(target, target_side, attacker)
@@ -819,6 +840,7 @@ class CursedCombatManager:
             return False
 
         (sx, sy), (tx, ty) = sword.get_hitbox(paddle)
+        metrics.count('combat.sword_tests')
 
         # Point-to-line-segment distance for ball center
         bx, by = ball.pos[0], ball.pos[1]
@@ -864,6 +886,7 @@ class CursedCombatManager:
 
     def _apply_cut(self, target, target_side, attacker):
         """Cut a paddle in half! Gore time."""
+        frame_recorder.note('paddle cut')
         mid_y = target.pos[1] + target.height / 2
 
         if target_side == 'left':
@@ -889,6 +912,7 @@ class CursedCombatManager:
 
     def check_paddle_collision(self, left_paddle, right_paddle):
         """Check if paddles are colliding (ramming)."""
+        metrics.count('combat.paddle_tests')
         lr = pygame.Rect(int(left_paddle.pos[0]), int(left_paddle.pos[1]),
                          int(left_paddle.width), int(left_paddle.height))
         rr = pygame.Rect(int(right_paddle.pos[0]), int(right_paddle.pos[1]),
@@ -917,6 +941,7 @@ class CursedCombatManager:
                     self.blood.emit_impact(impact_x, impact_y,
                                            count=int(rel_speed * 3))
 
+    @metrics.timed('combat.update')
     def update(self, left_paddle, right_paddle, ball):
         """Per-frame update."""
         dt = 1 / 60  # fixed timestep
@@ -980,13 +1005,25 @@ class CursedCombatManager:
 
         self.blood.update()
 
-    def draw(self, surface, left_paddle, right_paddle):
-        """Draw all combat visuals."""
-        W = self._screen_w
+    def draw(self, surface, left_paddle, right_paddle, scale=1.0, overlays=True):
+        """
+        Draw all combat visuals.
 
+        With an internal-resolution world target (scale < 1) only the blood
+        goes to `surface`; pass overlays=False and call draw_overlays() on
+        the window afterwards.
+        """
         # Blood (under everything)
-        self.blood.draw(surface)
-
+        self.blood.draw(surface, scale)
+        if overlays:
+            self.draw_overlays(surface, left_paddle, right_paddle)
+
+    def draw_overlays(self, surface, left_paddle, right_paddle):
+        """
+        Hands, sabers, damage, lightning, badges and grab text, at native
+        resolution. They are small or cached sprites attached to the paddles,
+        so they stay crisp over a scaled world.
+        """
         # Hands and swords for alive paddles
         if not self.left_cut:
             self.left_sword.draw_hands(surface, left_paddle, combat_mode=self.mode_left)
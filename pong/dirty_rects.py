@@ -0,0 +1,69 @@
+"""
+dirty_rects.py -- Dirty-rectangle display updates.
+
+The scene is still drawn in full to the window surface each frame (it starts
+with one cached court blit), but only the regions that changed are pushed to
+the display. Each frame the caller hands in the rects its moving entities
+occupy now; the renderer updates those plus the ones they occupied last
+frame, so vacated pixels are repainted too.
+
+Anything that touches the whole screen (shake, flash, pause overlay, score
+change) forces a full update for that frame.
+"""
+
+import pygame
+
+# Extra margin around each entity rect (anti-aliasing, overlays, timer bars)
+DIRTY_PAD = 4
+
+
+def circle_rect(pos, radius, pad=DIRTY_PAD):
+    """Bounding rect of a circle at pos."""
+    r = int(radius) + pad
+    return pygame.Rect(int(pos[0]) - r, int(pos[1]) - r, r * 2 + 1, r * 2 + 1)
+
+
+def paddle_rect(paddle, pad=DIRTY_PAD):
+    """Bounding rect of a paddle, padded for its effect overlays."""
+    return pygame.Rect(int(paddle.pos[0]) - pad, int(paddle.pos[1]) - pad,
+                       int(paddle.width) + pad * 2, int(paddle.height) + pad * 2)
+
+
+class DirtyRectRenderer:
+    """
+    Pushes only changed screen regions to the display.
+
+    Usage per frame:
+        renderer.present(rects, full=juice.needs_full_redraw or paused)
+
+    Call invalidate() after anything that changes pixels outside the tracked
+    rects (scores, footer text, menus); the next present() is a full update.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._prev = []
+        self._force_full = True
+        self._state = None
+        self.full_updates = 0
+        self.partial_updates = 0
+
+    def invalidate(self):
+        self._force_full = True
+
+    def watch(self, *state):
+        """Invalidate when any of the given values differ from last frame."""
+        if state != self._state:
+            self._state = state
+            self._force_full = True
+
+    def present(self, rects, full=False):
+        """Update the display: the union of this and last frame's rects, or everything."""
+        if not self.enabled or full or self._force_full:
+            pygame.display.update()
+            self._force_full = False
+            self.full_updates += 1
+        else:
+            pygame.display.update(self._prev + rects)
+            self.partial_updates += 1
+        self._prev = rects
@@ -2,175 +2,162 @@
 force_effects.py -- Visual effects for Force Push and Force Pull abilities.
 
 Shockwave arcs, speed-line particles, and converging/expanding ring effects.
-Uses __slots__ particles for performance (same pattern as BloodParticle).
+Particles share the ParticlePool kernel with the blood system; shockwaves
+are a small NumPy record array, so both update in a few vectorized steps.
 """
 
 import math
-import random
 import pygame
 import numpy as np
+from pong.particle_pool import ParticlePool
 
+# One row per live shockwave (expanding or contracting arc)
+SHOCKWAVE_DTYPE = np.dtype([
+    ('x', 'f8'), ('y', 'f8'), ('angle', 'f8'), ('arc_half', 'f8'),
+    ('radius', 'f8'), ('max_radius', 'f8'), ('life', 'f8'), ('max_life', 'f8'),
+    ('color', 'u1', 3), ('expanding', '?'), ('width', 'i4'),
+])
 
-class ForceParticle:
-    __slots__ = ('x', 'y', 'vx', 'vy', 'color', 'life', 'max_life', 'size')
 
-    def __init__(self, x, y, vx, vy, color, life, size):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.size = size
-
-
-class Shockwave:
-    """Expanding or contracting arc effect."""
-    __slots__ = ('x', 'y', 'angle', 'arc_half', 'radius', 'max_radius',
-                 'life', 'max_life', 'color', 'expanding', 'width')
-
-    def __init__(self, x, y, angle, arc_half, max_radius, life, color, expanding=True, width=4):
-        self.x = x
-        self.y = y
-        self.angle = angle
-        self.arc_half = arc_half
-        self.radius = 10.0 if expanding else max_radius
-        self.max_radius = max_radius
-        self.life = life
-        self.max_life = life
-        self.color = color
-        self.expanding = expanding
-        self.width = width
+def _shockwave(x, y, angle, arc_half, max_radius, life, color, expanding=True, width=4):
+    """A one-row shockwave record."""
+    return np.array([(x, y, angle, arc_half, 10.0 if expanding else max_radius, max_radius,
+                      life, life, color, expanding, width)], dtype=SHOCKWAVE_DTYPE)
 
 
 class ForceEffectSystem:
     """Manages Force Push/Pull visual effects: shockwaves + particles."""
 
     MAX_PARTICLES = 150
+    DRAG = 0.95  # per-update velocity damping of speed lines
 
     def __init__(self):
-        self._particles = []
-        self._shockwaves = []
+        self._pool = ParticlePool(capacity=self.MAX_PARTICLES)
+        self.max_particles = self.MAX_PARTICLES  # lowered by pong.quality
+        self.shockwave_alpha = True  # False: draw arcs opaque, straight to the target
+        self._shockwaves = np.zeros(0, dtype=SHOCKWAVE_DTYPE)
         self._glow_surf = pygame.Surface((60, 60), pygame.SRCALPHA)
+        self._scratch = None
+
+    def __len__(self):
+        return len(self._pool)
 
     def emit_push(self, x, y, angle, color, push_range=250):
         """Expanding shockwave arc + speed-line particles in cone direction."""
         bright = _brighten(color)
-        self._shockwaves.append(
-            Shockwave(x, y, angle, math.radians(30), push_range * 0.8,
-                      life=0.3, color=bright, expanding=True, width=5))
+        self._shockwaves = np.concatenate((self._shockwaves, _shockwave(
+            x, y, angle, math.radians(30), push_range * 0.8,
+            life=0.3, color=bright, expanding=True, width=5)))
 
         # Speed-line particles outward
-        for _ in range(18):
-            a = angle + random.uniform(-0.5, 0.5)
-            spd = random.uniform(300, 600)
-            vx = math.cos(a) * spd
-            vy = math.sin(a) * spd
-            life = random.uniform(0.15, 0.35)
-            size = random.randint(1, 3)
-            self._particles.append(
-                ForceParticle(x, y, vx, vy, bright, life, size))
+        n = 18
+        a = angle + np.random.uniform(-0.5, 0.5, n)
+        spd = np.random.uniform(300, 600, n)
+        self._pool.add(x, y, np.cos(a) * spd, np.sin(a) * spd, bright,
+                       np.random.uniform(0.15, 0.35, n), np.random.randint(1, 4, n))
 
     def emit_pull(self, x, y, angle, color, pull_range=300):
         """Contracting ring + converging particles from range boundary inward."""
         bright = _brighten(color)
-        self._shockwaves.append(
-            Shockwave(x, y, angle, math.radians(35), pull_range * 0.7,
-                      life=0.35, color=bright, expanding=False, width=4))
+        self._shockwaves = np.concatenate((self._shockwaves, _shockwave(
+            x, y, angle, math.radians(35), pull_range * 0.7,
+            life=0.35, color=bright, expanding=False, width=4)))
 
         # Converging particles from range boundary toward origin
-        for _ in range(15):
-            a = angle + random.uniform(-0.5, 0.5)
-            start_dist = pull_range * random.uniform(0.5, 1.0)
-            px = x + math.cos(a) * start_dist
-            py = y + math.sin(a) * start_dist
-            spd = random.uniform(250, 500)
-            vx = math.cos(a + math.pi) * spd
-            vy = math.sin(a + math.pi) * spd
-            life = random.uniform(0.2, 0.4)
-            size = random.randint(1, 3)
-            self._particles.append(
-                ForceParticle(px, py, vx, vy, bright, life, size))
+        n = 15
+        a = angle + np.random.uniform(-0.5, 0.5, n)
+        start_dist = pull_range * np.random.uniform(0.5, 1.0, n)
+        spd = np.random.uniform(250, 500, n)
+        self._pool.add(x + np.cos(a) * start_dist, y + np.sin(a) * start_dist,
+                       np.cos(a + math.pi) * spd, np.sin(a + math.pi) * spd, bright,
+                       np.random.uniform(0.2, 0.4, n), np.random.randint(1, 4, n))
 
     def update(self, dt):
-        # Update shockwaves
-        alive_sw = []
-        for sw in self._shockwaves:
-            sw.life -= dt
-            if sw.life <= 0:
-                continue
-            if sw.expanding:
-                progress = 1.0 - sw.life / sw.max_life
-                sw.radius = 10.0 + (sw.max_radius - 10.0) * progress
-            else:
-                progress = 1.0 - sw.life / sw.max_life
-                sw.radius = sw.max_radius * (1.0 - progress)
-            alive_sw.append(sw)
-        self._shockwaves = alive_sw
+        # Update shockwaves: radius is a function of remaining life
+        sw = self._shockwaves
+        if len(sw):
+            sw['life'] -= dt
+            sw = sw[sw['life'] > 0]
+            progress = 1.0 - sw['life'] / sw['max_life']
+            sw['radius'] = np.where(sw['expanding'],
+                                    10.0 + (sw['max_radius'] - 10.0) * progress,
+                                    sw['max_radius'] * (1.0 - progress))
+            self._shockwaves = sw
 
         # Update particles
-        alive = []
-        for p in self._particles:
-            p.life -= dt
-            if p.life <= 0:
-                continue
-            p.x += p.vx * dt
-            p.y += p.vy * dt
-            # Slow down
-            p.vx *= 0.95
-            p.vy *= 0.95
-            alive.append(p)
-
-        if len(alive) > self.MAX_PARTICLES:
-            alive = alive[-self.MAX_PARTICLES:]
-        self._particles = alive
-
-    def draw(self, surface):
-        # Draw shockwaves as arcs on SRCALPHA surface
-        for sw in self._shockwaves:
-            alpha_ratio = sw.life / sw.max_life
-            r, g, b = sw.color
+        pool = self._pool
+        if len(pool):
+            pool.keep(~pool.age(dt))
+            pool.integrate(dt, drag=self.DRAG)
+            pool.trim(self.max_particles)
+
+    def _scratch_for(self, size):
+        """Reusable SRCALPHA scratch surface of at least size x size."""
+        if self._scratch is None or self._scratch.get_width() < size:
+            self._scratch = pygame.Surface((size, size), pygame.SRCALPHA)
+        return self._scratch
+
+    def draw(self, surface, scale=1.0):
+        """Draw shockwaves and particles (scale shrinks them for an internal-resolution target)."""
+        # Draw shockwaves as arcs: each is drawn into the shared scratch
+        # surface and only the arc's bounding box is cleared and blitted
+        for x, y, angle, arc_half, radius, max_radius, life, max_life, color, _, width in \
+                self._shockwaves.tolist():
+            alpha_ratio = life / max_life
+            r, g, b = color.tolist()
             alpha = int(180 * alpha_ratio)
-            radius = max(5, int(sw.radius))
-            rect = pygame.Rect(int(sw.x) - radius, int(sw.y) - radius,
-                               radius * 2, radius * 2)
-            start_angle = sw.angle - sw.arc_half
-            stop_angle = sw.angle + sw.arc_half
-
-            # Draw arc with alpha using a temporary surface
-            arc_size = radius * 2 + 20
-            if arc_size < 4:
+            if scale != 1.0:
+                x, y, radius, max_radius = x * scale, y * scale, radius * scale, max_radius * scale
+                width = max(1, round(width * scale))
+            radius = max(5, int(radius))
+            start_angle = angle - arc_half
+            stop_angle = angle + arc_half
+
+            if not self.shockwave_alpha:
+                # Low detail: fade by darkening the colour instead of alpha blending
+                pygame.draw.arc(surface, (r * alpha // 255, g * alpha // 255, b * alpha // 255),
+                                pygame.Rect(int(x) - radius, int(y) - radius, radius * 2, radius * 2),
+                                start_angle, stop_angle, width)
                 continue
-            temp = pygame.Surface((arc_size, arc_size), pygame.SRCALPHA)
+
+            scratch = self._scratch_for(max(radius, int(max_radius)) * 2 + 20)
             local_rect = pygame.Rect(10, 10, radius * 2, radius * 2)
-            arc_color = (r, g, b, alpha)
-            pygame.draw.arc(temp, arc_color, local_rect,
-                            start_angle, stop_angle, sw.width)
-            surface.blit(temp, (int(sw.x) - radius - 10,
-                                int(sw.y) - radius - 10))
+            area = _arc_bounds(local_rect.center, radius, start_angle, stop_angle, width)
+            scratch.fill((0, 0, 0, 0), area)
+            pygame.draw.arc(scratch, (r, g, b, alpha), local_rect,
+                            start_angle, stop_angle, width)
+            surface.blit(scratch, (int(x) - radius - 10 + area.x,
+                                   int(y) - radius - 10 + area.y), area)
 
         # Draw particles as streaks
-        for p in self._particles:
-            ratio = max(p.life / p.max_life, 0.0)
-            cur_size = max(1, int(p.size * ratio))
-            r, g, b = p.color
-            alpha = int(220 * ratio)
-            speed = math.sqrt(p.vx * p.vx + p.vy * p.vy)
-            if speed > 50 and cur_size >= 1:
-                dx = p.vx / speed * cur_size * 3
-                dy = p.vy / speed * cur_size * 3
-                pygame.draw.line(surface, (r, g, b),
-                                 (int(p.x - dx), int(p.y - dy)),
-                                 (int(p.x + dx), int(p.y + dy)),
-                                 max(cur_size, 1))
-            else:
-                pygame.draw.circle(surface, (r, g, b),
-                                   (int(p.x), int(p.y)), cur_size)
+        self._pool.draw_streaks(surface, min_speed=50, stretch=3, scale=scale)
 
     def reset(self):
-        self._particles.clear()
-        self._shockwaves.clear()
+        self._pool.clear()
+        self._shockwaves = self._shockwaves[:0]
+
+
+def _arc_bounds(center, radius, start, stop, width, pad=2):
+    """
+    Bounding rect of a pygame.draw.arc band (angles counter-clockwise, y up;
+    the band grows inward from radius by width).
+    """
+    cx, cy = center
+    angles = [start, stop]
+    # Axis extremes the arc sweeps through
+    k = math.ceil(start / (math.pi / 2))
+    while k * math.pi / 2 < stop:
+        angles.append(k * math.pi / 2)
+        k += 1
+    inner = max(radius - width, 0)
+    xs, ys = [], []
+    for a in angles:
+        c, s = math.cos(a), -math.sin(a)
+        xs += (radius * c, inner * c)
+        ys += (radius * s, inner * s)
+    left, top = int(cx + min(xs)) - pad, int(cy + min(ys)) - pad
+    right, bottom = int(cx + max(xs)) + pad, int(cy + max(ys)) + pad
+    return pygame.Rect(left, top, right - left + 1, bottom - top + 1)
 
 
 def _brighten(color):
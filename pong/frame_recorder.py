@@ -0,0 +1,172 @@
+"""
+frame_recorder.py -- Ring-buffer frame log with CSV/JSON export.
+
+While recording, the FrameProfiler hands every finished frame to the
+recorder: frame time, per-phase times and entity counts (juice particles,
+blood droplets, force particles, extra balls, active cursed events).
+Gameplay code calls note() when something notable happens (a lightning
+strike, a cursed event such as BALL SPLIT, a charged push); notes are
+attached to the frame they happened in. Frames slower than JANK_FACTOR
+times the frame budget are flagged, so a stutter can be lined up with the
+effects that fired just before it.
+
+Like audio, the recorder is a module-level singleton: recording carries on
+across mode switches, and is dumped when stopped (F4 in any mode) or when
+the process exits. Output goes to recordings/ in the project root.
+"""
+
+import atexit
+import csv
+import json
+import os
+import time
+import numpy as np
+from pong.constants import FPS
+
+RECORD_FRAMES = 1800         # ring size (30 s at 60 FPS)
+JANK_FACTOR = 1.5            # frames longer than this many budgets are flagged
+COUNTERS = ('particles', 'blood', 'force', 'extra_balls', 'cursed_events')
+RECORDINGS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'recordings')
+
+
+class FrameRecorder:
+    """
+    Fixed-size log of the most recent RECORD_FRAMES frames.
+
+    Args:
+        phases: phase names, in the order of the rows passed to record().
+        capacity: frames kept; older frames are overwritten.
+        fps: target frame rate (sets the budget for jank flags).
+    """
+
+    def __init__(self, phases, capacity=RECORD_FRAMES, fps=FPS):
+        self.phases = tuple(phases)
+        self.capacity = capacity
+        self.budget_ms = 1000.0 / fps
+        self._frame = np.zeros(capacity, dtype=np.int64)
+        self._frame_ms = np.zeros(capacity)
+        self._phase_ms = np.zeros((capacity, len(self.phases)))
+        self._counts = np.zeros((capacity, len(COUNTERS)), dtype=np.int32)
+        self._notes = [()] * capacity
+        self._pending = []
+        self._head = 0
+        self._count = 0
+        self.frames_seen = 0
+
+    def __len__(self):
+        return self._count
+
+    def note(self, event):
+        """Attach `event` to the frame being recorded now."""
+        self._pending.append(event)
+
+    def record(self, frame_ms, phase_ms, counts=None):
+        """Store one finished frame (counts: {counter name: value})."""
+        i = self._head
+        self._frame[i] = self.frames_seen
+        self._frame_ms[i] = frame_ms
+        self._phase_ms[i] = phase_ms
+        row = self._counts[i]
+        row[:] = 0
+        if counts:
+            for j, name in enumerate(COUNTERS):
+                row[j] = counts.get(name, 0)
+        self._notes[i] = tuple(self._pending)
+        self._pending.clear()
+        self._head = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.frames_seen += 1
+
+    # -------------------- Export --------------------
+
+    def _order(self):
+        if self._count < self.capacity:
+            return np.arange(self._count)
+        return np.roll(np.arange(self.capacity), -self._head)
+
+    def rows(self):
+        """Recorded frames oldest first, as dicts."""
+        rows = []
+        for i in self._order().tolist():
+            frame_ms = float(self._frame_ms[i])
+            row = {'frame': int(self._frame[i]), 'frame_ms': round(frame_ms, 3),
+                   'jank': frame_ms > self.budget_ms * JANK_FACTOR}
+            row.update({f'{name}_ms': round(float(ms), 3)
+                        for name, ms in zip(self.phases, self._phase_ms[i].tolist())})
+            row.update(zip(COUNTERS, self._counts[i].tolist()))
+            row['tags'] = list(self._notes[i])
+            rows.append(row)
+        return rows
+
+    def jank_frames(self):
+        """Rows flagged as jank."""
+        return [row for row in self.rows() if row['jank']]
+
+    def dump(self, path=None):
+        """
+        Write the buffer to `path` (.csv or .json by extension).
+
+        Returns:
+            The path written. Defaults to recordings/frames-<timestamp>.json.
+        """
+        if path is None:
+            os.makedirs(RECORDINGS_DIR, exist_ok=True)
+            path = os.path.join(RECORDINGS_DIR, time.strftime('frames-%Y%m%d-%H%M%S.json'))
+        rows = self.rows()
+        if path.endswith('.csv'):
+            fields = (['frame', 'frame_ms', 'jank'] + [f'{name}_ms' for name in self.phases]
+                      + list(COUNTERS) + ['tags'])
+            with open(path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                for row in rows:
+                    writer.writerow({**row, 'tags': ';'.join(row['tags'])})
+        else:
+            with open(path, 'w') as f:
+                json.dump({'fps': FPS, 'budget_ms': self.budget_ms, 'jank_factor': JANK_FACTOR,
+                           'phases': list(self.phases), 'counters': list(COUNTERS),
+                           'frames': rows}, f, indent=1)
+        return path
+
+
+# -------------------- Module-level recorder --------------------
+
+_active = None
+
+
+def recording():
+    """The active FrameRecorder, or None."""
+    return _active
+
+
+def start(phases, capacity=RECORD_FRAMES):
+    """Start a fresh recording (replaces any active one without dumping it)."""
+    global _active
+    _active = FrameRecorder(phases, capacity)
+    return _active
+
+
+def stop(path=None, save=True):
+    """
+    Stop recording and dump the buffer (unless save is False).
+
+    Returns:
+        The path written, or None if nothing was written.
+    """
+    global _active
+    rec, _active = _active, None
+    if rec is None or not len(rec) or not save:
+        return None
+    try:
+        return rec.dump(path)
+    except OSError:
+        return None
+
+
+def note(event):
+    """Tag the current frame with a gameplay event (no-op unless recording)."""
+    if _active is not None:
+        _active.note(event)
+
+
+atexit.register(stop)
@@ -0,0 +1,83 @@
+"""
+frame_scheduler.py -- Frame pacing shared by every game and menu loop.
+
+Loops end each frame with
+
+    await frame_scheduler.next_frame()            # animating: FPS
+    await frame_scheduler.next_frame(idle=True)   # static screen: IDLE_FPS
+
+which sleeps until the frame's deadline and then yields to the event loop.
+Deadlines advance by a fixed period from the previous deadline, not from
+when the frame finished, so oversleeping one frame shortens the next
+instead of drifting the rate. A frame that is already late runs at once
+and restarts the cadence from now (no burst of catch-up frames).
+
+On desktop the wait is a plain time.sleep(): nothing else runs on the
+event loop, and it is far more precise than the event loop's timers (which
+are rounded to the millisecond, or to the ~15 ms system tick on Windows).
+Under Pygbag the browser paces frames: an animating frame just yields
+(one frame per requestAnimationFrame) and an idle frame awaits the
+remaining time, so the page stays responsive either way.
+
+clock.tick(FPS) stays in the loops for frame times; after a paced frame it
+finds the budget already spent and returns without sleeping. That also
+means the scheduler's sleep lands inside clock.get_rawtime(), so it is not
+a measure of frame work: time the work with a span that closes before
+next_frame(), as QualityGovernor.begin()/end() do (the FrameProfiler
+charges the wait to its 'idle' phase).
+"""
+
+import asyncio
+import sys
+import time
+from pong.constants import FPS
+
+IDLE_FPS = 20                # static screens (dialogs, win screen, sub-menus)
+IS_WEB = sys.platform == "emscripten"
+
+
+class FrameScheduler:
+    """
+    Sleeps each frame until its deadline.
+
+    Args:
+        fps: frame rate while animating.
+        idle_fps: frame rate for next_frame(idle=True).
+    """
+
+    def __init__(self, fps=FPS, idle_fps=IDLE_FPS):
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self._deadline = None
+
+    def reset(self):
+        """Forget the cadence; the next frame runs immediately."""
+        self._deadline = None
+
+    async def next_frame(self, idle=False):
+        """Wait for the next frame deadline, then yield to the event loop."""
+        period = 1.0 / (self.idle_fps if idle else self.fps)
+        now = time.perf_counter()
+        if self._deadline is None:
+            self._deadline = now
+        self._deadline += period
+        remaining = self._deadline - now
+        if remaining <= 0:
+            # Late: run now and restart the cadence from here
+            self._deadline = now
+            await asyncio.sleep(0)
+        elif IS_WEB:
+            await asyncio.sleep(remaining if idle else 0)
+        else:
+            time.sleep(remaining)
+            await asyncio.sleep(0)
+
+
+# -------------------- Shared scheduler --------------------
+
+_scheduler = FrameScheduler()
+
+
+async def next_frame(idle=False):
+    """Pace the calling loop with the shared scheduler."""
+    await _scheduler.next_frame(idle)
@@ -3,10 +3,11 @@ game_flow.py -- Shared game flow UI: countdown, pause menu, win/lose screen.
 Used by all game modes to provide consistent, interactive game state transitions.
 """
 
-import asyncio
 import pygame
 import sys
 from pong.constants import *
+from pong.render_cache import dim_overlay
+from pong import frame_scheduler
 
 IS_WEB = sys.platform == "emscripten"
 
@@ -33,9 +34,7 @@ async def countdown(win, bg_draw_fn, duration=3):
         bg_draw_fn()
 
         # Dark overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 120))
-        win.blit(overlay, (0, 0))
+        win.blit(dim_overlay(120, (WIDTH, HEIGHT)), (0, 0))
 
         # Number
         text = FONT_TITLE_DIGITAL.render(str(i), True, WHITE)
@@ -57,13 +56,11 @@ async def countdown(win, bg_draw_fn, duration=3):
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return 'quit'
-            await asyncio.sleep(0)
+            await frame_scheduler.next_frame()
 
     # "GO!" frame
     bg_draw_fn()
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 80))
-    win.blit(overlay, (0, 0))
+    win.blit(dim_overlay(80, (WIDTH, HEIGHT)), (0, 0))
 
     go_text = FONT_TITLE_DIGITAL.render("GO!", True, GREEN)
     win.blit(go_text, (WIDTH // 2 - go_text.get_width() // 2,
@@ -82,7 +79,7 @@ async def countdown(win, bg_draw_fn, duration=3):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return 'quit'
-        await asyncio.sleep(0)
+        await frame_scheduler.next_frame()
 
     return 'start'
 
@@ -135,9 +132,7 @@ class PauseMenu:
     def draw(self, win):
         """Draw pause menu overlay."""
         # Dark overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        win.blit(overlay, (0, 0))
+        win.blit(dim_overlay(160, (WIDTH, HEIGHT)), (0, 0))
 
         # Title
         title = self.font_title.render("PAUSED", True, PURPLE)
@@ -222,9 +217,7 @@ class WinScreen:
             bg_color: background color
         """
         # Dark overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        win.blit(overlay, (0, 0))
+        win.blit(dim_overlay(180, (WIDTH, HEIGHT)), (0, 0))
 
         # Winner text
         title = self.font_title.render(winner_text, True, PURPLE)
@@ -311,9 +304,7 @@ async def confirm_exit(win, bg_draw_fn, touch=None):
         bg_draw_fn()
 
         # Dark overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 170))
-        win.blit(overlay, (0, 0))
+        win.blit(dim_overlay(170, (WIDTH, HEIGHT)), (0, 0))
 
         # Dialog box
         box_w, box_h = 320, 140
@@ -345,4 +336,4 @@ async def confirm_exit(win, bg_draw_fn, touch=None):
         win.blit(hint, (WIDTH // 2 - hint.get_width() // 2, box_y + box_h + 10))
 
         pygame.display.update()
-        await asyncio.sleep(0)
+        await frame_scheduler.next_frame(idle=True)
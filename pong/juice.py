@@ -10,7 +10,10 @@ import math
 import random
 import time
 
+import numpy as np
 import pygame
+from pong.render_cache import render_text
+from pong import metrics
 
 
 # ---------------------------------------------------------------------------
@@ -54,6 +57,10 @@ class ScreenShake:
             self._active = False
             self._magnitude = 0.0
 
+    @property
+    def active(self):
+        return self._active and self._magnitude > 0.0
+
     def get_offset(self):
         if not self._active or self._magnitude <= 0.0:
             return (0, 0)
@@ -102,6 +109,10 @@ class FlashEffect:
         progress = elapsed / self._duration if self._duration > 0 else 1.0
         self._alpha = int(self._max_alpha * (1.0 - progress))
 
+    @property
+    def active(self):
+        return self._active and self._alpha > 0
+
     def draw(self, surface):
         if not self._active or self._alpha <= 0:
             return
@@ -114,90 +125,154 @@ class FlashEffect:
 # Particle System
 # ---------------------------------------------------------------------------
 
-_MAX_PARTICLES = 200
+_MAX_PARTICLES = 2000
 _GRAVITY = 60  # pixels / s^2 (gentle downward pull)
-
-
-class Particle:
-    """Lightweight particle with position, velocity, colour, life, and size."""
-
-    __slots__ = ("x", "y", "vx", "vy", "r", "g", "b", "life", "max_life", "size")
-
-    def __init__(self, x, y, vx, vy, color, life, size):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.r, self.g, self.b = color
-        self.life = life
-        self.max_life = life
-        self.size = size
+_ATLAS_MAX_SIZE = 8      # largest particle radius in the atlas (bigger ones are clamped)
+_ATLAS_ALPHA_LEVELS = 16  # alpha steps per atlas column
+_ATLAS_CELL = _ATLAS_MAX_SIZE * 2 + 2
+
+
+def _build_atlas(color):
+    """
+    Pre-rendered alpha circles for one colour.
+
+    Column = radius (1.._ATLAS_MAX_SIZE), row = alpha level; each circle sits
+    centred in a _ATLAS_CELL square cell.
+    """
+    atlas = pygame.Surface((_ATLAS_CELL * _ATLAS_MAX_SIZE,
+                            _ATLAS_CELL * _ATLAS_ALPHA_LEVELS), pygame.SRCALPHA)
+    metrics.count('render.surfaces_built')
+    c = _ATLAS_CELL // 2
+    for row in range(_ATLAS_ALPHA_LEVELS):
+        alpha = 255 * (row + 1) // _ATLAS_ALPHA_LEVELS
+        for col in range(_ATLAS_MAX_SIZE):
+            pygame.draw.circle(atlas, (*color, alpha),
+                               (col * _ATLAS_CELL + c, row * _ATLAS_CELL + c), col + 1)
+    return atlas
 
 
 class ParticleSystem:
-    """Manages a pool of lightweight particles."""
+    """
+    Fixed-capacity particle pool stored as NumPy arrays.
 
-    def __init__(self, enabled=True):
+    Slots are handed out from a free-list; when it runs dry the oldest live
+    particles are recycled. Update is vectorized and draw is a single
+    blits() call sourcing from per-colour pre-rendered alpha-circle atlases.
+    """
+
+    def __init__(self, enabled=True, capacity=_MAX_PARTICLES):
         self.enabled = enabled
-        self._particles: list[Particle] = []
+        self.capacity = capacity
+        self.budget = capacity  # live-particle limit, <= capacity
+        self._pos = np.zeros((capacity, 2))
+        self._vel = np.zeros((capacity, 2))
+        self._life = np.zeros(capacity)
+        self._max_life = np.ones(capacity)
+        self._size = np.zeros(capacity, dtype=np.int32)
+        self._color = np.zeros(capacity, dtype=np.int32)   # index into _palette
+        self._born = np.zeros(capacity, dtype=np.int64)    # emit order, for recycling
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._free = list(range(capacity - 1, -1, -1))     # free-list (stack)
+        self._serial = 0
+        self._palette = {}   # colour -> palette index
+        self._atlases = []   # palette index -> atlas Surface
         self._last_time = time.monotonic()
 
+    def __len__(self):
+        return self.capacity - len(self._free)
+
+    def _color_index(self, color):
+        color = tuple(int(v) for v in color[:3])
+        idx = self._palette.get(color)
+        if idx is None:
+            idx = len(self._atlases)
+            self._palette[color] = idx
+            self._atlases.append(_build_atlas(color))
+        return idx
+
+    def _take(self, count):
+        """Claim `count` slots: free ones (up to the budget) first, then the oldest live ones."""
+        count = min(count, self.budget)
+        n_free = max(0, min(count, len(self._free), self.budget - len(self)))
+        slots = [self._free.pop() for _ in range(n_free)]
+        if n_free < count:
+            metrics.count('particles.recycled', count - n_free)
+            live = np.flatnonzero(self._alive)
+            oldest = live[np.argpartition(self._born[live], count - n_free - 1)[:count - n_free]]
+            slots.extend(oldest.tolist())
+        return np.array(slots, dtype=np.intp)
+
     def emit(self, x, y, count=10, color=(255, 255, 255), speed=3,
              spread=360, life=0.5, size=3):
-        if not self.enabled:
+        if not self.enabled or count <= 0 or self.budget <= 0:
             return
+        idx = self._take(count)
+        k = len(idx)
+        metrics.count('particles.emitted', k)
         half_spread = spread / 2.0
-        base_angle = 0.0 if spread >= 360 else 0.0
-        for _ in range(count):
-            angle_deg = random.uniform(base_angle - half_spread,
-                                       base_angle + half_spread)
-            angle = math.radians(angle_deg)
-            spd = speed * random.uniform(0.5, 1.5)
-            vx = math.cos(angle) * spd * 60  # convert to px/s
-            vy = math.sin(angle) * spd * 60
-            p = Particle(x, y, vx, vy, color, life, size)
-            self._particles.append(p)
-        # Drop oldest if over budget
-        overflow = len(self._particles) - _MAX_PARTICLES
-        if overflow > 0:
-            del self._particles[:overflow]
+        angle = np.radians(np.random.uniform(-half_spread, half_spread, k))
+        spd = speed * np.random.uniform(0.5, 1.5, k) * 60  # convert to px/s
+        self._pos[idx] = (x, y)
+        self._vel[idx, 0] = np.cos(angle) * spd
+        self._vel[idx, 1] = np.sin(angle) * spd
+        self._life[idx] = life
+        self._max_life[idx] = life
+        self._size[idx] = size
+        self._color[idx] = self._color_index(color)
+        self._born[idx] = np.arange(self._serial, self._serial + k)
+        self._serial += k
+        self._alive[idx] = True
 
     def update(self):
         now = time.monotonic()
         dt = now - self._last_time
         self._last_time = now
-        if dt <= 0 or not self._particles:
+        if dt <= 0 or len(self._free) == self.capacity:
             return
-        alive = []
-        grav = _GRAVITY * dt
-        for p in self._particles:
-            p.life -= dt
-            if p.life <= 0:
-                continue
-            p.x += p.vx * dt
-            p.y += p.vy * dt
-            p.vy += grav
-            alive.append(p)
-        self._particles = alive
-
-    def draw(self, surface):
-        for p in self._particles:
-            ratio = max(p.life / p.max_life, 0.0)
-            alpha = int(255 * ratio)
-            cur_size = max(int(p.size * ratio), 1)
-            color = (p.r, p.g, p.b, alpha)
-            # Fast path: fully opaque — just draw directly
-            if alpha >= 250:
-                pygame.draw.circle(surface, (p.r, p.g, p.b),
-                                   (int(p.x), int(p.y)), cur_size)
-            else:
-                # Minimal temp surface for alpha blending
-                d = cur_size * 2 + 2
-                tmp = pygame.Surface((d, d), pygame.SRCALPHA)
-                pygame.draw.circle(tmp, color, (cur_size + 1, cur_size + 1),
-                                   cur_size)
-                surface.blit(tmp, (int(p.x) - cur_size - 1,
-                                   int(p.y) - cur_size - 1))
+        idx = np.flatnonzero(self._alive)
+        self._life[idx] -= dt
+        dead = idx[self._life[idx] <= 0]
+        if len(dead):
+            metrics.count('particles.culled', len(dead))
+            self._alive[dead] = False
+            self._free.extend(dead.tolist())
+            idx = np.flatnonzero(self._alive)
+        self._pos[idx] += self._vel[idx] * dt
+        self._vel[idx, 1] += _GRAVITY * dt
+
+    def clear(self):
+        self._alive[:] = False
+        self._free = list(range(self.capacity - 1, -1, -1))
+
+    def bounds(self):
+        """Rect covering every live particle, or None."""
+        idx = np.flatnonzero(self._alive)
+        if not len(idx):
+            return None
+        pos = self._pos[idx]
+        pad = int(self._size[idx].max()) + 2
+        left, top = (pos.min(axis=0)).astype(int) - pad
+        right, bottom = (pos.max(axis=0)).astype(int) + pad
+        return pygame.Rect(left, top, right - left + 1, bottom - top + 1)
+
+    def draw(self, surface, scale=1.0):
+        idx = np.flatnonzero(self._alive)
+        if not len(idx):
+            return
+        ratio = np.clip(self._life[idx] / self._max_life[idx], 0.0, 1.0)
+        radius = np.clip((self._size[idx] * ratio * scale).astype(int), 1, _ATLAS_MAX_SIZE)
+        row = np.clip(np.ceil(ratio * _ATLAS_ALPHA_LEVELS).astype(int) - 1,
+                      0, _ATLAS_ALPHA_LEVELS - 1)
+        half = _ATLAS_CELL // 2
+        xs = ((self._pos[idx, 0] * scale).astype(int) - half).tolist()
+        ys = ((self._pos[idx, 1] * scale).astype(int) - half).tolist()
+        ax = ((radius - 1) * _ATLAS_CELL).tolist()
+        ay = (row * _ATLAS_CELL).tolist()
+        colors = self._color[idx].tolist()
+        cell = _ATLAS_CELL
+        atlases = self._atlases
+        surface.blits([(atlases[c], (x, y), (u, v, cell, cell))
+                       for c, x, y, u, v in zip(colors, xs, ys, ax, ay)], doreturn=False)
 
 
 # ---------------------------------------------------------------------------
@@ -255,9 +330,13 @@ class ScorePop:
             e.update()
         self._entries = [e for e in self._entries if e.alive()]
 
+    @property
+    def active(self):
+        return bool(self._entries)
+
     def draw(self, surface):
         for e in self._entries:
-            rendered = e.font.render(e.text, True, e.color)
+            rendered = render_text(e.font, e.text, e.color)
             if abs(e.scale - 1.0) < 0.01:
                 # No scaling needed
                 rect = rendered.get_rect(center=(e.x, e.y))
@@ -294,11 +373,18 @@ class JuiceManager:
         self.shake.set_intensity(shake_map.get(settings.screen_shake, "subtle"))
         self._particles_enabled = settings.particles_enabled
 
+    def set_particle_scale(self, scale):
+        """Scale the particle budget (pong.quality); 0 turns particles off."""
+        p = self.particles
+        p.budget = int(p.capacity * max(0.0, min(scale, 1.0)))
+        self._particles_enabled = p.budget > 0
+
     def update(self):
         self.shake.update()
         self.flash.update()
         self.particles.update()
         self.score_pop.update()
+        metrics.gauge('juice.particles', len(self.particles))
 
     def draw(self, surface):
         """Draw flash overlay, particles, and score pops.
@@ -306,10 +392,28 @@ class JuiceManager:
         Screen shake offset is NOT applied here — the caller should use
         ``shake.get_offset()`` to offset their own blit position.
         """
+        self.draw_world(surface)
+        self.draw_hud(surface)
+
+    def draw_world(self, surface, scale=1.0):
+        """Flash and particles, which may go to an internal-resolution world target."""
         self.flash.draw(surface)
-        self.particles.draw(surface)
+        self.particles.draw(surface, scale)
+
+    def draw_hud(self, surface):
+        """Score pops, always at native resolution."""
         self.score_pop.draw(surface)
 
+    @property
+    def needs_full_redraw(self):
+        """True while an effect touches the whole screen (shake, flash, score pop)."""
+        return self.shake.active or self.flash.active or self.score_pop.active
+
+    def dirty_rects(self):
+        """Screen regions the local effects (particles) drew into this frame."""
+        r = self.particles.bounds()
+        return [r] if r else []
+
     # -- high-level event triggers --
 
     def on_paddle_hit(self, x, y, color):
@@ -341,3 +445,11 @@ class JuiceManager:
         if self._particles_enabled:
             self.particles.emit(x, y, count=4, color=(255, 255, 255), speed=2,
                                 spread=180, life=0.3, size=2)
+
+    def on_contacts(self, contacts, left_color, right_color):
+        """Trigger wall/paddle effects for a frame's contact list (pong.contacts)."""
+        for c in contacts:
+            if c.is_paddle:
+                self.on_paddle_hit(c.x, c.y, left_color if c.side == 'left' else right_color)
+            else:
+                self.on_wall_bounce(c.x, c.y)
@@ -0,0 +1,198 @@
+"""
+memory_tracker.py -- Allocation, Surface and GC panel for the Sandbox.
+
+Allocation churn in draw paths is the usual cause of micro-stutter: a frame
+that builds Surfaces or temporary arrays leaves work for the allocator and,
+sooner or later, a garbage collection pause. The MemoryTracker (off until
+toggled) runs tracemalloc and reports, per frame:
+
+  - transient growth: how far traced memory rose above the frame's starting
+    point (tracemalloc peak, reset every frame) and the net change
+  - the call sites whose live allocations grew most over the last
+    SNAPSHOT_INTERVAL frames (tracemalloc snapshot diff)
+  - Surfaces held by the render caches and how many were built per frame
+  - GC collections per generation and their pause times (gc.callbacks)
+
+tracemalloc slows every allocation down, so frame times measured with the
+panel open are not representative; compare relative numbers only.
+"""
+
+import gc
+import os
+import time
+import tracemalloc
+from collections import deque
+import pygame
+from pong.constants import *
+from pong.render_cache import surface_counts
+
+TRACE_FRAMES = 1             # traceback depth: the allocating line only
+SNAPSHOT_INTERVAL = 30       # frames between call-site snapshots
+TOP_SITES = 5
+AVERAGE_FRAMES = 30          # window for per-frame averages
+TEXT_REFRESH = 15            # frames between panel text refreshes
+MEMORY_KEY = pygame.K_t
+
+_IGNORED = (tracemalloc.__file__, __file__, '<frozen importlib._bootstrap>',
+            '<frozen importlib._bootstrap_external>', '<unknown>')
+
+
+def _kb(n):
+    return f"{n / 1024:+.1f} KB"
+
+
+class MemoryTracker:
+    """
+    tracemalloc + gc instrumentation for one game session.
+
+    Usage per frame:
+        tracker.frame(particles=len(juice.particles))   # after clock.tick()
+        tracker.draw(WIN, (10, 150))
+    Call stop() when leaving the mode.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._started_tracing = False
+        self._reset()
+
+    def _reset(self):
+        self._frames = 0
+        self._last_current = None
+        self._peak_growth = deque(maxlen=AVERAGE_FRAMES)
+        self._net = deque(maxlen=AVERAGE_FRAMES)
+        self._snapshot = None
+        self._top = []
+        self._built = None
+        self._built_per_frame = deque(maxlen=AVERAGE_FRAMES)
+        self._counts = {}
+        self._gc_start = None
+        self._gc_collections = [0, 0, 0]
+        self._gc_pauses = deque(maxlen=AVERAGE_FRAMES)
+        self._gc_last_ms = 0.0
+        self._gc_max_ms = 0.0
+        self._surfaces = {}
+        self._lines = []
+
+    # -------------------- Control --------------------
+
+    def toggle(self):
+        if self.enabled:
+            self.stop()
+        else:
+            self.start()
+
+    def start(self):
+        if self.enabled:
+            return
+        self._reset()
+        # Leave tracing alone if someone else (e.g. python -X tracemalloc) owns it
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            self._started_tracing = True
+        gc.callbacks.append(self._on_gc)
+        self.enabled = True
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._snapshot = None
+
+    def handle_event(self, event):
+        """Toggle on T. Returns True if the event was consumed."""
+        if event.type == pygame.KEYDOWN and event.key == MEMORY_KEY:
+            self.toggle()
+            return True
+        return False
+
+    # -------------------- Sampling --------------------
+
+    def _on_gc(self, phase, info):
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            ms = (time.perf_counter() - self._gc_start) * 1000.0
+            self._gc_start = None
+            self._gc_collections[info['generation']] += 1
+            self._gc_last_ms = ms
+            self._gc_max_ms = max(self._gc_max_ms, ms)
+            self._gc_pauses.append(ms)
+
+    def frame(self, **counts):
+        """Close the previous frame's allocation window (call once per frame)."""
+        if not self.enabled:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        if self._last_current is not None:
+            self._peak_growth.append(max(0, peak - self._last_current))
+            self._net.append(current - self._last_current)
+        tracemalloc.reset_peak()
+        self._last_current = current
+
+        surfaces = surface_counts()
+        built = sum(b for _, b in surfaces.values())
+        if self._built is not None:
+            self._built_per_frame.append(built - self._built)
+        self._built = built
+        self._surfaces = {name: live for name, (live, _) in surfaces.items()}
+        self._counts = counts
+
+        self._frames += 1
+        if self._frames % SNAPSHOT_INTERVAL == 0:
+            self._take_snapshot()
+        if self._frames % TEXT_REFRESH == 0:
+            self._refresh_lines()
+        # The tracker's own work should not count towards the next frame
+        self._last_current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def _take_snapshot(self):
+        snap = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, name) for name in _IGNORED])
+        if self._snapshot is not None:
+            stats = snap.compare_to(self._snapshot, 'lineno')
+            self._top = [s for s in stats if s.size_diff > 0][:TOP_SITES]
+        self._snapshot = snap
+
+    # -------------------- Panel --------------------
+
+    def _refresh_lines(self):
+        def avg(values):
+            return sum(values) / len(values) if values else 0.0
+
+        current = tracemalloc.get_traced_memory()[0]
+        gen_counts = ' '.join(f'g{i}:{n}' for i, n in enumerate(self._gc_collections))
+        surfaces = ' '.join(f'{k} {v}' for k, v in self._surfaces.items())
+        counts = ' '.join(f'{k} {v}' for k, v in self._counts.items())
+        lines = [
+            (f"MEM traced {current / 1048576:.1f} MB  "
+             f"peak/frame {_kb(avg(self._peak_growth))}  net/frame {_kb(avg(self._net))}", YELLOW),
+            (f"GC {gen_counts}  pause last {self._gc_last_ms:.2f} ms  "
+             f"max {self._gc_max_ms:.2f} ms", YELLOW),
+            (f"Surfaces {surfaces}  built/frame {avg(self._built_per_frame):.2f}", YELLOW),
+        ]
+        if counts:
+            lines.append((f"Live {counts}", YELLOW))
+        lines.append((f"Top growth (last {SNAPSHOT_INTERVAL} frames):", GREY))
+        for stat in self._top:
+            frame = stat.traceback[0]
+            lines.append((f"  {os.path.basename(frame.filename)}:{frame.lineno}  "
+                          f"{_kb(stat.size_diff)}  {stat.count_diff:+d} blocks", GREY))
+        # Rendered directly (not via render_text) so the panel's changing
+        # numbers don't churn the text cache it is reporting on
+        self._lines = [FONT_TINY_DIGITAL.render(text, True, color) for text, color in lines]
+
+    def draw(self, win, pos):
+        """Draw the panel with its top-left corner at pos (no-op when disabled)."""
+        if not self.enabled:
+            return
+        x, y = pos
+        for surf in self._lines:
+            win.blit(surf, (x, y))
+            y += 16
@@ -0,0 +1,176 @@
+"""
+metrics.py -- Hot-path counters, gauges and timers for game subsystems.
+
+Subsystems report what they did instead of printing debug output:
+
+    metrics.count('ai.predictions')            # counter, += n
+    metrics.gauge('juice.particles', n)        # last value wins
+    with metrics.timer('cursed.update'): ...   # accumulated milliseconds
+
+    @metrics.timed('powerups.update')          # same, for a whole method
+    def update(self, ball): ...
+
+Readers (the F3 profiler overlay, benchmarks/scenarios.py) take two
+snapshots and turn the difference into per-frame rates with per_frame();
+the FrameProfiler closes each frame with end_frame().
+
+Like frame_recorder, the registry is a module-level singleton. Disabled
+(the default) every call is a None check and a return. This module only
+imports the standard library, so low-level modules can use it freely.
+"""
+
+import functools
+import time
+from collections import defaultdict
+
+
+class Registry:
+    """Cumulative counters and timer totals, plus the latest gauge values."""
+
+    def __init__(self):
+        self.frames = 0
+        self.counters = defaultdict(float)
+        self.timers = defaultdict(float)     # name -> total ms
+        self.gauges = {}
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def gauge(self, name, value):
+        self.gauges[name] = value
+
+    def add_time(self, name, ms):
+        self.timers[name] += ms
+
+    def end_frame(self):
+        self.frames += 1
+
+    def reset(self):
+        self.frames = 0
+        self.counters.clear()
+        self.timers.clear()
+        self.gauges.clear()
+
+    def snapshot(self):
+        """Copy of the current totals (see per_frame())."""
+        return {'frames': self.frames, 'counters': dict(self.counters),
+                'timers': dict(self.timers), 'gauges': dict(self.gauges)}
+
+
+class _Timer:
+    """Context manager adding its elapsed time to a registry timer."""
+
+    __slots__ = ('_name', '_t0')
+
+    def __init__(self, name):
+        self._name = name
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if _active is not None:
+            _active.add_time(self._name, (time.perf_counter() - self._t0) * 1000.0)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def per_frame(before, after):
+    """
+    Per-frame rates between two snapshots.
+
+    Returns:
+        {name: value} with counters as per-frame means, timers as mean
+        ms per frame (key '<name> ms') and gauges as their latest value.
+        Empty if no frame ended in between.
+    """
+    frames = after['frames'] - before['frames']
+    if frames <= 0:
+        return {}
+    rates = {}
+    for name, total in after['counters'].items():
+        rates[name] = (total - before['counters'].get(name, 0)) / frames
+    for name, total in after['timers'].items():
+        rates[f'{name} ms'] = (total - before['timers'].get(name, 0.0)) / frames
+    rates.update(after['gauges'])
+    return dict(sorted(rates.items()))
+
+
+# -------------------- Module-level registry --------------------
+
+_active = None
+
+
+def registry():
+    """The active Registry, or None while disabled."""
+    return _active
+
+
+def enabled():
+    return _active is not None
+
+
+def enable():
+    """Start collecting (keeps the current registry if already enabled)."""
+    global _active
+    if _active is None:
+        _active = Registry()
+    return _active
+
+
+def disable():
+    global _active
+    _active = None
+
+
+def count(name, n=1):
+    if _active is not None:
+        _active.count(name, n)
+
+
+def gauge(name, value):
+    if _active is not None:
+        _active.gauge(name, value)
+
+
+def timer(name):
+    """Context manager timing its block into `name` (shared no-op when disabled)."""
+    if _active is None:
+        return _NULL_TIMER
+    return _Timer(name)
+
+
+def timed(name):
+    """Decorator: time every call of the function into `name`."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return fn(*args, **kwargs)
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                if _active is not None:
+                    _active.add_time(name, (time.perf_counter() - t0) * 1000.0)
+        return wrapper
+    return decorate
+
+
+def end_frame():
+    """Close a frame (called by the FrameProfiler)."""
+    if _active is not None:
+        _active.end_frame()
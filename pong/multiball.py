@@ -0,0 +1,228 @@
+"""
+multiball.py -- Structure-of-arrays storage for multi-ball extras.
+
+Extra balls from the MULTI_BALL power-up used to be full Ball objects, each
+moved and collided with its own Python calls. A BallBatch keeps them in flat
+NumPy arrays so a frame is one vectorized move, one contact pass
+(contacts.resolve_batch_contacts) and one cull, which is what lets the chaos
+setting put hundreds of balls on the field.
+"""
+
+import math
+import pygame
+import numpy as np
+from pong.constants import *
+from pong.ball import Ball, FIRE_COLORS, ALL_FIRE_COLORS
+from pong.render_cache import circle_sprite
+from pong.contacts import resolve_batch_contacts
+
+# Trail samples kept per ball (Ball.max_trail)
+BATCH_TRAIL = 10
+# Up to this many physics balls are drawn with the full Ball effects;
+# above it they use cached sprites and a shorter trail
+BATCH_DETAIL_LIMIT = 8
+BATCH_FAST_TRAIL = 4
+
+class BallBatch:
+    """
+    A batch of extra balls stored as parallel arrays.
+
+    len() and truthiness behave like the old list of balls; per-ball work
+    goes through the array methods instead of iteration.
+    """
+
+    def __init__(self, mode='classic', color=POWERUP_COLOR_MULTI, capacity=16):
+        self.mode = mode
+        self.color = color
+        self.n = 0
+        self._alloc(capacity)
+        # Ring buffer of past positions, newest at self._head
+        self._head = 0
+        self._detail_ball = None
+
+    def _alloc(self, capacity):
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.spin = np.zeros(capacity)
+        self.radius = np.zeros(capacity)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.trail = np.zeros((capacity, BATCH_TRAIL, 2))
+
+    def _grow(self, needed):
+        cap = len(self.spin)
+        if needed <= cap:
+            return
+        old = (self.pos, self.vel, self.spin, self.radius, self.age, self.trail)
+        self._alloc(max(needed, cap * 2))
+        for new, arr in zip((self.pos, self.vel, self.spin, self.radius, self.age, self.trail), old):
+            new[:self.n] = arr[:self.n]
+
+    def __len__(self):
+        return self.n
+
+    def __bool__(self):
+        return self.n > 0
+
+    def views(self):
+        """(pos, vel, spin, radius) views of the live balls."""
+        n = self.n
+        return self.pos[:n], self.vel[:n], self.spin[:n], self.radius[:n]
+
+    def add(self, x, y, vx, vy, radius):
+        """Append balls; x, y, vx, vy may be scalars or arrays."""
+        vx, vy = np.atleast_1d(vx), np.atleast_1d(vy)
+        k = max(len(vx), len(vy))
+        self._grow(self.n + k)
+        s = slice(self.n, self.n + k)
+        self.pos[s, 0], self.pos[s, 1] = x, y
+        self.vel[s, 0], self.vel[s, 1] = vx, vy
+        self.spin[s] = 0.0
+        self.radius[s] = radius
+        self.age[s] = 0
+        self.n += k
+
+    def clear(self):
+        self.n = 0
+
+    def keep(self, mask):
+        """Drop every ball where mask is False (stable order)."""
+        idx = np.flatnonzero(mask)
+        k = len(idx)
+        if k == self.n:
+            return
+        for arr in (self.pos, self.vel, self.spin, self.radius, self.age, self.trail):
+            arr[:k] = arr[idx]
+        self.n = k
+
+    # -------------------- Simulation --------------------
+
+    def move(self):
+        """Ball.update() for every ball: record trail, Magnus, integrate."""
+        pos, vel, spin, _ = self.views()
+        if self.mode == 'physics':
+            self._head = (self._head - 1) % BATCH_TRAIL
+            self.trail[:self.n, self._head] = np.floor(pos)
+            self.age[:self.n] += 1
+            vel[:, 1] += spin * 0.1
+        pos += vel
+
+    def step(self, left_paddle, right_paddle, rules, height=None, width=None):
+        """
+        Move, collide and cull the whole batch.
+
+        Balls that leave the field horizontally are removed.
+
+        Returns:
+            Hit masks from resolve_batch_contacts (over the pre-cull batch).
+        """
+        if not self.n:
+            return None
+        self.move()
+        hits = resolve_batch_contacts(self, left_paddle, right_paddle, rules, height)
+        self.cull(width)
+        return hits
+
+    def cull(self, width=None):
+        """Remove balls that left the field past either goal line."""
+        W = width or WIDTH
+        x = self.pos[:self.n, 0]
+        r = self.radius[:self.n]
+        self.keep((x >= -r) & (x <= W + r))
+
+    def touching_rect(self, rect):
+        """Mask of balls overlapping a pygame.Rect (circle-rect test)."""
+        pos, _, _, radius = self.views()
+        cx = np.clip(pos[:, 0], rect.left, rect.right)
+        cy = np.clip(pos[:, 1], rect.top, rect.bottom)
+        return (pos[:, 0] - cx) ** 2 + (pos[:, 1] - cy) ** 2 <= radius * radius
+
+    # -------------------- Drawing --------------------
+
+    def draw(self, win, scale=1.0):
+        """Draw every ball; scale shrinks positions and sizes for an internal-resolution target."""
+        if not self.n:
+            return
+        if self.mode == 'classic':
+            color = self.color
+            for x, y, r in zip((self.pos[:self.n, 0] * scale).astype(int),
+                               (self.pos[:self.n, 1] * scale).astype(int),
+                               np.maximum(1, (self.radius[:self.n] * scale).astype(int))):
+                pygame.draw.circle(win, color, (x, y), r)
+        elif self.n <= BATCH_DETAIL_LIMIT:
+            self._draw_detailed(win, scale)
+        else:
+            self._draw_fast(win, scale)
+
+    def _trail_of(self, i, length):
+        """Trail points for ball i, newest first."""
+        k = min(int(self.age[i]), length)
+        order = (self._head + np.arange(k)) % BATCH_TRAIL
+        return self.trail[i, order]
+
+    def _draw_detailed(self, win, scale=1.0):
+        """Draw through one reusable Ball so a few extras look exactly like the main ball."""
+        ball = self._detail_ball
+        if ball is None:
+            ball = self._detail_ball = Ball(0, 0, 1, self.color, mode='physics')
+        for i in range(self.n):
+            ball.pos[:] = self.pos[i]
+            ball.vel[:] = self.vel[i]
+            ball.spin = self.spin[i]
+            ball.radius = int(self.radius[i])
+            ball.trail = [tuple(p) for p in self._trail_of(i, BATCH_TRAIL).astype(int)]
+            ball.draw(win, scale)
+
+    def _draw_fast(self, win, scale=1.0):
+        """Cached-sprite trail and aura, short trail, no spin arcs."""
+        n, k = self.n, BATCH_FAST_TRAIL
+        r = np.maximum(1, (self.radius[:n] * scale).astype(int))
+        x = (self.pos[:n, 0] * scale).astype(int)
+        y = (self.pos[:n, 1] * scale).astype(int)
+
+        # Trail: (n, k) grids of sample index, radius and validity
+        order = (self._head + np.arange(k)) % BATCH_TRAIL
+        pts = (self.trail[:n, order] * scale).astype(int)
+        lens = np.minimum(self.age[:n], k)
+        j = np.broadcast_to(np.arange(k), (n, k))
+        last = np.maximum(lens - 1, 1)[:, None]
+        tr = np.maximum(2, (r[:, None] * (1 - j / last * 0.8)).astype(int))
+        valid = j < lens[:, None]
+
+        sprites = {}
+        for key in set(zip(tr[valid].tolist(), j[valid].tolist())):
+            t, jj = key
+            sprites[key] = circle_sprite(t, ALL_FIRE_COLORS[jj], max(35, 140 - jj * 18))
+        blits = [(sprites[(t, jj)], (px - t, py - t))
+                 for t, jj, px, py in zip(tr[valid].tolist(), j[valid].tolist(),
+                                          pts[valid][:, 0].tolist(), pts[valid][:, 1].tolist())]
+
+        # One aura layer for fast balls
+        speed = np.hypot(self.vel[:n, 0], self.vel[:n, 1])
+        fast = speed > 6
+        aura_r = (r * 1.45).astype(int)
+        alpha = 25 + np.minimum(50, speed * 2).astype(int)
+        blits += [(circle_sprite(ar, FIRE_COLORS[1], a), (px - ar, py - ar))
+                  for ar, a, px, py in zip(aura_r[fast].tolist(), alpha[fast].tolist(),
+                                           x[fast].tolist(), y[fast].tolist())]
+        win.blits(blits, doreturn=False)
+
+        color = FIRE_COLORS[0]
+        for px, py, pr in zip(x.tolist(), y.tolist(), r.tolist()):
+            pygame.draw.circle(win, color, (px, py), pr)
+
+
+def fan_velocities(vx, vy, count, spread):
+    """
+    Velocities for `count` balls fanned around (vx, vy) across +/- spread radians.
+
+    Speeds below 1 are bumped to 6, as the original multi-ball did.
+    """
+    speed = math.hypot(vx, vy)
+    if speed < 1:
+        speed = 6
+    base = math.atan2(vy, vx)
+    if count == 2:
+        angles = base + np.array([-spread, spread])
+    else:
+        angles = base + np.linspace(-spread, spread, count)
+    return speed * np.cos(angles), speed * np.sin(angles)
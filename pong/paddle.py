@@ -68,9 +68,13 @@ class Paddle(PhysicsObject):
     def original_y(self):
         return self.original_pos[1]
 
-    def draw(self, win):
-        """Draws the paddle on the game window."""
-        pygame.draw.rect(win, self.color, (int(self.pos[0]), int(self.pos[1]), self.width, self.height))
+    def draw(self, win, scale=1.0):
+        """Draws the paddle on the game window (scaled for an internal-resolution target)."""
+        if scale == 1.0:
+            pygame.draw.rect(win, self.color, (int(self.pos[0]), int(self.pos[1]), self.width, self.height))
+        else:
+            pygame.draw.rect(win, self.color, (int(self.pos[0] * scale), int(self.pos[1] * scale),
+                                               max(1, round(self.width * scale)), max(1, round(self.height * scale))))
 
     def accelerate(self, up=True):
         """
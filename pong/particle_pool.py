@@ -0,0 +1,146 @@
+"""
+particle_pool.py -- Shared structure-of-arrays particle kernel.
+
+BloodSystem and ForceEffectSystem used to keep lists of __slots__ particle
+objects and walk them in Python every frame. A ParticlePool stores the same
+fields in parallel NumPy arrays (the BallBatch layout from multiball.py), so
+ageing, integration and floor collision are a handful of array operations
+no matter how many droplets a lightning kill throws out.
+"""
+
+import numpy as np
+import pygame
+
+
+class ParticlePool:
+    """
+    Growable batch of particles: position, velocity, colour, life, size and
+    a per-particle `landed` flag (free for the owner to use, e.g. splats).
+
+    Order is emission order, so trim() drops the oldest particles first.
+    """
+
+    def __init__(self, capacity=64):
+        self.n = 0
+        self._alloc(capacity)
+
+    def _alloc(self, capacity):
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity)
+        self.max_life = np.ones(capacity)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.landed = np.zeros(capacity, dtype=bool)
+
+    def _arrays(self):
+        return (self.pos, self.vel, self.life, self.max_life, self.size, self.color, self.landed)
+
+    def _grow(self, needed):
+        cap = len(self.life)
+        if needed <= cap:
+            return
+        old = self._arrays()
+        self._alloc(max(needed, cap * 2))
+        for new, arr in zip(self._arrays(), old):
+            new[:self.n] = arr[:self.n]
+
+    def __len__(self):
+        return self.n
+
+    def add(self, x, y, vx, vy, color, life, size):
+        """
+        Append particles. Every argument may be a scalar or a per-particle
+        array; color is one (r, g, b) or an (k, 3) array.
+        """
+        vx, vy = np.atleast_1d(vx), np.atleast_1d(vy)
+        k = max(len(vx), len(vy))
+        self._grow(self.n + k)
+        s = slice(self.n, self.n + k)
+        self.pos[s, 0], self.pos[s, 1] = x, y
+        self.vel[s, 0], self.vel[s, 1] = vx, vy
+        self.color[s] = color
+        self.life[s] = life
+        self.max_life[s] = life
+        self.size[s] = size
+        self.landed[s] = False
+        self.n += k
+
+    def clear(self):
+        self.n = 0
+
+    def keep(self, mask):
+        """Drop every particle where mask is False (stable order)."""
+        idx = np.flatnonzero(mask)
+        k = len(idx)
+        if k == self.n:
+            return
+        for arr in self._arrays():
+            arr[:k] = arr[idx]
+        self.n = k
+
+    def trim(self, max_n):
+        """Keep only the newest max_n particles."""
+        if self.n > max_n:
+            self.keep(np.arange(self.n) >= self.n - max_n)
+
+    # -------------------- Kernel --------------------
+
+    def age(self, dt):
+        """Subtract dt from every life; returns the mask of expired particles."""
+        life = self.life[:self.n]
+        life -= dt
+        return life <= 0
+
+    def integrate(self, dt, gravity=0.0, drag=1.0):
+        """Explicit Euler step: move, then apply gravity (px/s^2) and per-step drag."""
+        pos, vel = self.pos[:self.n], self.vel[:self.n]
+        pos += vel * dt
+        if gravity:
+            vel[:, 1] += gravity * dt
+        if drag != 1.0:
+            vel *= drag
+
+    def collide_floor(self, floor_y, bounce=0.2, friction=0.5):
+        """
+        Clamp particles below floor_y back onto it, bouncing up and
+        slowing horizontally. Returns the mask of particles that hit.
+        """
+        pos, vel = self.pos[:self.n], self.vel[:self.n]
+        hit = pos[:, 1] >= floor_y
+        if hit.any():
+            pos[hit, 1] = floor_y
+            vel[hit, 1] = -np.abs(vel[hit, 1]) * bounce
+            vel[hit, 0] *= friction
+        return hit
+
+    def draw_streaks(self, surface, min_speed, stretch, min_size=1, width_delta=0, scale=1.0):
+        """
+        Draw each particle shrinking with its remaining life: a streak along
+        its velocity when faster than min_speed (and at least min_size), a
+        dot otherwise. scale shrinks positions and sizes for an
+        internal-resolution target.
+        """
+        n = self.n
+        if not n:
+            return
+        ratio = np.maximum(self.life[:n] / self.max_life[:n], 0.0)
+        cur = np.maximum((self.size[:n] * ratio).astype(int), 1)
+        vel = self.vel[:n]
+        speed = np.hypot(vel[:, 0], vel[:, 1])
+        streak = (speed > min_speed) & (cur >= min_size)
+        if scale != 1.0:
+            cur = np.maximum((cur * scale).astype(int), 1)
+        inv = np.where(streak, cur * stretch / np.maximum(speed, 1e-9), 0.0)
+        dx, dy = vel[:, 0] * inv, vel[:, 1] * inv
+        x, y = self.pos[:n, 0] * scale, self.pos[:n, 1] * scale
+        rows = zip(streak.tolist(), self.color[:n].tolist(), cur.tolist(),
+                   x.astype(int).tolist(), y.astype(int).tolist(),
+                   (x - dx).astype(int).tolist(), (y - dy).astype(int).tolist(),
+                   (x + dx).astype(int).tolist(), (y + dy).astype(int).tolist())
+        line, circle = pygame.draw.line, pygame.draw.circle
+        for is_streak, color, size, cx, cy, x0, y0, x1, y1 in rows:
+            if is_streak:
+                line(surface, color, (x0, y0), (x1, y1), max(size + width_delta, 1))
+            else:
+                circle(surface, color, (cx, cy), size)
@@ -9,7 +9,9 @@ import pygame
 import numpy as np
 from enum import Enum
 from pong.constants import *
-from pong.ball import Ball, BallClassic
+from pong.render_cache import render_text, dim_overlay
+from pong.multiball import BallBatch, fan_velocities
+from pong import frame_recorder, metrics
 
 
 class PowerUpType(Enum):
@@ -50,6 +52,13 @@ _STANDARD_TYPES = [PowerUpType.RESIZE, PowerUpType.FREEZE, PowerUpType.MULTI_BAL
 # All types including cursed for cursed mode
 _ALL_TYPES = list(PowerUpType)
 
+# Multi-ball: a normal pickup adds 2 balls; with the chaos setting it adds a
+# whole spray, capped so the field never holds more than CHAOS_MAX_BALLS
+MULTIBALL_SPREAD = math.radians(23)
+CHAOS_BALLS = 120
+CHAOS_SPREAD = math.radians(50)
+CHAOS_MAX_BALLS = 600
+
 _ICON_FONT = None
 
 def _get_icon_font():
@@ -99,30 +108,44 @@ class PowerUp:
         self.age += 1
         return self.age < POWERUP_LIFETIME
 
-    def draw(self, win):
-        """Draw the power-up box with bob and blink."""
+    def _draw_rect(self, scale=1.0):
+        """On-screen box this frame (bob applied), or None while blinked off."""
         # Blink when near expiry
         if self.age >= POWERUP_BLINK_AT:
             if (self.age // 10) % 2 == 0:
-                return  # invisible during blink-off frames
+                return None  # invisible during blink-off frames
 
         # Gentle sine bob
         bob = math.sin(self.age * 0.06) * 3
         draw_y = self.y + bob
+        size = self.size if scale == 1.0 else max(1, round(self.size * scale))
 
-        r = pygame.Rect(
-            int(self.x - self.size / 2),
-            int(draw_y - self.size / 2),
-            self.size, self.size
+        return pygame.Rect(
+            int((self.x - self.size / 2) * scale),
+            int((draw_y - self.size / 2) * scale),
+            size, size
         )
 
+    def draw(self, win, scale=1.0, label=True):
+        """Draw the power-up box with bob and blink."""
+        r = self._draw_rect(scale)
+        if r is None:
+            return
+
         # Colored rounded rect with white border
-        pygame.draw.rect(win, self.color, r, border_radius=5)
-        pygame.draw.rect(win, WHITE, r, width=2, border_radius=5)
+        pygame.draw.rect(win, self.color, r, border_radius=max(1, round(5 * scale)))
+        pygame.draw.rect(win, WHITE, r, width=max(1, round(2 * scale)), border_radius=max(1, round(5 * scale)))
+
+        if label:
+            self.draw_label(win)
 
-        # Letter icon
+    def draw_label(self, win):
+        """Letter icon at native resolution."""
+        r = self._draw_rect()
+        if r is None:
+            return
         font = _get_icon_font()
-        txt = font.render(self.letter, True, BLACK)
+        txt = render_text(font, self.letter, BLACK)
         win.blit(txt, (r.centerx - txt.get_width() // 2,
                        r.centery - txt.get_height() // 2))
 
@@ -146,13 +169,14 @@ class ActiveEffect:
 class PowerUpManager:
     """Orchestrates power-up spawning, collection, effects, and multi-ball."""
 
-    def __init__(self, left_paddle, right_paddle, cursed=False):
+    def __init__(self, left_paddle, right_paddle, cursed=False, chaos=False):
         self.left_paddle = left_paddle
         self.right_paddle = right_paddle
         self.cursed = cursed  # If True, include cursed power-up types
+        self.chaos = chaos    # If True, multi-ball sprays CHAOS_BALLS at once
         self.field_powerups = []
         self.active_effects = []
-        self.extra_balls = []
+        self.extra_balls = BallBatch()
         self.spawn_timer = random.randint(POWERUP_SPAWN_MIN, POWERUP_SPAWN_MAX)
         self.last_hit_side = 'left'
         self.main_ball_parked = False
@@ -168,9 +192,16 @@ class PowerUpManager:
     def set_last_hit(self, side):
         self.last_hit_side = side
 
+    def on_contacts(self, contacts):
+        """Track the last paddle to hit the ball from a frame's contact list."""
+        for c in contacts:
+            if c.is_paddle:
+                self.last_hit_side = c.side
+
     def is_frozen(self, paddle):
         return id(paddle) in self._frozen_paddles
 
+    @metrics.timed('powerups.update')
     def update(self, ball):
         """Per-frame update: spawn, age, collect, tick effects."""
         # Spawn timer
@@ -194,12 +225,13 @@ class PowerUpManager:
         for effect in expired:
             self._remove_effect(effect)
             self.active_effects.remove(effect)
+        metrics.gauge('powerups.field', len(self.field_powerups))
+        metrics.gauge('powerups.active_effects', len(self.active_effects))
 
-        # Clean up extra balls that have exited
-        self.extra_balls = [
-            eb for eb in self.extra_balls
-            if -eb.radius <= eb.pos[0] <= WIDTH + eb.radius
-        ]
+    def step_extra_balls(self, rules, height=None, width=None):
+        """Move, collide and cull every extra ball in one vectorized step."""
+        return self.extra_balls.step(self.left_paddle, self.right_paddle,
+                                     rules, height, width)
 
     def _spawn(self):
         """Spawn a random power-up in the middle zone of the field."""
@@ -213,6 +245,8 @@ class PowerUpManager:
 
     def _check_ball_collection(self, ball):
         """Check if ball collects any field power-up."""
+        metrics.count('powerups.collision_tests',
+                      len(self.field_powerups) * (1 + len(self.extra_balls)))
         collected = []
         for pu in self.field_powerups:
             if pu.collides_with_ball(ball):
@@ -220,18 +254,17 @@ class PowerUpManager:
         for pu in collected:
             self.field_powerups.remove(pu)
             self._apply(pu.power_type, self.last_hit_side)
-        # Also check extra balls
-        for eb in self.extra_balls:
-            collected = []
-            for pu in self.field_powerups:
-                if pu.collides_with_ball(eb):
-                    collected.append(pu)
+        # Also check extra balls, all at once per power-up
+        if self.extra_balls:
+            collected = [pu for pu in self.field_powerups
+                         if self.extra_balls.touching_rect(pu.rect).any()]
             for pu in collected:
                 self.field_powerups.remove(pu)
                 self._apply(pu.power_type, self.last_hit_side)
 
     def _check_paddle_collection(self):
         """Check if paddles overlap any field power-up."""
+        metrics.count('powerups.collision_tests', len(self.field_powerups) * 2)
         collected = []
         for pu in self.field_powerups:
             if pu.collides_with_paddle(self.left_paddle):
@@ -248,6 +281,7 @@ class PowerUpManager:
         collector = self.left_paddle if collector_side == 'left' else self.right_paddle
         opponent = self.right_paddle if collector_side == 'left' else self.left_paddle
         opponent_side = 'right' if collector_side == 'left' else 'left'
+        frame_recorder.note(f'powerup {power_type.value}')
 
         if power_type == PowerUpType.RESIZE:
             self._apply_resize(collector, opponent)
@@ -322,24 +356,18 @@ class PowerUpManager:
             return
         del self._pending_multiball_side
 
-        bx, by = main_ball.pos[0], main_ball.pos[1]
-        speed = np.linalg.norm(main_ball.vel)
-        if speed < 1:
-            speed = 6
-        # Base angle from main ball velocity
-        base_angle = math.atan2(main_ball.vel[1], main_ball.vel[0])
-        spread = math.radians(23)
-
-        for offset in [-spread, spread]:
-            angle = base_angle + offset
-            vx = speed * math.cos(angle)
-            vy = speed * math.sin(angle)
-            if mode == 'classic':
-                eb = BallClassic(bx, by, main_ball.radius, POWERUP_COLOR_MULTI, vx, vy)
-            else:
-                eb = Ball(bx, by, main_ball.radius, POWERUP_COLOR_MULTI,
-                          mass=1, vel=(vx, vy), mode='physics')
-            self.extra_balls.append(eb)
+        batch = self.extra_balls
+        if self.chaos:
+            count = min(CHAOS_BALLS, CHAOS_MAX_BALLS - len(batch))
+            spread = CHAOS_SPREAD
+        else:
+            count, spread = 2, MULTIBALL_SPREAD
+        if count <= 0:
+            return
+
+        batch.mode = mode
+        vx, vy = fan_velocities(main_ball.vel[0], main_ball.vel[1], count, spread)
+        batch.add(main_ball.pos[0], main_ball.pos[1], vx, vy, main_ball.radius)
 
     def _apply_reverse(self, opponent):
         """Reverse opponent's controls for a duration."""
@@ -491,49 +519,57 @@ class PowerUpManager:
             del self._pending_multiball_side
         self.spawn_timer = random.randint(POWERUP_SPAWN_MIN, POWERUP_SPAWN_MAX)
 
-    def draw(self, win):
-        """Draw field power-ups and effect indicators."""
+    def draw(self, win, scale=1.0, labels=True):
+        """
+        Draw field power-ups and effect indicators.
+
+        With labels=False the box letters are left for draw_labels(), so an
+        internal-resolution world target (scale < 1) keeps them crisp.
+        """
         # Field boxes
         for pu in self.field_powerups:
-            pu.draw(win)
+            pu.draw(win, scale, label=labels)
 
         # Effect indicators on paddles
         for effect in self.active_effects:
             if effect.power_type == PowerUpType.FREEZE:
-                self._draw_freeze_overlay(win, effect.paddle)
+                self._draw_freeze_overlay(win, effect.paddle, scale)
             elif effect.power_type == PowerUpType.REVERSE:
-                self._draw_effect_overlay(win, effect.paddle, POWERUP_COLOR_REVERSE, 50)
+                self._draw_effect_overlay(win, effect.paddle, POWERUP_COLOR_REVERSE, 50, scale)
             elif effect.power_type == PowerUpType.DRUNK:
-                self._draw_effect_overlay(win, effect.paddle, POWERUP_COLOR_DRUNK, 40)
-            self._draw_timer_bar(win, effect)
+                self._draw_effect_overlay(win, effect.paddle, POWERUP_COLOR_DRUNK, 40, scale)
+            self._draw_timer_bar(win, effect, scale)
 
         # Blind effect: darken half the screen
         if self._blind_side is not None:
-            blind_surf = pygame.Surface((WIDTH // 2, HEIGHT), pygame.SRCALPHA)
-            blind_surf.fill((0, 0, 0, 200))
+            half_w = round(WIDTH // 2 * scale)
+            blind_surf = dim_overlay(200, (half_w, round(HEIGHT * scale)))
             if self._blind_side == 'left':
                 win.blit(blind_surf, (0, 0))
             else:
-                win.blit(blind_surf, (WIDTH // 2, 0))
+                win.blit(blind_surf, (half_w, 0))
+
+    def draw_labels(self, win):
+        """Power-up letters at native resolution (after draw(..., labels=False))."""
+        for pu in self.field_powerups:
+            pu.draw_label(win)
 
-    def draw_extra_balls(self, win):
+    def draw_extra_balls(self, win, scale=1.0):
         """Render multi-ball extras."""
-        for eb in self.extra_balls:
-            eb.draw(win)
+        self.extra_balls.draw(win, scale)
 
-    def _draw_effect_overlay(self, win, paddle, color, alpha):
+    def _draw_effect_overlay(self, win, paddle, color, alpha, scale=1.0):
         """Semi-transparent color overlay on a paddle."""
-        overlay = pygame.Surface((int(paddle.width) + 4, int(paddle.height) + 4), pygame.SRCALPHA)
+        overlay = pygame.Surface((round((int(paddle.width) + 4) * scale),
+                                  round((int(paddle.height) + 4) * scale)), pygame.SRCALPHA)
         overlay.fill((*color, alpha))
-        win.blit(overlay, (int(paddle.pos[0]) - 2, int(paddle.pos[1]) - 2))
+        win.blit(overlay, (int((int(paddle.pos[0]) - 2) * scale), int((int(paddle.pos[1]) - 2) * scale)))
 
-    def _draw_freeze_overlay(self, win, paddle):
+    def _draw_freeze_overlay(self, win, paddle, scale=1.0):
         """Semi-transparent blue overlay on frozen paddle."""
-        overlay = pygame.Surface((int(paddle.width) + 4, int(paddle.height) + 4), pygame.SRCALPHA)
-        overlay.fill((*POWERUP_COLOR_FREEZE, 80))
-        win.blit(overlay, (int(paddle.pos[0]) - 2, int(paddle.pos[1]) - 2))
+        self._draw_effect_overlay(win, paddle, POWERUP_COLOR_FREEZE, 80, scale)
 
-    def _draw_timer_bar(self, win, effect):
+    def _draw_timer_bar(self, win, effect, scale=1.0):
         """Draw a colored bar on inner edge of paddle showing remaining time."""
         paddle = effect.paddle
         frac = effect.remaining / effect.duration
@@ -549,4 +585,5 @@ class PowerUpManager:
             x = int(paddle.pos[0]) - bar_width
 
         y = int(paddle.pos[1] + paddle.height - bar_height)
-        pygame.draw.rect(win, color, (x, y, bar_width, bar_height))
+        pygame.draw.rect(win, color, (int(x * scale), int(y * scale),
+                                      max(1, round(bar_width * scale)), round(bar_height * scale)))
@@ -0,0 +1,300 @@
+"""
+profiler.py -- Per-frame phase profiler and overlay.
+
+Each mode loop marks the end of its phases (events, AI, physics, ...) with
+lap(); the time since the previous mark is charged to that phase. begin()
+closes the previous frame, so the frame time is the wall time between two
+begin() calls, clock sleep included ('idle'). The overlay shows the mean
+per-phase cost over the last PROFILE_WINDOW frames, a rolling frame-time
+graph against the frame budget, and p50/p95/p99.
+
+Disabled (the default) every call is one attribute check and a return, so
+the marks stay in the loops permanently. Toggle with F3 in any mode, or set
+"profiler": true in settings.json to start with it on.
+
+F4 starts/stops a frame recording (pong.frame_recorder). Timing runs while
+either the overlay is shown or a recording is active.
+
+While the overlay is shown, the pong.metrics registry is enabled too and its
+counters (AI predictions, collision tests, particles emitted/culled, Surfaces
+built, subsystem update times) are listed below the phases, per frame.
+"""
+
+import os
+import time
+import numpy as np
+import pygame
+from pong.constants import *
+from pong.render_cache import render_text
+from pong import frame_recorder, metrics
+
+# -------------------- Phases --------------------
+
+# (name, color) in loop order; 'idle' is the clock sleep between frames
+PHASES = (
+    ('events',  (120, 160, 255)),
+    ('ai',      (255, 160, 60)),
+    ('physics', (80, 220, 120)),
+    ('powerups', (255, 220, 60)),
+    ('cursed',  (200, 80, 255)),
+    ('combat',  (255, 70, 70)),
+    ('juice',   (255, 120, 200)),
+    ('world',   (90, 200, 230)),
+    ('effects', (230, 150, 110)),
+    ('flip',    (200, 200, 200)),
+    ('overlay', (110, 110, 110)),
+    ('idle',    (60, 60, 60)),
+)
+PHASE_NAMES = tuple(name for name, _ in PHASES)
+PHASE_INDEX = {name: i for i, name in enumerate(PHASE_NAMES)}
+
+PROFILE_WINDOW = 120         # frames kept for averages, percentiles and graph
+PROFILE_STALL_MS = 250       # longer frames are pauses/countdowns and are dropped
+TEXT_REFRESH = 15            # frames between overlay text refreshes
+PROFILER_KEY = pygame.K_F3
+RECORD_KEY = pygame.K_F4
+SAVED_MESSAGE_FRAMES = 180   # how long the 'saved' notice stays up
+
+PANEL_W, PANEL_PAD, ROW_H, GRAPH_H = 250, 8, 14, 60
+
+
+class FrameProfiler:
+    """
+    Rolling per-phase frame timings.
+
+    Usage per frame:
+        profiler.begin()                  # right after clock.tick()
+        ... handle events ...
+        profiler.lap('events')
+        ... draw ...
+        profiler.lap('world')
+        profiler.draw(WIN)                # before the display update
+        pygame.display.update()
+        profiler.lap('flip')
+    """
+
+    def __init__(self, settings=None):
+        self.visible = bool(getattr(settings, 'profiler', False))
+        if getattr(settings, 'record_frames', False) and frame_recorder.recording() is None:
+            frame_recorder.start(PHASE_NAMES)
+        self._counts = None
+        self._saved = None
+        self._saved_frames = 0
+        self._times = np.zeros((PROFILE_WINDOW, len(PHASES)))
+        self._frames = np.zeros(PROFILE_WINDOW)
+        self._row = np.zeros(len(PHASES))
+        self._count = 0
+        self._head = 0
+        self._mark = None
+        self._frame_start = None
+        self._since_text = TEXT_REFRESH
+        self._lines = []
+        self._metrics_owned = False
+        self._metrics_snapshot = None
+        self.enabled = False
+        self._sync()
+
+    def _sync(self):
+        """Time frames while the overlay is shown or a recording is running."""
+        enabled = self.visible or frame_recorder.recording() is not None
+        if enabled and not self.enabled:
+            self.reset()
+        self.enabled = enabled
+        # The overlay lists the metrics registry; leave one enabled by someone else alone
+        if self.visible and not metrics.enabled():
+            metrics.enable()
+            self._metrics_owned = True
+        elif not self.visible and self._metrics_owned:
+            metrics.disable()
+            self._metrics_owned = False
+        self._metrics_snapshot = None
+
+    def toggle(self):
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+        self._sync()
+
+    def toggle_recording(self):
+        """Start a recording, or stop the running one and write it to disk."""
+        if frame_recorder.recording() is None:
+            frame_recorder.start(PHASE_NAMES)
+        else:
+            self._saved = frame_recorder.stop()
+            self._saved_frames = SAVED_MESSAGE_FRAMES if self._saved else 0
+        self._sync()
+
+    @property
+    def needs_full_redraw(self):
+        """True while anything is drawn over the scene (for dirty-rect updates)."""
+        return self.enabled or self._saved_frames > 0
+
+    def track(self, counts):
+        """Set a callable returning {counter: value} sampled into recordings each frame."""
+        self._counts = counts
+
+    def reset(self):
+        """Forget all samples (e.g. after a pause or mode change)."""
+        self._count = 0
+        self._head = 0
+        self._row[:] = 0
+        self._mark = self._frame_start = None
+        self._since_text = TEXT_REFRESH
+
+    def handle_event(self, event):
+        """Overlay on F3, recording on F4. Returns True if the event was consumed."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == PROFILER_KEY:
+            self.toggle()
+            return True
+        if event.key == RECORD_KEY:
+            self.toggle_recording()
+            return True
+        return False
+
+    # -------------------- Timing --------------------
+
+    def begin(self):
+        """Close the previous frame and start a new one."""
+        metrics.end_frame()
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._row[PHASE_INDEX['idle']] += (now - self._mark) * 1000.0
+            frame_ms = (now - self._frame_start) * 1000.0
+            rec = frame_recorder.recording()
+            if rec is not None:
+                if frame_ms > PROFILE_STALL_MS:
+                    rec.note('stall')
+                rec.record(frame_ms, self._row, self._counts() if self._counts else None)
+            if frame_ms <= PROFILE_STALL_MS:
+                self._times[self._head] = self._row
+                self._frames[self._head] = frame_ms
+                self._head = (self._head + 1) % PROFILE_WINDOW
+                self._count = min(self._count + 1, PROFILE_WINDOW)
+        self._row[:] = 0
+        self._frame_start = self._mark = now
+
+    def lap(self, phase):
+        """Charge the time since the last mark to `phase`."""
+        if not self.enabled or self._mark is None:
+            return
+        now = time.perf_counter()
+        self._row[PHASE_INDEX[phase]] += (now - self._mark) * 1000.0
+        self._mark = now
+
+    # -------------------- Stats --------------------
+
+    def _ordered(self):
+        """(frame_ms, phase_ms) for the recorded frames, oldest first."""
+        n = self._count
+        if n < PROFILE_WINDOW:
+            return self._frames[:n], self._times[:n]
+        order = np.roll(np.arange(PROFILE_WINDOW), -self._head)
+        return self._frames[order], self._times[order]
+
+    def stats(self):
+        """
+        Summary of the window.
+
+        Returns:
+            dict with 'frames', 'p50', 'p95', 'p99' (ms) and 'phases'
+            ({name: mean ms}), or None before the first full frame.
+        """
+        if not self._count:
+            return None
+        frames, times = self._ordered()
+        p50, p95, p99 = np.percentile(frames, (50, 95, 99))
+        means = times.mean(axis=0)
+        return {
+            'frames': len(frames),
+            'p50': float(p50), 'p95': float(p95), 'p99': float(p99),
+            'phases': {name: float(means[i]) for i, (name, _) in enumerate(PHASES)},
+        }
+
+    # -------------------- Overlay --------------------
+
+    def _refresh_lines(self):
+        st = self.stats()
+        if st is None:
+            self._lines = [("PROFILER  (collecting...)", WHITE)]
+            return
+        budget = 1000.0 / FPS
+        work = sum(ms for name, ms in st['phases'].items() if name != 'idle')
+        self._lines = [
+            (f"PROFILER  work {work:5.2f} / {budget:.1f} ms", WHITE),
+            (f"p50 {st['p50']:5.1f}  p95 {st['p95']:5.1f}  p99 {st['p99']:5.1f}", WHITE),
+        ] + [(f"{name:<9}{st['phases'][name]:6.2f} ms", color) for name, color in PHASES]
+        self._lines += self._metric_lines()
+
+    def _metric_lines(self):
+        """Registry counters per frame since the previous text refresh."""
+        reg = metrics.registry()
+        if reg is None:
+            return []
+        snap = reg.snapshot()
+        before, self._metrics_snapshot = self._metrics_snapshot, snap
+        if before is None:
+            return []
+        rates = metrics.per_frame(before, snap)
+        if not rates:
+            return []
+        return [("per frame", WHITE)] + [(f"{name:<26}{value:8.2f}", GREY)
+                                         for name, value in rates.items()]
+
+    def draw(self, win):
+        """Draw the overlay in the top-right corner (no-op when disabled)."""
+        if self.enabled or self._saved_frames:
+            self._draw_record_status(win)
+        if not self.visible:
+            self.lap('overlay')
+            return
+        self._since_text += 1
+        if self._since_text >= TEXT_REFRESH:
+            self._since_text = 0
+            self._refresh_lines()
+
+        x = win.get_width() - PANEL_W - 10
+        y = 70
+        panel_h = PANEL_PAD * 3 + ROW_H * len(self._lines) + GRAPH_H
+        panel = pygame.Rect(x, y, PANEL_W, panel_h)
+        win.fill((15, 15, 20), panel)
+        pygame.draw.rect(win, DARK_GREY, panel, 1)
+
+        ty = y + PANEL_PAD
+        for text, color in self._lines:
+            win.blit(render_text(FONT_TINY_DIGITAL, text, color), (x + PANEL_PAD, ty))
+            ty += ROW_H
+
+        self._draw_graph(win, pygame.Rect(x + PANEL_PAD, ty + PANEL_PAD,
+                                          PANEL_W - PANEL_PAD * 2, GRAPH_H))
+        # Keep the overlay's own cost out of the next phase
+        self.lap('overlay')
+
+    def _draw_record_status(self, win):
+        """REC badge while recording; the dump path for a while after stopping."""
+        rec = frame_recorder.recording()
+        if rec is not None:
+            text, color = "REC  [F4] stop & save", RED
+        elif self._saved_frames:
+            self._saved_frames -= 1
+            text, color = f"Saved {os.path.basename(self._saved)}", GREEN
+        else:
+            return
+        surf = render_text(FONT_TINY_DIGITAL, text, color)
+        win.blit(surf, (win.get_width() - surf.get_width() - 10, 52))
+
+    def _draw_graph(self, win, rect):
+        """Frame times as a polyline; the budget line sits at mid-height."""
+        budget = 1000.0 / FPS
+        scale = rect.height / (budget * 2)
+        budget_y = rect.bottom - int(budget * scale)
+        pygame.draw.line(win, DARK_GREY, (rect.left, budget_y), (rect.right, budget_y))
+        frames, _ = self._ordered()
+        if len(frames) < 2:
+            return
+        xs = rect.left + np.arange(len(frames)) * (rect.width / (PROFILE_WINDOW - 1))
+        ys = rect.bottom - np.minimum(frames * scale, rect.height)
+        points = np.column_stack((xs, ys)).astype(int).tolist()
+        pygame.draw.lines(win, GREEN, False, points)
@@ -0,0 +1,149 @@
+"""
+quality.py -- Adaptive effect quality driven by measured frame time.
+
+Low-end machines with particles and fire effects on simply drop frames.
+The QualityGovernor watches how long each frame's work takes over a
+rolling window and steps through QUALITY_TIERS:
+down quickly when frames run long, back up only after a sustained stretch
+of headroom (longer after each upgrade that did not hold), so it does not
+oscillate between two tiers.
+
+Each tier sets the ball trail and aura, the particle budgets of the juice,
+blood and force-effect systems, and shockwave detail. The particles setting
+is one input: with particles off, juice particles stay off at every tier.
+
+Work time is an explicit span from begin() (after clock.tick()) to end()
+(before the loop's pacing wait), so no sleep anywhere in the loop, the
+clock's or the frame scheduler's, is ever counted as load.
+"""
+
+import time
+from collections import deque
+from pong.constants import FPS
+
+# -------------------- Tiers --------------------
+
+# Best first. particles scales each system's budget (0 = none).
+QUALITY_TIERS = [
+    {'name': 'high',    'trail': 10, 'aura': 3, 'particles': 1.0,  'shockwave_alpha': True},
+    {'name': 'medium',  'trail': 6,  'aura': 2, 'particles': 0.5,  'shockwave_alpha': True},
+    {'name': 'low',     'trail': 3,  'aura': 1, 'particles': 0.25, 'shockwave_alpha': False},
+    {'name': 'minimal', 'trail': 0,  'aura': 0, 'particles': 0.0,  'shockwave_alpha': False},
+]
+
+QUALITY_WINDOW = 45          # frames averaged per decision
+DOWNGRADE_LOAD = 0.9         # step down above this fraction of the frame budget
+UPGRADE_LOAD = 0.5           # step up below this fraction...
+UPGRADE_HOLD = 180           # ...sustained for this many frames (3 s at 60 FPS)
+MAX_UPGRADE_HOLD = 1440      # hold doubles after each failed upgrade, up to this
+STALL_MS = 250               # longer frames are pauses/countdowns, not load
+
+
+class QualityGovernor:
+    """
+    Picks a quality tier from the rolling average frame work time.
+
+    Usage per frame:
+        clock.tick(FPS)
+        if governor.begin():              # samples the previous frame
+            governor.apply(balls=[ball], juice=juice)
+        ... frame work ...
+        governor.end()                    # before the pacing wait
+        await frame_scheduler.next_frame()
+    """
+
+    def __init__(self, settings=None, fps=FPS):
+        self.enabled = getattr(settings, 'auto_quality', True)
+        self.particles_allowed = getattr(settings, 'particles_enabled', True)
+        self.budget_ms = 1000.0 / fps
+        self.tier = 0
+        self._samples = deque(maxlen=QUALITY_WINDOW)
+        self._calm = 0
+        self._hold = UPGRADE_HOLD
+        self._last_step = 0
+        self._start = None
+        self._end = None
+
+    @property
+    def settings(self):
+        """The active tier's dict."""
+        return QUALITY_TIERS[self.tier]
+
+    @property
+    def name(self):
+        return self.settings['name']
+
+    @property
+    def load(self):
+        """Mean frame work time over the window, as a fraction of the frame budget."""
+        if not self._samples:
+            return 0.0
+        return sum(self._samples) / len(self._samples) / self.budget_ms
+
+    def sample(self, work_ms):
+        """
+        Record one frame's work time in milliseconds.
+
+        Returns:
+            True if the tier changed (call apply()).
+        """
+        if not self.enabled or work_ms > STALL_MS:
+            return False
+        self._samples.append(work_ms)
+        if len(self._samples) < QUALITY_WINDOW:
+            return False
+        load = self.load
+        if load > DOWNGRADE_LOAD and self.tier < len(QUALITY_TIERS) - 1:
+            return self._step(1)
+        if load < UPGRADE_LOAD and self.tier > 0:
+            self._calm += 1
+            if self._calm >= self._hold:
+                return self._step(-1)
+        else:
+            self._calm = 0
+        return False
+
+    def begin(self):
+        """
+        Start timing a frame's work and sample() the previous frame's span.
+
+        A frame that never reached end() (it bailed out early) is skipped.
+
+        Returns:
+            True if the tier changed (call apply()).
+        """
+        changed = False
+        if self._start is not None and self._end is not None:
+            changed = self.sample((self._end - self._start) * 1000.0)
+        self._start = time.perf_counter()
+        self._end = None
+        return changed
+
+    def end(self):
+        """Stop timing the frame's work (call right before the pacing wait)."""
+        self._end = time.perf_counter()
+
+    def _step(self, direction):
+        if direction > 0 and self._last_step < 0:
+            # The last upgrade did not hold: wait longer before the next one
+            self._hold = min(self._hold * 2, MAX_UPGRADE_HOLD)
+        self._last_step = direction
+        self.tier += direction
+        # Start a fresh window so the new tier is judged on its own frames
+        self._samples.clear()
+        self._calm = 0
+        return True
+
+    def apply(self, balls=(), juice=None, blood=None, force=None):
+        """Push the active tier into the given effect owners (any may be omitted)."""
+        tier = self.settings
+        for ball in balls:
+            ball.max_trail = tier['trail']
+            ball.aura_layers = tier['aura']
+        if juice is not None:
+            juice.set_particle_scale(tier['particles'] if self.particles_allowed else 0.0)
+        for system in (blood, force):
+            if system is not None:
+                system.max_particles = int(system.MAX_PARTICLES * tier['particles'])
+        if force is not None:
+            force.shockwave_alpha = tier['shockwave_alpha']
@@ -0,0 +1,221 @@
+"""
+render_cache.py -- Bounded caches for pre-rendered Surfaces.
+
+Effects like the fire trail redraw the same small alpha shapes every frame,
+and the HUD re-renders the same strings. Building each one into a fresh
+Surface is the expensive part, so they are rendered once on first use and
+kept in an LRU keyed by their (quantized) parameters.
+
+Cached Surfaces are shared: callers must not draw on them or change their
+alpha. Copy or transform first if a variant is needed.
+
+Render targets are the exception: they are scratch Surfaces handed out
+by (size, flags, tag) so per-frame offscreen passes reuse one allocation.
+Their contents are whatever the last user left; overwrite before reading.
+"""
+
+import math
+from collections import OrderedDict
+import pygame
+from pong import metrics
+
+SPRITE_CACHE_SIZE = 512
+TEXT_CACHE_SIZE = 256
+LAYER_CACHE_SIZE = 24        # courts, grids, nets and dim overlays
+ALPHA_STEP = 8            # alpha is quantized to multiples of this
+ARC_LEN_STEPS = 16        # arc length quantization across [pi, 1.8 pi]
+
+
+class LRUCache:
+    """Small least-recently-used map. get() refreshes, put() evicts the oldest."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        # Every cache here holds Surfaces built on a miss
+        metrics.count('render.surfaces_built')
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+_sprites = LRUCache(SPRITE_CACHE_SIZE)
+_texts = LRUCache(TEXT_CACHE_SIZE)
+_layers = LRUCache(LAYER_CACHE_SIZE)
+_targets = {}
+
+
+def quantize_alpha(alpha):
+    return max(0, min(255, int(alpha))) // ALPHA_STEP * ALPHA_STEP
+
+
+def circle_sprite(radius, color, alpha):
+    """Filled alpha circle of `radius`, drawn at (radius, radius)."""
+    alpha = quantize_alpha(alpha)
+    key = ('circle', radius, color, alpha)
+    surf = _sprites.get(key)
+    if surf is None:
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
+        _sprites.put(key, surf)
+    return surf
+
+
+def arc_sprite(radius, color, alpha, start, arc_len, thickness):
+    """
+    Alpha arc inscribed in a (2r x 2r) square.
+
+    arc_len is snapped to ARC_LEN_STEPS over [pi, 1.8 pi], the range the
+    spin effect uses, so a slowly changing speed reuses sprites.
+    """
+    alpha = quantize_alpha(alpha)
+    t = (arc_len - math.pi) / (math.pi * 0.8)
+    step = round(max(0.0, min(1.0, t)) * ARC_LEN_STEPS)
+    key = ('arc', radius, color, alpha, start, step, thickness)
+    surf = _sprites.get(key)
+    if surf is None:
+        arc_len = math.pi + step / ARC_LEN_STEPS * math.pi * 0.8
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.arc(surf, (*color, alpha), pygame.Rect(0, 0, radius * 2, radius * 2),
+                        start, start + arc_len, thickness)
+        _sprites.put(key, surf)
+    return surf
+
+
+def render_text(font, text, color, antialias=True):
+    """
+    Cached font.render(text, antialias, color).
+
+    The key is (font, text, color, antialias), so a changed score or label is
+    simply a new entry and stale strings age out of the LRU.
+    """
+    key = (font, text, tuple(color), antialias)
+    surf = _texts.get(key)
+    if surf is None:
+        surf = font.render(text, antialias, color)
+        _texts.put(key, surf)
+    return surf
+
+
+def clear_text_cache():
+    """Drop every cached string (e.g. after fonts are reloaded)."""
+    _texts.clear()
+
+
+def text_cache_stats():
+    """(entries, hits, misses) for the text cache."""
+    return len(_texts), _texts.hits, _texts.misses
+
+
+def static_layer(key, size, build, alpha=False):
+    """
+    Pre-composited static background layer.
+
+    Args:
+        key: hashable description of everything the layer depends on
+            (colors, settings); a new key rebuilds the layer.
+        size: (width, height) of the layer.
+        build: callable(surface) that paints the layer once.
+        alpha: create an SRCALPHA (transparent) layer instead of an opaque one.
+
+    Returns:
+        The cached Surface; blit it instead of redrawing its contents.
+    """
+    key = (key, tuple(size), alpha)
+    surf = _layers.get(key)
+    if surf is None:
+        if alpha:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            surf = pygame.Surface(size).convert() if pygame.display.get_surface() else pygame.Surface(size)
+        build(surf)
+        _layers.put(key, surf)
+    return surf
+
+
+def dim_overlay(alpha, size, color=(0, 0, 0)):
+    """Cached full-size SRCALPHA overlay pre-filled with (color, alpha)."""
+    color = tuple(color)
+    return static_layer(('overlay', color, alpha), size,
+                        lambda surf: surf.fill((*color, alpha)), alpha=True)
+
+
+def render_target(size, flags=0, tag=None):
+    """
+    Reusable offscreen Surface for a per-frame render pass.
+
+    Args:
+        size: (width, height).
+        flags: Surface flags (e.g. pygame.SRCALPHA).
+        tag: distinguishes targets of the same size used together in one pass.
+
+    Returns:
+        The same Surface for the same (size, flags, tag) on every call.
+        Opaque targets are converted to the display format when a display exists.
+    """
+    key = (tuple(size), flags, tag)
+    surf = _targets.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, flags)
+        metrics.count('render.surfaces_built')
+        if not flags & pygame.SRCALPHA and pygame.display.get_surface():
+            surf = surf.convert()
+        _targets[key] = surf
+    return surf
+
+
+def flip_vertical(src):
+    """
+    Upside-down copy of src in a pooled render target.
+
+    Same result as pygame.transform.flip(src, False, True), but written into
+    a reused Surface through surfarray instead of allocating a new one.
+    """
+    key = (src.get_size(), src.get_flags(), 'flip')
+    dst = _targets.get(key)
+    if dst is None or dst.get_bitsize() != src.get_bitsize():
+        dst = _targets[key] = src.copy()
+        metrics.count('render.surfaces_built')
+    pygame.surfarray.pixels2d(dst)[:] = pygame.surfarray.pixels2d(src)[:, ::-1]
+    return dst
+
+
+def sprite_cache_stats():
+    """(entries, hits, misses) for the shared sprite cache."""
+    return len(_sprites), _sprites.hits, _sprites.misses
+
+
+def surface_counts():
+    """
+    Surfaces held by the caches, and how many each has built so far.
+
+    Returns:
+        {cache: (live, built)}; render targets are never evicted, so for
+        them both numbers are the pool size.
+    """
+    return {
+        'sprites': (len(_sprites), _sprites.misses),
+        'texts': (len(_texts), _texts.misses),
+        'layers': (len(_layers), _layers.misses),
+        'targets': (len(_targets), len(_targets)),
+    }
@@ -0,0 +1,64 @@
+"""
+render_scale.py -- Internal-resolution rendering.
+
+With a render scale below 1.0 the game world (court, paddles, balls, power-up
+boxes, particles, flash) is drawn into a smaller offscreen Surface and
+stretched to the window in a single pygame.transform.scale. HUD text (scores,
+labels, power-up letters, score pops) is drawn afterwards at native resolution
+so it stays crisp. Fill-heavy effects then touch a quarter of the pixels at
+0.5x, which is what weak GPUs and software canvases in the browser need.
+
+World draw functions take a `scale` argument and multiply positions and sizes
+by it; at 1.0 they draw exactly as before.
+"""
+
+import pygame
+from pong.constants import *
+from pong.render_cache import render_target
+
+# Supported internal resolutions, as a fraction of the window
+RENDER_SCALES = (1.0, 0.75, 0.5)
+
+
+def snap_scale(scale):
+    """Nearest supported render scale."""
+    try:
+        scale = float(scale)
+    except (TypeError, ValueError):
+        return 1.0
+    return min(RENDER_SCALES, key=lambda s: abs(s - scale))
+
+
+class InternalResolution:
+    """
+    Offscreen world target at a fraction of the window size.
+
+    Usage per frame:
+        world = view.begin(WIN)
+        ... draw world objects to `world` with scale=view.scale ...
+        view.present(WIN)
+        ... draw HUD to WIN at native resolution ...
+    """
+
+    def __init__(self, scale=1.0, size=(WIDTH, HEIGHT)):
+        self.scale = snap_scale(scale)
+        self.size = tuple(size)
+        self.internal_size = (max(1, round(self.size[0] * self.scale)),
+                              max(1, round(self.size[1] * self.scale)))
+
+    @property
+    def active(self):
+        """True when the world is drawn below native resolution."""
+        return self.scale < 1.0
+
+    def begin(self, win):
+        """Surface to draw the world on this frame (win itself at 1.0)."""
+        if not self.active:
+            return win
+        return render_target(self.internal_size, tag='world')
+
+    def present(self, win):
+        """Stretch the world target over win (no-op at 1.0)."""
+        if self.active:
+            pygame.transform.scale(render_target(self.internal_size, tag='world'),
+                                   win.get_size(), win)
@@ -12,7 +12,7 @@ from pong.constants import *
 from pong.ball import Ball
 from pong.paddle import Paddle
 from pong.ai import ai_move_paddle, DIFFICULTY_NAMES
-from pong.helpers import handle_ball_collision
+from pong.contacts import resolve_contacts
 
 # Settings file path (desktop: next to launcher, web: not used)
 _SETTINGS_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'settings.json')
@@ -47,6 +47,7 @@ class GameSettings:
 
         # Power-up settings
         self.power_ups_enabled = True
+        self.multiball_chaos = False  # Multi-ball sprays hundreds of balls
 
         # Cursed mode settings
         self.cursed_events_enabled = True
@@ -58,6 +59,11 @@ class GameSettings:
         # Visual settings
         self.screen_shake = 1  # 0=off, 1=subtle, 2=intense
         self.particles_enabled = True
+        self.dirty_rects = _IS_WEB  # Classic: push only changed regions to the display
+        self.auto_quality = True  # Step effect detail down when frames run long
+        self.render_scale = 1.0  # Internal world resolution: 1.0, 0.75 or 0.5
+        self.profiler = False  # Start games with the F3 frame profiler overlay shown
+        self.record_frames = False  # Start a frame recording (F4) when a game starts
 
         # Goal net settings (Cursed mode)
         self.goal_net_enabled = False
@@ -91,11 +97,17 @@ class GameSettings:
             'winning_score': int(self.winning_score),
             'ai_difficulty': int(self.ai_difficulty),
             'power_ups_enabled': bool(self.power_ups_enabled),
+            'multiball_chaos': bool(self.multiball_chaos),
             'cursed_events_enabled': bool(self.cursed_events_enabled),
             'master_volume': float(self.master_volume),
             'sfx_volume': float(self.sfx_volume),
             'screen_shake': int(self.screen_shake),
             'particles_enabled': bool(self.particles_enabled),
+            'dirty_rects': bool(self.dirty_rects),
+            'auto_quality': bool(self.auto_quality),
+            'render_scale': float(self.render_scale),
+            'profiler': bool(self.profiler),
+            'record_frames': bool(self.record_frames),
             'game_speed': float(self.game_speed),
             'goal_net_enabled': bool(self.goal_net_enabled),
             'goal_net_size': float(self.goal_net_size),
@@ -192,7 +204,7 @@ class SettingsMenu:
         self.settings = settings
         self.selected_option = 0
         self.options = list(SETTING_RANGES.keys()) + [
-            'power_ups_enabled', 'cursed_events_enabled', 'goal_net_enabled', 'particles_enabled',
+            'power_ups_enabled', 'multiball_chaos', 'cursed_events_enabled', 'goal_net_enabled', 'particles_enabled',
             'left_paddle_color', 'right_paddle_color', 'background_color', 'Reset Defaults'
         ]
         self.color_keys = list(COLOR_OPTIONS.keys())
@@ -274,16 +286,8 @@ class SettingsMenu:
         # Move the ball (physics mode with trail + Magnus)
         ball_menu.update()
 
-        # Wall bounce (top/bottom) within the full screen height
-        if ball_menu.pos[1] + ball_menu.radius >= HEIGHT:
-            ball_menu.pos[1] = HEIGHT - ball_menu.radius
-            ball_menu.vel[1] *= -1
-        elif ball_menu.pos[1] - ball_menu.radius <= 0:
-            ball_menu.pos[1] = ball_menu.radius
-            ball_menu.vel[1] *= -1
-
-        # Collisions with preview paddles
-        handle_ball_collision(ball_menu, self._left_paddle, self._right_paddle)
+        # Walls (full screen height) and preview paddles
+        resolve_contacts(ball_menu, self._left_paddle, self._right_paddle, 'physics')
 
         # Reset ball if it exits the preview area (past the paddles)
         bx = ball_menu.pos[0]
@@ -370,6 +374,8 @@ class SettingsMenu:
 
         elif option == 'power_ups_enabled':
             self.settings.power_ups_enabled = not self.settings.power_ups_enabled
+        elif option == 'multiball_chaos':
+            self.settings.multiball_chaos = not self.settings.multiball_chaos
         elif option == 'cursed_events_enabled':
             self.settings.cursed_events_enabled = not self.settings.cursed_events_enabled
         elif option == 'goal_net_enabled':
@@ -488,6 +494,7 @@ class SettingsMenu:
             'right_paddle_color': 'R. Paddle',
             'background_color': 'BG Color',
             'power_ups_enabled': 'Power-Ups',
+            'multiball_chaos': 'Chaos Balls',
             'cursed_events_enabled': 'Cursed Evt',
             'goal_net_enabled': 'Goal Nets',
             'goal_net_size': 'Net Size',
@@ -529,6 +536,8 @@ class SettingsMenu:
                 value_display = f"< {value} >"
             elif option == 'power_ups_enabled':
                 value_display = "< ON >" if self.settings.power_ups_enabled else "< OFF >"
+            elif option == 'multiball_chaos':
+                value_display = "< ON >" if self.settings.multiball_chaos else "< OFF >"
             elif option == 'cursed_events_enabled':
                 value_display = "< ON >" if self.settings.cursed_events_enabled else "< OFF >"
             elif option == 'goal_net_enabled':
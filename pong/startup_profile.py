@@ -0,0 +1,232 @@
+"""
+startup_profile.py -- Cold-start timing for launcher.py --profile-startup.
+
+Times everything between the launcher starting and the first menu frame
+being presented, as a tree of spans:
+
+  - every module import (find + load + module body, nested like the imports
+    themselves, similar to python -X importtime)
+  - named spans placed around the expensive steps: font loading in
+    pong/constants.py, mixer init and per-sound synthesis in SoundManager,
+    GameSettings.load, window creation, and the first menu frame
+
+finish() prints a report sorted by self time and writes the tree as folded
+stacks ("launcher;import pong;fonts 1234", microseconds), the input format
+of flamegraph.pl, speedscope and inferno, to recordings/startup-<time>.folded.
+
+This module imports only the standard library, so it can be started before
+pygame. Inactive (the default), span() returns a shared no-op context.
+"""
+
+import contextlib
+import importlib.abc
+import os
+import sys
+import time
+
+REPORT_ROWS = 25
+RECORDINGS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'recordings')
+
+_NULL = contextlib.nullcontext()
+
+
+class _Node:
+    """One span name at one position in the tree; repeated entries accumulate."""
+
+    __slots__ = ('name', 'children', 'total', 'calls')
+
+    def __init__(self, name):
+        self.name = name
+        self.children = {}
+        self.total = 0.0
+        self.calls = 0
+
+    @property
+    def self_time(self):
+        return self.total - sum(c.total for c in self.children.values())
+
+
+class StartupProfiler:
+    """Span tree rooted at `root`; the open spans are on a stack."""
+
+    def __init__(self, root='launcher'):
+        self.root = _Node(root)
+        self._t0 = time.perf_counter()
+        self._stack = [self.root]
+        self._starts = [self._t0]
+        self._last_top = self._t0
+
+    def push(self, name):
+        node = self._stack[-1].children.get(name)
+        if node is None:
+            node = self._stack[-1].children[name] = _Node(name)
+        self._stack.append(node)
+        self._starts.append(time.perf_counter())
+
+    def pop(self, count=True):
+        now = time.perf_counter()
+        node = self._stack.pop()
+        node.total += now - self._starts.pop()
+        node.calls += count
+        if len(self._stack) == 1:
+            self._last_top = now
+
+    @contextlib.contextmanager
+    def span(self, name, count=True):
+        self.push(name)
+        try:
+            yield
+        finally:
+            self.pop(count)
+
+    def close(self, last_span):
+        """Charge the time since the last top-level span to `last_span` and stop the clock."""
+        now = time.perf_counter()
+        node = self.root.children.setdefault(last_span, _Node(last_span))
+        node.total += now - self._last_top
+        node.calls += 1
+        self.root.total = now - self._t0
+
+    # -------------------- Output --------------------
+
+    def _walk(self, node=None, path=()):
+        node = node or self.root
+        path = path + (node.name,)
+        yield path, node
+        for child in node.children.values():
+            yield from self._walk(child, path)
+
+    def folded(self):
+        """Folded-stack lines, self time in microseconds."""
+        lines = []
+        for path, node in self._walk():
+            us = int(round(node.self_time * 1e6))
+            if us > 0:
+                lines.append(f"{';'.join(path)} {us}")
+        return lines
+
+    def report(self, rows=REPORT_ROWS):
+        """Top-level phases in order, then the spans with the most self time."""
+        total_ms = self.root.total * 1000.0
+        out = [f"Startup: {total_ms:.1f} ms to the first menu frame", '',
+               f"{'phase':<40}{'total ms':>10}{'share':>8}"]
+        for node in self.root.children.values():
+            out.append(f"{node.name:<40}{node.total * 1000:>10.1f}"
+                       f"{node.total * 100 / self.root.total:>7.1f}%")
+        out.append(f"{'(launcher code between phases)':<40}{self.root.self_time * 1000:>10.1f}")
+        out += ['', f"{'self ms':>9}{'total ms':>10}  span (top {rows} by self time)"]
+        nodes = sorted((n for _, n in self._walk() if n is not self.root),
+                       key=lambda n: n.self_time, reverse=True)
+        for node in nodes[:rows]:
+            calls = f"  x{node.calls}" if node.calls > 1 else ''
+            out.append(f"{node.self_time * 1000:>9.2f}{node.total * 1000:>10.2f}  {node.name}{calls}")
+        return out
+
+
+class _TimedLoader:
+    """Loader proxy charging module creation and execution to the import's span."""
+
+    def __init__(self, loader, name):
+        self._loader = loader
+        self._name = name
+
+    def create_module(self, spec):
+        # Extension modules are loaded (dlopen + init) here
+        with _span(self._name, count=False):
+            return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        try:
+            with _span(self._name, count=False):
+                self._loader.exec_module(module)
+        finally:
+            # Hand the real loader back so nothing later sees the proxy
+            module.__loader__ = self._loader
+            if getattr(module, '__spec__', None) is not None:
+                module.__spec__.loader = self._loader
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """First meta path entry: times the other finders and wraps their loaders."""
+
+    def find_spec(self, fullname, path, target=None):
+        name = f"import {fullname}"
+        with span(name):
+            for finder in sys.meta_path:
+                find = getattr(finder, 'find_spec', None)
+                if finder is self or find is None:
+                    continue
+                spec = find(fullname, path, target)
+                if spec is None:
+                    continue
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, name)
+                return spec
+        return None
+
+
+# -------------------- Module-level profiler --------------------
+
+_active = None
+_importer = None
+
+
+def active():
+    """True while startup is being profiled."""
+    return _active is not None
+
+
+def start():
+    """Start the clock and begin timing imports."""
+    global _active, _importer
+    if _active is not None:
+        return
+    _active = StartupProfiler()
+    _importer = _ImportTimer()
+    sys.meta_path.insert(0, _importer)
+
+
+def span(name):
+    """Context manager timing a named startup step (no-op unless profiling)."""
+    return _span(name)
+
+
+def _span(name, count=True):
+    if _active is None:
+        return _NULL
+    return _active.span(name, count)
+
+
+def finish(last_span='first menu frame', path=None):
+    """
+    Stop profiling, print the report and write the folded stacks.
+
+    The time since the last top-level span is charged to `last_span`.
+    No-op unless profiling, so it can sit in the menu loop.
+
+    Returns:
+        The folded-stack path written, or None.
+    """
+    global _active, _importer
+    if _active is None:
+        return None
+    prof, _active = _active, None
+    if _importer in sys.meta_path:
+        sys.meta_path.remove(_importer)
+    _importer = None
+    prof.close(last_span)
+
+    print('\n'.join(prof.report()), flush=True)
+    try:
+        if path is None:
+            os.makedirs(RECORDINGS_DIR, exist_ok=True)
+            path = os.path.join(RECORDINGS_DIR, time.strftime('startup-%Y%m%d-%H%M%S.folded'))
+        with open(path, 'w') as f:
+            f.write('\n'.join(prof.folded()) + '\n')
+    except OSError:
+        return None
+    print(f"\nFlame graph input (folded stacks): {path}", flush=True)
+    return path
@@ -93,6 +93,10 @@ class TouchHandler:
         """Check if the in-game PAUSE button was tapped."""
         return self.tapped_in(PAUSE_BTN)
 
+    @property
+    def has_ripples(self):
+        return bool(self._ripples)
+
     def update_ripples(self):
         """Age ripple effects. Call once per frame."""
         for r in self._ripples:
@@ -5,8 +5,10 @@ utilities.py -- File for containing all environment and design methods for the g
 import pygame
 import numpy as np
 from pong.constants import *
+from pong.render_cache import render_text, static_layer
 
-def draw(win, paddles, ball, left_score, right_score, score_font, bg_color=BLACK, offset=(0, 0), hide_ball=False, screen_w=None, screen_h=None):
+def draw(win, paddles, ball, left_score, right_score, score_font, bg_color=BLACK, offset=(0, 0), hide_ball=False, screen_w=None, screen_h=None,
+         scale=1.0, scores=True):
     """
     Renders all visual game elements to the window.
 
@@ -20,32 +22,48 @@ def draw(win, paddles, ball, left_score, right_score, score_font, bg_color=BLACK
         bg_color (tuple): RGB background color.
         screen_w (int|None): Override screen width (for Cursed mode larger arena).
         screen_h (int|None): Override screen height.
+        scale (float): Internal render scale (pong.render_scale); win is
+            then the smaller world target.
+        scores (bool): Draw the scores too. Pass False when win is a scaled
+            world target and call draw_scores() on the window afterwards.
     """
     W = screen_w or WIDTH
     H = screen_h or HEIGHT
-    win.fill(bg_color)
 
-    # Draw scores
-    left_score_text = score_font.render(f"{left_score}", True, LIGHT_PURPLE)
-    right_score_text = score_font.render(f"{right_score}", True, LIGHT_PURPLE)
-    win.blit(left_score_text, (W // 4 - left_score_text.get_width() // 2, 20))
-    win.blit(right_score_text, (W * 3 // 4 - right_score_text.get_width() // 2, 20))
+    # Background fill + dashed net, composited once per (size, color)
+    size = (round(W * scale), round(H * scale))
+    win.blit(static_layer(('court', tuple(bg_color), scale), size,
+                          lambda surf: _build_court(surf, bg_color, scale)), (0, 0))
+
+    if scores:
+        draw_scores(win, left_score, right_score, score_font, W)
 
     # Draw paddles and ball
     for paddle in paddles:
-        paddle.draw(win)
+        paddle.draw(win, scale)
     if not hide_ball:
-        ball.draw(win)
+        ball.draw(win, scale)
+
+def draw_scores(win, left_score, right_score, score_font, screen_w=None):
+    """Draw both scores at native resolution."""
+    W = screen_w or WIDTH
+    left_score_text = render_text(score_font, f"{left_score}", LIGHT_PURPLE)
+    right_score_text = render_text(score_font, f"{right_score}", LIGHT_PURPLE)
+    win.blit(left_score_text, (W // 4 - left_score_text.get_width() // 2, 20))
+    win.blit(right_score_text, (W * 3 // 4 - right_score_text.get_width() // 2, 20))
 
-    # Draw dashed net
-    net_width = 6
-    net_height = 28
-    gap = 18
+def _build_court(surf, bg_color, scale=1.0):
+    """Paint the static court: background color and the dashed center net."""
+    W, H = surf.get_size()
+    surf.fill(bg_color)
+    net_width = max(1, round(6 * scale))
+    net_height = max(1, round(28 * scale))
+    gap = round(18 * scale)
     net_segment = pygame.Surface((net_width, net_height), pygame.SRCALPHA)
     net_segment.fill(LIGHT_PURPLE)
     net_segment.set_alpha(120)
     for y in range(0, H, net_height + gap):
-        win.blit(net_segment, (W // 2 - net_width // 2, y))
+        surf.blit(net_segment, (W // 2 - net_width // 2, y))
 
 def reset(ball, left_paddle, right_paddle):
     """
@@ -65,46 +83,3 @@ def handle_score(ball, left_score, right_score, screen_w=None):
         left_score = left_score + 1
         ball.reset()
     return left_score, right_score
-    
-"""
-physics_objects_classic -- Section containing all physics methods for the game objects collision and movement.
-"""
-
-def handle_ball_collision(ball, left_paddle, right_paddle, board_height):
-    if ball.pos[1] + ball.radius >= board_height: # Check if the ball has reached the bottom of the board
-        ball.vel[1] *= -1 # Changing the ball bouncing direction downwards
-    elif ball.pos[1] - ball.radius <= 0: # Check if the ball has reached the top of the board
-        ball.vel[1] *= -1 # Changing the ball bouncing direction downwards
-    
-    # Ball is moving to the left
-    if ball.vel[0] < 0:
-        # Ball is in the left paddle height range
-        if ball.pos[1] >= left_paddle.pos[1] and ball.pos[1] <= left_paddle.pos[1] + left_paddle.height:
-            # Ball is in the left paddle width range
-            if ball.pos[0] - ball.radius <= left_paddle.pos[0] + left_paddle.width:
-                # Collision! Changing the ball direction to the left
-                ball.vel[0] *= -1
-
-                # Vertical movement logic
-                middle_y = left_paddle.pos[1] + left_paddle.height / 2
-                difference_in_y = middle_y - ball.pos[1]
-                reduction_factor = (left_paddle.height / 2) / abs(ball.vel[0]) # !!
-                y_vel = difference_in_y / reduction_factor
-                ball.vel[1] = max(-MAX_DEFLECTION_SPEED, min(MAX_DEFLECTION_SPEED, -1 * y_vel))
-
-    # Ball is moving to the right
-    if ball.vel[0] > 0:
-        # Ball is in the right paddle height range
-        if ball.pos[1] >= right_paddle.pos[1] and ball.pos[1] <= right_paddle.pos[1] + right_paddle.height:
-            # Ball is in the right paddle width range
-            if ball.pos[0] + ball.radius >= right_paddle.pos[0]:
-                # Collision! Changing the ball direction to the left
-                ball.vel[0] *= -1
-
-                # Vertical movement logic
-                middle_y = right_paddle.pos[1] + right_paddle.height / 2
-                difference_in_y = middle_y - ball.pos[1]
-                reduction_factor = (right_paddle.height / 2) / abs(ball.vel[0]) # !!
-                y_vel = difference_in_y / reduction_factor
-                ball.vel[1] = max(-MAX_DEFLECTION_SPEED, min(MAX_DEFLECTION_SPEED, -1 * y_vel))
-# End of handle_ball_collision()
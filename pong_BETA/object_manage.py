@@ -3,7 +3,9 @@ object_manage.py -- Handles objects general behavior, methods and monitoring.
 """
 
 import math
+import time
 from pong.constants import *
+from pong.render_cache import render_text, static_layer
 from pong.physics_object import *
 
 INFO_W = 280            # right-side debug panel width
@@ -17,6 +19,22 @@ IMPULSE   = 260.0       # Q/E/F impulses (N·s≈px*kg/s)
 FIXED_DT  = 1/120       # physics step
 REST_E    = 0.90        # bouncy walls in play area
 
+# Object-object contacts
+CONTACT_E      = 0.60   # restitution between bodies
+CONTACT_REST_V = 40.0   # px/s; slower impacts don't bounce (quiet piles)
+CONTACT_SLOP   = 0.5    # px of allowed penetration before correction
+CONTACT_BIAS   = 0.2    # fraction of penetration pushed out per step
+CONTACT_WARM   = 0.9    # share of last step's impulse reused as a warm start
+SOLVER_ITERS   = 4      # impulse passes per step
+_HASH_P1, _HASH_P2 = 73856093, 19349663   # spatial hash primes
+
+# Stress mode (VectorWorld)
+STRESS_START   = 1000   # bodies spawned when stress mode opens
+STRESS_STEP    = 250    # bodies added/removed per keypress
+STRESS_MAX     = 8000
+STRESS_SIZE    = 10     # box side / ball diameter (px)
+STRESS_COLORS  = [WHITE, LIGHT_PURPLE, PURPLE, GOLD, ORANGE, LIGHT_GREEN, TOMATO]
+
 # Fonts — use file-based fonts (SysFont not available on WASM/Pygbag)
 FONT_INFO = FONT_SMALL_DIGITAL
 FONT_HEAD = FONT_DEFAULT_DIGITAL
@@ -61,75 +79,837 @@ class Box(PhysicsObject):
 
         return bounced
 
-def _draw_grid(surface):
+class Circle(PhysicsObject):
+    def __init__(self, pos=(PLAY_W/2, HEIGHT/2), radius=12, **kw):
+        super().__init__(pos=pos, **kw)
+        self.radius = radius
+
+    def draw(self, surf):
+        pygame.draw.circle(surf, self.color, (int(self.pos[0]), int(self.pos[1])), int(self.radius))
+
+    def play_bounds_bounce(self, origin=(0,0), size=(PLAY_W, HEIGHT), e=1.0):
+        return self.bounce_in_rect(origin, size, e=e, radius=self.radius)
+
+def _build_grid(surface):
+    surface.fill(BG_PLAY)
     # light grid for visual sense of speed/acc
     for x in range(0, PLAY_W, 40):
         pygame.draw.line(surface, GRID, (x,0), (x,HEIGHT), 1)
     for y in range(0, HEIGHT, 40):
         pygame.draw.line(surface, GRID, (0,y), (PLAY_W,y), 1)
 
-def _draw_info(surface, box, damping, max_speed, gravity_on):
+def _draw_grid(surface):
+    """Play-area background (fill + grid), from a cached layer."""
+    surface.blit(static_layer(('beta_grid', BG_PLAY, GRID), (PLAY_W, HEIGHT), _build_grid), (0, 0))
+
+def _draw_info(surface, box, damping, max_speed, gravity_on, perf=None, world=None):
+    """
+    Right-hand panel. Shows the single box's state, or the stress world's
+    when `world` is given. `perf` is a dict of timings/counters
+    (step_ms, render_ms, pairs, contacts, broad_phase) to report.
+    """
     panel = pygame.Rect(PLAY_W, 0, INFO_W, HEIGHT)
     pygame.draw.rect(surface, BG_INFO, panel)
 
     def line(y, text, head=False):
         font = FONT_HEAD if head else FONT_INFO
-        s = font.render(text, True, LIGHT_PURPLE if head else WHITE)
+        s = render_text(font, text, LIGHT_PURPLE if head else WHITE)
         surface.blit(s, (PLAY_W + 16, y))
 
     line(16, "BETA Physics Sandbox", head=True)
     y = 56
-    v = box.vel
-    p = box.momentum
-    speed = float(np.linalg.norm(v))
-    pmag  = float(np.linalg.norm(p))
-    r, th = box.polar
-
-    stats = [
-        f"pos: ({box.pos[0]:7.2f}, {box.pos[1]:7.2f})",
-        f"vel: ({v[0]:7.2f}, {v[1]:7.2f})  |speed|={speed:7.2f}",
-        f"mom: ({p[0]:7.2f}, {p[1]:7.2f})  |P|={pmag:7.2f}",
-        f"polar: r={r:7.2f}, θ={math.degrees(th):7.2f}°",
-        f"mass: {box.mass:.2f}",
-        f"damping: {damping:.3f}/s",
-        f"max_speed: {max_speed if max_speed else '∞'}",
-        f"gravity: {'ON' if gravity_on else 'OFF'}  g={box.gravity}",
-        f"restitution: {REST_E}",
-    ]
+
+    if world is not None:
+        stats = [
+            f"bodies: {len(world)}  ({world.box_count} box / {world.ball_count} ball)",
+            f"gravity: {'ON' if gravity_on else 'OFF'}",
+            f"damping: {world.damping:.3f}/s",
+            f"restitution: {world.solver.restitution}  walls: {REST_E}",
+            f"solver iters: {world.solver.iterations}",
+        ]
+    else:
+        v = box.vel
+        p = box.momentum
+        speed = float(np.linalg.norm(v))
+        pmag  = float(np.linalg.norm(p))
+        r, th = box.polar
+        stats = [
+            f"pos: ({box.pos[0]:7.2f}, {box.pos[1]:7.2f})",
+            f"vel: ({v[0]:7.2f}, {v[1]:7.2f})  |speed|={speed:7.2f}",
+            f"mom: ({p[0]:7.2f}, {p[1]:7.2f})  |P|={pmag:7.2f}",
+            f"polar: r={r:7.2f}, θ={math.degrees(th):7.2f}°",
+            f"mass: {box.mass:.2f}",
+            f"damping: {damping:.3f}/s",
+            f"max_speed: {max_speed if max_speed else '∞'}",
+            f"gravity: {'ON' if gravity_on else 'OFF'}  g={box.gravity}",
+            f"restitution: {REST_E}",
+        ]
     for s in stats:
         line(y, s); y += 24
 
+    if perf:
+        y += 8
+        line(y, "Performance:", head=True); y += 32
+        perf_lines = [
+            f"step: {perf.get('step_ms', 0.0):6.2f} ms  x{perf.get('steps', 0)}/frame",
+            f"render: {perf.get('render_ms', 0.0):6.2f} ms",
+        ]
+        if 'pairs' in perf:
+            perf_lines += [
+                f"broad phase: {perf.get('broad_phase', '-')}",
+                f"pairs: {perf['pairs']}  contacts: {perf.get('contacts', 0)}",
+            ]
+        for s in perf_lines:
+            line(y, s); y += 24
+
     y += 8
     line(y, "Controls:", head=True); y += 32
-    help_lines = [
-        "Arrows: apply force",
-        "Q/E: impulse (-x/+x)",
-        "W/S: impulse (-y/+y)",
-        "G: toggle gravity",
-        "+/-: damping up/down",
-        "[/]: max_speed up/down",
-        "M/,: mass up/down",
-        "R: reset box",
-        "ESC: back to menu",
-    ]
+    if world is not None:
+        help_lines = [
+            "Arrows: push everything",
+            "1/2: fewer/more bodies",
+            "P: grid / sweep-and-prune",
+            "G: toggle gravity",
+            "R: respawn",
+            "T: back to single box",
+            "ESC: back to menu",
+        ]
+    else:
+        help_lines = [
+            "Arrows: apply force",
+            "Q/E: impulse (-x/+x)",
+            "W/S: impulse (-y/+y)",
+            "G: toggle gravity",
+            "+/-: damping up/down",
+            "[/]: max_speed up/down",
+            "M/,: mass up/down",
+            "R: reset box",
+            "T: stress mode",
+            "ESC: back to menu",
+        ]
     for s in help_lines:
         line(y, s); y += 22
 
-class ObjectsManage:
+# -------------------- Collisions --------------------
+
+class SpatialHash:
+    """
+    Uniform-grid broad phase. Every body is bucketed into the cells its AABB
+    touches; only bodies sharing a bucket become candidate pairs.
+
+    Cells are hashed (not indexed into a fixed grid), so bodies that leave
+    the play area still work. cell_size=None picks the largest body diameter.
+    """
+    name = "grid"
+
+    def __init__(self, cell_size=None):
+        self.cell_size = cell_size
+        self.pair_count = 0
+
+    def query_pairs(self, pos, half):
+        """Return (i, j) index arrays, i < j, of bodies whose AABBs overlap."""
+        n = len(pos)
+        if n < 2:
+            self.pair_count = 0
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+        cell = self.cell_size or max(1.0, 2.0 * float(half.max()))
+        lo = np.floor((pos - half) / cell).astype(np.int64)
+        hi = np.floor((pos + half) / cell).astype(np.int64)
+        span = hi - lo
+
+        # (cell key, cell, body) entries; bodies up to cell size touch at most 2x2 cells
+        keys, cxs, cys, bodies = [], [], [], []
+        idx = np.arange(n)
+        for ox in range(int(span[:, 0].max()) + 1):
+            for oy in range(int(span[:, 1].max()) + 1):
+                m = (span[:, 0] >= ox) & (span[:, 1] >= oy)
+                cx = lo[m, 0] + ox
+                cy = lo[m, 1] + oy
+                keys.append((cx * _HASH_P1) ^ (cy * _HASH_P2))
+                cxs.append(cx)
+                cys.append(cy)
+                bodies.append(idx[m])
+        keys = np.concatenate(keys)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        cxs = np.concatenate(cxs)[order]
+        cys = np.concatenate(cys)[order]
+        bodies = np.concatenate(bodies)[order]
+
+        # Pair every entry with the following ones in the same cell. A pair
+        # sharing several cells is only reported from the cell holding the
+        # top-left corner of the overlap of its cell ranges (so no unique()
+        # pass), and the cell compare also drops hash collisions.
+        pi, pj = [], []
+        k = 1
+        while k < len(keys):
+            same = keys[k:] == keys[:-k]
+            if not same.any():
+                break
+            a, b = bodies[:-k][same], bodies[k:][same]
+            cx, cy = cxs[k:][same], cys[k:][same]
+            home = ((cxs[:-k][same] == cx) & (cys[:-k][same] == cy)
+                    & (cx == np.maximum(lo[a, 0], lo[b, 0]))
+                    & (cy == np.maximum(lo[a, 1], lo[b, 1])))
+            pi.append(a[home])
+            pj.append(b[home])
+            k += 1
+        if not pi:
+            self.pair_count = 0
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+        i = np.concatenate(pi)
+        j = np.concatenate(pj)
+        self.pair_count = len(i)
+        return _aabb_filter(pos, half, np.minimum(i, j), np.maximum(i, j))
+
+class SweepAndPrune:
     """
-    A class for managing the game objects
+    Sweep-and-prune broad phase on the x axis. Bodies are kept sorted by the
+    left edge of their interval between steps; since bodies move a little
+    per step the order is nearly sorted already and an insertion sort
+    repairs it in close to O(n). Pairs are bodies whose x-intervals overlap
+    (then filtered on y).
+
+    Works best when bodies are spread along x; a pile that is tall in y
+    puts whole columns into the same x-interval.
     """
+    name = "sap"
+
+    # Above this many out-of-order entries a full (stable) sort is cheaper
+    RESORT_FRACTION = 0.25
+
     def __init__(self):
+        self.pair_count = 0
+        self.swaps = 0
+        self._order = None
+
+    def reset(self):
+        self._order = None
+
+    def _sort(self, lo_x):
+        """Update the persistent order for this step's interval starts."""
+        n = len(lo_x)
+        if self._order is None or len(self._order) != n:
+            self._order = np.argsort(lo_x, kind="stable")
+            self.swaps = n
+            return
+        keys = lo_x[self._order]
+        bad = np.nonzero(keys[1:] < keys[:-1])[0]
+        if len(bad) == 0:
+            self.swaps = 0
+            return
+        if len(bad) > n * self.RESORT_FRACTION:
+            # Big reshuffle (teleport, explosion): the stable sort still
+            # runs fast on partially ordered input
+            self._order = self._order[np.argsort(keys, kind="stable")]
+            self.swaps = len(bad)
+            return
+        order = self._order.tolist()
+        keys = keys.tolist()
+        swaps = 0
+        for k in range(int(bad[0]) + 1, n):
+            key = keys[k]
+            if key >= keys[k - 1]:
+                continue
+            body = order[k]
+            m = k - 1
+            while m >= 0 and keys[m] > key:
+                keys[m + 1] = keys[m]
+                order[m + 1] = order[m]
+                m -= 1
+                swaps += 1
+            keys[m + 1] = key
+            order[m + 1] = body
+        self._order = np.array(order, dtype=np.intp)
+        self.swaps = swaps
+
+    def query_pairs(self, pos, half):
+        """Return (i, j) index arrays, i < j, of bodies whose AABBs overlap."""
+        n = len(pos)
+        if n < 2:
+            self.pair_count = 0
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+        lo_x = pos[:, 0] - half[:, 0]
+        hi_x = pos[:, 0] + half[:, 0]
+        self._sort(lo_x)
+        order = self._order
+        s_lo = lo_x[order]
+        s_hi = hi_x[order]
+
+        # Every body overlaps the ones after it whose interval starts before it ends
+        end = np.searchsorted(s_lo, s_hi, side="left")
+        count = end - np.arange(n) - 1
+        np.maximum(count, 0, out=count)
+        total = int(count.sum())
+        self.pair_count = total
+        if total == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+        first = np.repeat(np.arange(n), count)
+        # offset of each pair within its run: 1, 2, ..., count
+        starts = np.cumsum(count) - count
+        step = np.arange(total) - np.repeat(starts, count) + 1
+        a = order[first]
+        b = order[first + step]
+        return _aabb_filter(pos, half, np.minimum(a, b), np.maximum(a, b))
+
+BROAD_PHASES = {
+    SpatialHash.name: SpatialHash,
+    SweepAndPrune.name: SweepAndPrune,
+}
+
+def _aabb_filter(pos, half, i, j):
+    d = np.abs(pos[j] - pos[i])
+    hit = np.all(d < half[i] + half[j], axis=1)
+    return i[hit], j[hit]
+
+def _narrow_phase(pos, half, radius, is_circle, i, j):
+    """
+    Contact normals (pointing i -> j) and penetration depths for candidate
+    pairs. Box/circle pairs must be ordered box first. Returns a mask of
+    touching pairs, normals and depths.
+    """
+    d = pos[j] - pos[i]
+    n = np.zeros_like(d)
+    depth = np.zeros(len(i))
+    ci = is_circle[i]
+    cj = is_circle[j]
+
+    # box / box: separate along the axis of least overlap
+    bb = ~ci & ~cj
+    if bb.any():
+        ov = half[i[bb]] + half[j[bb]] - np.abs(d[bb])
+        axis = np.argmin(ov, axis=1)
+        rows = np.arange(len(axis))
+        nb = np.zeros_like(ov)
+        nb[rows, axis] = np.where(d[bb][rows, axis] < 0, -1.0, 1.0)
+        n[bb] = nb
+        depth[bb] = ov[rows, axis]
+
+    # circle / circle
+    cc = ci & cj
+    if cc.any():
+        dd = d[cc]
+        dist = np.hypot(dd[:, 0], dd[:, 1])
+        safe = np.where(dist > 1e-9, dist, 1.0)
+        nc = dd / safe[:, None]
+        nc[dist <= 1e-9] = (1.0, 0.0)
+        n[cc] = nc
+        depth[cc] = radius[i[cc]] + radius[j[cc]] - dist
+
+    # box / circle: closest point on the box to the circle centre
+    bc = ~ci & cj
+    if bc.any():
+        hb = half[i[bc]]
+        dd = d[bc]
+        r = radius[j[bc]]
+        closest = np.clip(dd, -hb, hb)
+        diff = dd - closest
+        dist = np.hypot(diff[:, 0], diff[:, 1])
+        outside = dist > 1e-9
+        nc = np.zeros_like(dd)
+        dep = np.zeros(len(dd))
+        nc[outside] = diff[outside] / dist[outside, None]
+        dep[outside] = r[outside] - dist[outside]
+        # centre inside the box: push out through the nearest face
+        inside = ~outside
+        if inside.any():
+            face = hb[inside] - np.abs(dd[inside])
+            axis = np.argmin(face, axis=1)
+            rows = np.arange(len(axis))
+            ni = np.zeros_like(face)
+            ni[rows, axis] = np.where(dd[inside][rows, axis] < 0, -1.0, 1.0)
+            nc[inside] = ni
+            dep[inside] = face[rows, axis] + r[inside]
+        n[bc] = nc
+        depth[bc] = dep
+
+    return depth > 0.0, n, depth
+
+def _color_pairs(i, j, n_bodies):
+    """
+    Split pairs into batches where no body appears twice, so each batch can
+    be solved in one vectorized pass and still behave like a sequential
+    (Gauss-Seidel) solver. Returns a list of index arrays into i/j.
+
+    Every batch is grown until no remaining pair fits (a maximal matching),
+    so the batch count stays near the largest number of contacts on one
+    body whatever order the broad phase reported the pairs in. Each batch
+    costs a fixed handful of numpy calls per solver iteration.
+    """
+    batches = []
+    left = np.arange(len(i))
+    first = np.empty(n_bodies, dtype=np.intp)
+    used = np.zeros(n_bodies, dtype=bool)
+    free = np.ones(len(i), dtype=bool)
+    while len(left):
+        used[:] = False
+        cand = left
+        taken = []
+        while len(cand):
+            # Take every pair that comes first for both of its bodies, then
+            # drop the pairs touching a body that was just taken
+            li, lj = i[cand], j[cand]
+            first[li] = len(cand)
+            first[lj] = len(cand)
+            order = np.arange(len(cand))
+            np.minimum.at(first, li, order)
+            np.minimum.at(first, lj, order)
+            take = (first[li] == order) & (first[lj] == order)
+            taken.append(cand[take])
+            used[li[take]] = True
+            used[lj[take]] = True
+            cand = cand[~(used[li] | used[lj])]
+        batch = np.concatenate(taken)
+        batches.append(batch)
+        free[batch] = False
+        left = left[free[left]]
+    return batches
+
+def _wall_contacts(pos, half, bounds):
+    """
+    Contacts between bodies and the four walls of bounds=(origin, size).
+    Returns body indices, wall ids (0..3), outward normals and depths.
+    """
+    (x0, y0), (w, h) = bounds
+    gaps = (
+        (x0 - (pos[:, 0] - half[:, 0]), (-1.0, 0.0)),       # left
+        ((pos[:, 0] + half[:, 0]) - (x0 + w), (1.0, 0.0)),  # right
+        (y0 - (pos[:, 1] - half[:, 1]), (0.0, -1.0)),       # top
+        ((pos[:, 1] + half[:, 1]) - (y0 + h), (0.0, 1.0)),  # bottom
+    )
+    body, wall, n, depth = [], [], [], []
+    for wid, (depth_w, normal) in enumerate(gaps):
+        # small margin keeps resting contacts alive between steps
+        near = np.nonzero(depth_w > -CONTACT_SLOP)[0]
+        body.append(near)
+        wall.append(np.full(len(near), wid))
+        n.append(np.tile(normal, (len(near), 1)))
+        depth.append(depth_w[near])
+    return (np.concatenate(body), np.concatenate(wall),
+            np.concatenate(n), np.concatenate(depth))
+
+def _clamp_to_bounds(pos, vel, half, bounds, e):
+    """Keep bodies inside bounds=(origin, size), reflecting velocity at walls."""
+    (x0, y0), (w, h) = bounds
+    lo = np.array((x0, y0)) + half
+    hi = np.array((x0 + w, y0 + h)) - half
+    below = pos < lo
+    above = pos > hi
+    if (below | above).any():
+        np.clip(pos, lo, hi, out=pos)
+        into = (below & (vel < 0.0)) | (above & (vel > 0.0))
+        vel[into] *= -e
+
+class ContactSolver:
+    """
+    Sequential-impulse contact solver, batched with numpy.
+
+    Every step: narrow phase on the broad-phase pairs, wall contacts against
+    the bounds, then `iterations` passes of clamped, accumulated normal
+    impulses. Pairs are graph-coloured into independent batches so each pass
+    is a handful of vectorized updates rather than a Python loop per pair.
+    Accumulated impulses are kept between steps (warm starting), which is
+    what lets tall piles hold their shape at a few iterations.
+    """
+
+    def __init__(self, restitution=CONTACT_E, wall_restitution=REST_E,
+                 iterations=SOLVER_ITERS):
+        self.restitution = restitution
+        self.wall_restitution = wall_restitution
+        self.iterations = iterations
+        self.contact_count = 0
+        self._warm_keys = np.empty(0, dtype=np.int64)
+        self._warm_imp = np.empty(0)
+        self._warm_n = -1
+
+    def reset(self):
+        """Forget cached impulses (call when bodies are added or removed)."""
+        self._warm_keys = np.empty(0, dtype=np.int64)
+        self._warm_imp = np.empty(0)
+        self._warm_n = -1
+
+    def solve(self, pos, vel, inv_mass, half, radius, is_circle, i, j, dt, bounds=None):
+        """Resolve contacts in place on pos/vel. Returns the touching pair count."""
+        nb = len(pos)
+
+        # Box first in mixed pairs so the narrow phase only needs one orientation
+        swap = is_circle[i] & ~is_circle[j]
+        i, j = np.where(swap, j, i), np.where(swap, i, j)
+        hit, n, depth = _narrow_phase(pos, half, radius, is_circle, i, j)
+        hit &= (inv_mass[i] + inv_mass[j]) > 0.0
+        i, j, n, depth = i[hit], j[hit], n[hit], depth[hit]
+        self.contact_count = len(i)
+        e = np.full(len(i), self.restitution)
+        keys = i.astype(np.int64) * nb + j
+
+        # Walls are contacts against a static body appended at index nb
+        if bounds is not None:
+            wb, wid, wn, wd = _wall_contacts(pos, half, bounds)
+            i = np.concatenate((i, wb))
+            j = np.concatenate((j, np.full(len(wb), nb)))
+            n = np.concatenate((n, wn)) if len(n) else wn
+            depth = np.concatenate((depth, wd))
+            e = np.concatenate((e, np.full(len(wb), self.wall_restitution)))
+            keys = np.concatenate((keys, nb * nb + wb.astype(np.int64) * 4 + wid))
+        if len(i) == 0:
+            self.reset()
+            return 0
+
+        vel_x = np.vstack((vel, np.zeros((1, 2))))
+        im = np.append(inv_mass, 0.0)
+        im_i = im[i]
+        im_j = im[j]
+        k_inv = 1.0 / (im_i + im_j)
+
+        # Target separating speed: bounce for fast impacts, Baumgarte bias
+        # to push out penetration otherwise
+        vn0 = np.einsum("ij,ij->i", vel_x[j] - vel_x[i], n)
+        bounce = np.where(vn0 < -CONTACT_REST_V, -e * vn0, 0.0)
+        bias = CONTACT_BIAS / dt * np.maximum(depth - CONTACT_SLOP, 0.0)
+        target = np.maximum(bounce, bias)
+
+        # Warm start from last step's impulses on persisting contacts
+        acc = np.zeros(len(i))
+        if self._warm_n == nb and len(self._warm_keys):
+            at = np.searchsorted(self._warm_keys, keys)
+            at = np.minimum(at, len(self._warm_keys) - 1)
+            found = self._warm_keys[at] == keys
+            acc[found] = self._warm_imp[at[found]] * CONTACT_WARM
+            imp = n * acc[:, None]
+            np.add.at(vel_x, i, -imp * im_i[:, None])
+            np.add.at(vel_x, j, imp * im_j[:, None])
+
+        # The static wall body never conflicts with itself when colouring.
+        # Colour in key order: sweep-and-prune reports pairs in x order,
+        # which chains neighbours together and makes the colouring crawl
+        j_col = np.where(j == nb, nb + 1 + np.arange(len(j)), j)
+        by_key = np.argsort(keys)
+        batches = _color_pairs(i[by_key], j_col[by_key], nb + 1 + len(j))
+
+        # Lay contacts out batch after batch so every batch is a plain slice,
+        # and cut the per-batch views once: an iteration is then only the
+        # gathers, arithmetic and scatters on flat x/y velocity arrays
+        perm = by_key[np.concatenate(batches)]
+        i, j, keys, acc = i[perm], j[perm], keys[perm], acc[perm]
+        nx, ny = n[perm, 0], n[perm, 1]
+        rows = (i, j, nx, ny, target[perm], k_inv[perm],
+                nx * im_i[perm], ny * im_i[perm], nx * im_j[perm], ny * im_j[perm], acc)
+        bounds_at = np.cumsum([0] + [len(b) for b in batches]).tolist()
+        views = [[a[lo:hi] for a in rows] for lo, hi in zip(bounds_at[:-1], bounds_at[1:])]
+        vx = vel_x[:, 0].copy()
+        vy = vel_x[:, 1].copy()
+
+        for _ in range(self.iterations):
+            for bi, bj, bnx, bny, bt, bk, wxi, wyi, wxj, wyj, bacc in views:
+                vn = (vx[bj] - vx[bi]) * bnx + (vy[bj] - vy[bi]) * bny
+                d = np.maximum(bacc + (bt - vn) * bk, 0.0) - bacc
+                bacc += d
+                vx[bi] -= d * wxi
+                vy[bi] -= d * wyi
+                vx[bj] += d * wxj
+                vy[bj] += d * wyj
+
+        vel[:, 0] = vx[:nb]
+        vel[:, 1] = vy[:nb]
+        order = np.argsort(keys)
+        self._warm_keys = keys[order]
+        self._warm_imp = acc[order]
+        self._warm_n = nb
+        return self.contact_count
+
+def _shape_arrays(objects):
+    """Half extents, radii and circle flags for a list of Box/Circle objects."""
+    radius = np.array([getattr(o, "radius", 0.0) for o in objects], dtype=float)
+    is_circle = radius > 0.0
+    size = np.array([getattr(o, "size", 0.0) for o in objects], dtype=float)
+    ext = np.where(is_circle, radius, size / 2)
+    half = np.repeat(ext[:, None], 2, axis=1)
+    return half, radius, is_circle
+
+class ObjectsManage:
+    """
+    A class for managing the game objects.
+    Integrates every object, then finds and resolves object-object contacts
+    through a broad phase (spatial hash or sweep-and-prune) and a batched
+    contact solver.
+
+    bounds=(origin, size) makes the manager keep objects inside that rect
+    itself, so walls are part of the contact solve.
+
+    Body state lives in arrays owned by the manager, as in VectorWorld: on
+    the first update after add()/remove() every object's pos, vel and
+    gravity are rebound to rows of those arrays, so a step is one vectorized
+    pass with no per-object integration or copy-back. In-place changes
+    (obj.pos[:] = ..., apply_impulse, set_gravity, add_force) and mass,
+    damping and max_speed are picked up each step; assigning a new array to
+    obj.pos or obj.vel detaches it, and size/radius are read when the
+    arrays are rebuilt.
+
+    Measured capacity (median update, the 8 px benchmarks/broad_phase.py
+    scenes, grid broad phase, one desktop core): about 2.5 ms at 1000 bodies
+    spread and 5 ms at 2000, inside the 8.3 ms FIXED_DT budget; a settled
+    pile reaches the budget at about 800 bodies (1000: ~10 ms). That is
+    VectorWorld's solver cost plus ~0.3 ms per 1000 objects for reading
+    their forces and scalars.
+    """
+    def __init__(self, bounds=None, restitution=CONTACT_E, wall_restitution=REST_E,
+                 collisions=True, broad_phase="grid"):
         self.objects = []
+        self.bounds = bounds
+        self.collisions = collisions
+        self.broad_phase = BROAD_PHASES[broad_phase]()
+        self.solver = ContactSolver(restitution, wall_restitution)
+        self._stale = True
+
+    def set_broad_phase(self, name):
+        """Switch broad phase at runtime ("grid" or "sap")."""
+        if name != self.broad_phase.name:
+            self.broad_phase = BROAD_PHASES[name]()
+
+    def cycle_broad_phase(self):
+        """Switch to the next broad phase; returns its name."""
+        names = list(BROAD_PHASES)
+        nxt = names[(names.index(self.broad_phase.name) + 1) % len(names)]
+        self.set_broad_phase(nxt)
+        return nxt
 
     def add(self, obj):
         self.objects.append(obj)
+        self._stale = True
 
     def remove(self, obj):
         self.objects.remove(obj)
+        # Give it back state of its own
+        obj.pos, obj.vel, obj.gravity = obj.pos.copy(), obj.vel.copy(), obj.gravity.copy()
+        self._stale = True
+
+    def _rebuild(self):
+        """Move every object's state into shared arrays and rebind it to their rows."""
+        objs = self.objects
+        n = len(objs)
+        self.pos = np.array([o.pos for o in objs], dtype=float).reshape(n, 2)
+        self.vel = np.array([o.vel for o in objs], dtype=float).reshape(n, 2)
+        self.gravity = np.array([o.gravity for o in objs], dtype=float).reshape(n, 2)
+        self.half, self.radius, self.is_circle = _shape_arrays(objs)
+        for k, obj in enumerate(objs):
+            obj.pos, obj.vel, obj.gravity = self.pos[k], self.vel[k], self.gravity[k]
+        self.solver.reset()
+        if hasattr(self.broad_phase, "reset"):
+            self.broad_phase.reset()
+        self._stale = False
+
+    @property
+    def pair_count(self):
+        """Candidate pairs produced by the broad phase on the last step."""
+        return self.broad_phase.pair_count
+
+    @property
+    def contact_count(self):
+        """Touching object-object pairs on the last step."""
+        return self.solver.contact_count
 
     def update(self, dt):
-        for obj in self.objects:
-            obj.integrate(dt)
-        # TODO: Implement collision resolution between objects
-        # Currently disabled - needs resolve_collision method in PhysicsObject
+        if not self.objects:
+            return
+        if self._stale:
+            self._rebuild()
+        objs = self.objects
+        n = len(objs)
+        mass = np.fromiter((o.mass for o in objs), float, n)
+        inv_mass = np.divide(1.0, mass, out=np.zeros(n), where=mass > 0)
+
+        # Symplectic Euler as in PhysicsObject.integrate, for all objects at once
+        acc = self.gravity.copy()
+        for k, obj in enumerate(objs):
+            if obj.forces:
+                acc[k] += np.sum(obj.forces, axis=0) / obj.mass
+                obj.forces.clear()
+        vel = self.vel
+        vel += acc * dt
+        damping = np.fromiter((o.damping for o in objs), float, n)
+        vel *= np.maximum(0.0, 1.0 - damping * dt)[:, None]
+        max_speed = np.fromiter((np.inf if o.max_speed is None else o.max_speed for o in objs),
+                                float, n)
+        speed = np.hypot(vel[:, 0], vel[:, 1])
+        fast = speed > max_speed
+        if fast.any():
+            vel[fast] *= (max_speed[fast] / speed[fast])[:, None]
+        self.pos += vel * dt
+
+        if self.collisions or self.bounds is not None:
+            self.resolve_collisions(dt, inv_mass)
+
+    def resolve_collisions(self, dt, inv_mass=None):
+        if self._stale:
+            self._rebuild()
+        pos, vel, half = self.pos, self.vel, self.half
+        if inv_mass is None:
+            inv_mass = np.array([1.0 / o.mass if o.mass > 0 else 0.0 for o in self.objects])
+
+        if self.collisions:
+            i, j = self.broad_phase.query_pairs(pos, half)
+        else:
+            i = j = np.empty(0, dtype=np.intp)
+        self.solver.solve(pos, vel, inv_mass, half, self.radius, self.is_circle, i, j, dt, self.bounds)
+        if self.bounds is not None:
+            _clamp_to_bounds(pos, vel, half, self.bounds, self.solver.wall_restitution)
+
+
+class VectorWorld:
+    """
+    Struct-of-arrays world for the BETA stress mode: thousands of boxes and
+    balls kept as numpy arrays and stepped in one vectorized pass
+    (integration, broad phase, contact solve, walls) instead of one
+    PhysicsObject per body.
+
+    Measured capacity (median step, STRESS_SIZE bodies, one desktop core,
+    numpy 2): the grid broad phase keeps a step inside the 8.3 ms FIXED_DT
+    budget up to about 1500 bodies settled in a gravity pile (2000: ~12 ms)
+    and about 2000 bodies spread without gravity (~7 ms). Sweep-and-prune
+    holds it to about 500 in a pile and 1000 spread. Beyond that the stress
+    mode runs below 120 steps per second rather than stalling (the BETA
+    loop drops the backlog). Step time is shown in the info panel.
+    """
+    def __init__(self, bounds=((0, 0), (PLAY_W, HEIGHT)), broad_phase="grid",
+                 damping=0.25, max_speed=1500.0, seed=None):
+        self.bounds = bounds
+        self.gravity = np.zeros(2)
+        self.damping = damping
+        self.max_speed = max_speed
+        self.broad_phase = BROAD_PHASES[broad_phase]()
+        self.solver = ContactSolver()
+        self.rng = np.random.default_rng(seed)
+        self.force = np.zeros(2)
+        self.step_ms = 0.0
+        self._clear()
+
+    def _clear(self):
+        self.pos = np.empty((0, 2))
+        self.vel = np.empty((0, 2))
+        self.inv_mass = np.empty(0)
+        self.half = np.empty((0, 2))
+        self.radius = np.empty(0)
+        self.is_circle = np.empty(0, dtype=bool)
+        self.colors = []
+        self._changed()
+
+    def _changed(self):
+        self.solver.reset()
+        if hasattr(self.broad_phase, "reset"):
+            self.broad_phase.reset()
+
+    def __len__(self):
+        return len(self.pos)
+
+    @property
+    def ball_count(self):
+        return int(self.is_circle.sum())
+
+    @property
+    def box_count(self):
+        return len(self) - self.ball_count
+
+    @property
+    def pair_count(self):
+        return self.broad_phase.pair_count
+
+    @property
+    def contact_count(self):
+        return self.solver.contact_count
+
+    def set_broad_phase(self, name):
+        if name != self.broad_phase.name:
+            self.broad_phase = BROAD_PHASES[name]()
+
+    def cycle_broad_phase(self):
+        names = list(BROAD_PHASES)
+        self.set_broad_phase(names[(names.index(self.broad_phase.name) + 1) % len(names)])
+        return self.broad_phase.name
+
+    def set_gravity(self, g):
+        self.gravity[:] = g
+
+    def spawn(self, count, size=STRESS_SIZE):
+        """Add `count` bodies (alternating box/ball) at random spots in bounds."""
+        if count <= 0:
+            return
+        (x0, y0), (w, h) = self.bounds
+        r = size / 2
+        pos = self.rng.uniform((x0 + r, y0 + r), (x0 + w - r, y0 + h - r), size=(count, 2))
+        vel = self.rng.normal(0.0, 80.0, size=(count, 2))
+        circle = (np.arange(len(self), len(self) + count) % 2) == 1
+        # Same density for both shapes: mass ~ area
+        area = np.where(circle, math.pi * r * r, size * size) / (size * size)
+        self.pos = np.vstack((self.pos, pos))
+        self.vel = np.vstack((self.vel, vel))
+        self.inv_mass = np.concatenate((self.inv_mass, 1.0 / area))
+        self.half = np.vstack((self.half, np.full((count, 2), r)))
+        self.radius = np.concatenate((self.radius, np.where(circle, r, 0.0)))
+        self.is_circle = np.concatenate((self.is_circle, circle))
+        picks = self.rng.integers(0, len(STRESS_COLORS), count)
+        self.colors += [STRESS_COLORS[k] for k in picks]
+        self._changed()
+
+    def set_count(self, n):
+        """Grow or shrink the world to `n` bodies (clamped to STRESS_MAX)."""
+        n = max(0, min(STRESS_MAX, int(n)))
+        if n > len(self):
+            self.spawn(n - len(self))
+        elif n < len(self):
+            self.pos = self.pos[:n]
+            self.vel = self.vel[:n]
+            self.inv_mass = self.inv_mass[:n]
+            self.half = self.half[:n]
+            self.radius = self.radius[:n]
+            self.is_circle = self.is_circle[:n]
+            self.colors = self.colors[:n]
+            self._changed()
+
+    def respawn(self):
+        n = len(self)
+        self._clear()
+        self.spawn(n)
+
+    def add_force(self, force):
+        """Queue a force applied to every body on the next step."""
+        self.force += force
+
+    def step(self, dt):
+        if not len(self):
+            self.force[:] = 0.0
+            return
+        t0 = time.perf_counter()
+        vel = self.vel
+        vel += (self.force * self.inv_mass[:, None] + self.gravity) * dt
+        self.force[:] = 0.0
+        if self.damping > 0.0:
+            vel *= max(0.0, 1.0 - self.damping * dt)
+        if self.max_speed is not None:
+            speed = np.hypot(vel[:, 0], vel[:, 1])
+            fast = speed > self.max_speed
+            if fast.any():
+                vel[fast] *= (self.max_speed / speed[fast])[:, None]
+        self.pos += vel * dt
+
+        i, j = self.broad_phase.query_pairs(self.pos, self.half)
+        self.solver.solve(self.pos, vel, self.inv_mass, self.half, self.radius,
+                          self.is_circle, i, j, dt, self.bounds)
+        _clamp_to_bounds(self.pos, vel, self.half, self.bounds, self.solver.wall_restitution)
+
+        ms = (time.perf_counter() - t0) * 1000.0
+        self.step_ms = ms if self.step_ms == 0.0 else self.step_ms * 0.9 + ms * 0.1
+
+    def draw(self, surf):
+        fill = surf.fill
+        circle = pygame.draw.circle
+        xy = self.pos.astype(int).tolist()
+        half = self.half[:, 0].astype(int).tolist()
+        for (x, y), h, is_c, color in zip(xy, half, self.is_circle.tolist(), self.colors):
+            if is_c:
+                circle(surf, color, (x, y), h)
+            else:
+                fill(color, (x - h, y - h, 2 * h, 2 * h))
@@ -12,10 +12,20 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 import time, math, numpy as np
 from pong.constants import *
+from pong import frame_scheduler
+from pong.profiler import FrameProfiler
 from pong.physics_object import *
 from pong_BETA.object_manage import Box, _draw_grid, _draw_info, PLAY_W, IMPULSE, FORCE_MAG, FIXED_DT, BG_INFO, BG_PLAY, REST_E, INFO_W
+from pong_BETA.object_manage import VectorWorld, STRESS_START, STRESS_STEP
 
-async def main():
+GRAVITY_G = (0.0, 900.0)
+
+
+def _ema(prev, value, k=0.1):
+    """Smooth a per-frame timing so the panel is readable."""
+    return value if prev == 0.0 else prev + (value - prev) * k
+
+async def main(settings=None):
     WIN = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("PongWithIssues — BETA Sandbox")
 
@@ -33,14 +43,31 @@ async def main():
     )
     gravity_on = False
 
+    # Stress mode: a vectorized world of many boxes and balls (T toggles)
+    stress = False
+    world = None
+    step_ms = 0.0
+    render_ms = 0.0
+
+    # Per-frame phase timings (F3 overlay)
+    profiler = FrameProfiler(settings)
+    profiler.track(lambda: {'bodies': len(world) if stress else 1,
+                            'pairs': world.pair_count if stress else 0,
+                            'contacts': world.contact_count if stress else 0})
+
     # Fixed-timestep accumulator
     acc = 0.0
     last = time.perf_counter()
 
     running = True
     while running:
+        clock.tick(FPS)
+        profiler.begin()
+
         # --- events (once per frame) ---
         for event in pygame.event.get():
+            if profiler.handle_event(event):
+                continue
             if event.type == pygame.QUIT:
                 running = False
                 break
@@ -48,6 +75,28 @@ async def main():
                 if event.key == pygame.K_ESCAPE:
                     running = False
                     break
+                elif event.key == pygame.K_t:
+                    stress = not stress
+                    if stress and world is None:
+                        world = VectorWorld()
+                        world.set_gravity(GRAVITY_G if gravity_on else (0.0, 0.0))
+                        world.set_count(STRESS_START)
+                    step_ms = 0.0
+                elif event.key == pygame.K_g:
+                    gravity_on = not gravity_on
+                    g = GRAVITY_G if gravity_on else (0.0, 0.0)
+                    box.gravity[:] = g
+                    if world is not None:
+                        world.set_gravity(g)
+                elif stress:
+                    if event.key == pygame.K_r:
+                        world.respawn()
+                    elif event.key in (pygame.K_2, pygame.K_KP_PLUS):
+                        world.set_count(len(world) + STRESS_STEP)
+                    elif event.key in (pygame.K_1, pygame.K_KP_MINUS):
+                        world.set_count(len(world) - STRESS_STEP)
+                    elif event.key == pygame.K_p:
+                        world.cycle_broad_phase()
                 elif event.key == pygame.K_r:
                     box.pos[:] = (PLAY_W/2, HEIGHT/2)
                     box.vel[:] = (0.0, 0.0)
@@ -60,9 +109,6 @@ async def main():
                 elif event.key == pygame.K_s:
                     # Note: this 'S' is impulse; arrows also apply continuous force
                     box.apply_impulse((0, +IMPULSE))
-                elif event.key == pygame.K_g:
-                    gravity_on = not gravity_on
-                    box.gravity[:] = (0.0, 900.0) if gravity_on else (0.0, 0.0)
                 elif event.key in (pygame.K_PLUS, pygame.K_EQUALS):  # '+'
                     box.damping = min(5.0, box.damping + 0.05)
                 elif event.key == pygame.K_MINUS:
@@ -79,42 +125,64 @@ async def main():
 
         # Continuous input → forces
         keys = pygame.key.get_pressed()
+        target = world if stress else box
         if keys[pygame.K_LEFT]:
-            box.add_force((-FORCE_MAG, 0))
+            target.add_force((-FORCE_MAG, 0))
         if keys[pygame.K_RIGHT]:
-            box.add_force((+FORCE_MAG, 0))
+            target.add_force((+FORCE_MAG, 0))
         if keys[pygame.K_UP]:
-            box.add_force((0, -FORCE_MAG))
+            target.add_force((0, -FORCE_MAG))
         if keys[pygame.K_DOWN]:
-            box.add_force((0, +FORCE_MAG))
+            target.add_force((0, +FORCE_MAG))
+        profiler.lap('events')
 
         # --- fixed-step physics ---
         now = time.perf_counter()
         acc += now - last
         last = now
         steps = 0
+        t0 = time.perf_counter()
         while acc >= FIXED_DT:
-            box.integrate(FIXED_DT)
-            box.play_bounds_bounce((0,0), (PLAY_W, HEIGHT), e=REST_E)
+            if stress:
+                world.step(FIXED_DT)
+            else:
+                box.integrate(FIXED_DT)
+                box.play_bounds_bounce((0,0), (PLAY_W, HEIGHT), e=REST_E)
             acc -= FIXED_DT
             steps += 1
             if steps > 5:  # avoid spiral of death
                 acc = 0.0
                 break
 
+        if steps:
+            step_ms = _ema(step_ms, (time.perf_counter() - t0) * 1000.0 / steps)
+        profiler.lap('physics')
+
         # --- draw ---
-        WIN.fill(BG_PLAY, rect=pygame.Rect(0,0,PLAY_W,HEIGHT))
         _draw_grid(WIN)
         pygame.draw.rect(WIN, BG_INFO, pygame.Rect(PLAY_W,0,INFO_W,HEIGHT))
-        box.draw(WIN)
-        _draw_info(WIN, box, damping=box.damping, max_speed=box.max_speed, gravity_on=gravity_on)
+        t0 = time.perf_counter()
+        if stress:
+            world.draw(WIN)
+        else:
+            box.draw(WIN)
+        render_ms = _ema(render_ms, (time.perf_counter() - t0) * 1000.0)
+
+        perf = {'step_ms': step_ms, 'steps': steps, 'render_ms': render_ms}
+        if stress:
+            perf.update(pairs=world.pair_count, contacts=world.contact_count,
+                        broad_phase=world.broad_phase.name)
+        _draw_info(WIN, box, damping=box.damping, max_speed=box.max_speed, gravity_on=gravity_on,
+                   perf=perf, world=world if stress else None)
 
         # divider
         pygame.draw.line(WIN, (60,70,90), (PLAY_W,0), (PLAY_W,HEIGHT), 2)
+        profiler.lap('world')
 
+        profiler.draw(WIN)
         pygame.display.flip()
-        clock.tick(FPS)
-        await asyncio.sleep(0)
+        profiler.lap('flip')
+        await frame_scheduler.next_frame()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -12,15 +12,25 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from pong.constants import *
 from pong.paddle import Paddle
 from pong.ball import BallClassic as Ball
-from pong.utilities import draw as draw_game, reset, handle_ball_collision
+from pong.utilities import draw as draw_game, draw_scores, reset
+from pong.render_cache import render_text
+from pong.contacts import resolve_contacts
 from pong.helpers import handle_paddle_movement
 from pong.ai import ai_move_paddle, DIFFICULTY_NAMES
 from pong.touch import TouchHandler, draw_touch_buttons, draw_touch_zones
 from pong.powerups import PowerUpManager
-from pong import audio
+from pong import audio, frame_scheduler
 from pong.juice import JuiceManager
+from pong.quality import QualityGovernor
+from pong.profiler import FrameProfiler
+from pong.dirty_rects import DirtyRectRenderer, circle_rect, paddle_rect
+from pong.render_scale import InternalResolution
 from pong.game_flow import countdown, PauseMenu, WinScreen, confirm_exit
 
+# Above this many extra balls a full update is cheaper than many small rects
+DIRTY_MAX_BALLS = 48
+
+
 async def main(vs_ai=False, settings=None):
     WIN = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Pong!")
@@ -59,11 +69,28 @@ async def main(vs_ai=False, settings=None):
 
     # Power-ups
     power_ups_on = settings.power_ups_enabled if settings else False
-    pu_mgr = PowerUpManager(left_paddle, right_paddle) if power_ups_on else None
+    chaos = getattr(settings, 'multiball_chaos', False)
+    pu_mgr = PowerUpManager(left_paddle, right_paddle, chaos=chaos) if power_ups_on else None
 
     # Juice (visual effects) — respects settings
     juice = JuiceManager(settings)
 
+    # Adaptive effect quality (trail, aura, particle budgets)
+    quality = QualityGovernor(settings)
+    quality.apply(balls=[ball], juice=juice)
+
+    # Per-frame phase timings (F3 overlay)
+    profiler = FrameProfiler(settings)
+    profiler.track(lambda: {'particles': len(juice.particles),
+                            'extra_balls': len(pu_mgr.extra_balls) if pu_mgr else 0})
+
+    # Optional internal-resolution world rendering (HUD stays native)
+    view = InternalResolution(getattr(settings, 'render_scale', 1.0), (WIDTH, HEIGHT))
+
+    # Optional dirty-rect display updates (full redraw fallback for shake/flash);
+    # an upscaled world repaints the whole window anyway
+    renderer = DirtyRectRenderer(enabled=getattr(settings, 'dirty_rects', False) and not view.active)
+
     # Pause menu & win screen
     pause_menu = PauseMenu()
     win_screen = WinScreen()
@@ -75,16 +102,35 @@ async def main(vs_ai=False, settings=None):
     else:
         mode_label = "MODE: CLASSIC"
 
+    def dirty_rects():
+        """Screen regions the moving entities occupy this frame."""
+        rects = [ball.draw_bounds(),
+                 paddle_rect(left_paddle), paddle_rect(right_paddle)]
+        if pu_mgr:
+            # Power-up boxes bob a few pixels around their rect
+            rects += [pu.rect.inflate(8, 14) for pu in pu_mgr.field_powerups]
+            eb = pu_mgr.extra_balls
+            rects += [circle_rect(eb.pos[i], eb.radius[i]) for i in range(len(eb))]
+        return rects + juice.dirty_rects()
+
     def draw_full_scene():
         """Draw the complete game scene (used by countdown/pause as background)."""
         sx, sy = juice.shake.get_offset()
-        draw_game(WIN, [left_paddle, right_paddle], ball, left_score, right_score, FONT_SCORE_GAME, bg_color, offset=(sx, sy))
+        world, scale = view.begin(WIN), view.scale
+        draw_game(world, [left_paddle, right_paddle], ball, left_score, right_score, FONT_SCORE_GAME, bg_color, offset=(sx, sy),
+                  scale=scale, scores=not view.active)
         if pu_mgr:
-            pu_mgr.draw(WIN)
-            pu_mgr.draw_extra_balls(WIN)
-        mode_text = FONT_MODE_GAME.render(mode_label, True, GREY)
+            pu_mgr.draw(world, scale, labels=not view.active)
+            pu_mgr.draw_extra_balls(world, scale)
+        juice.draw_world(world, scale)
+        if view.active:
+            view.present(WIN)
+            draw_scores(WIN, left_score, right_score, FONT_SCORE_GAME)
+            if pu_mgr:
+                pu_mgr.draw_labels(WIN)
+        mode_text = render_text(FONT_MODE_GAME, mode_label, GREY)
         WIN.blit(mode_text, (10, 10))
-        juice.draw(WIN)
+        juice.draw_hud(WIN)
 
     # Initial countdown
     result = await countdown(WIN, draw_full_scene)
@@ -94,10 +140,15 @@ async def main(vs_ai=False, settings=None):
 
     while True:
         clock.tick(FPS)
+        if quality.begin():
+            quality.apply(balls=[ball], juice=juice)
+        profiler.begin()
         keys = pygame.key.get_pressed()
 
         for event in pygame.event.get():
             touch.handle_event(event)
+            if profiler.handle_event(event):
+                continue
             if event.type == pygame.QUIT:
                 return
 
@@ -109,6 +160,7 @@ async def main(vs_ai=False, settings=None):
                     left_score, right_score = reset(ball, left_paddle, right_paddle)
                     if pu_mgr: pu_mgr.reset()
                     paused = False
+                    renderer.invalidate()
                     result = await countdown(WIN, draw_full_scene)
                     if result == 'quit': return
                 elif action == 'menu':
@@ -117,6 +169,7 @@ async def main(vs_ai=False, settings=None):
 
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE or event.key == pygame.K_m:
+                    renderer.invalidate()
                     should_exit = await confirm_exit(WIN, draw_full_scene, touch)
                     if should_exit:
                         return
@@ -125,6 +178,7 @@ async def main(vs_ai=False, settings=None):
                 if event.key == pygame.K_r:
                     left_score, right_score = reset(ball, left_paddle, right_paddle)
                     if pu_mgr: pu_mgr.reset()
+                    renderer.invalidate()
                     result = await countdown(WIN, draw_full_scene)
                     if result == 'quit': return
                 if event.key == pygame.K_h:
@@ -133,6 +187,7 @@ async def main(vs_ai=False, settings=None):
         # Touch button actions
         if not paused:
             if touch.tapped_menu_btn():
+                renderer.invalidate()
                 should_exit = await confirm_exit(WIN, draw_full_scene, touch)
                 touch.clear_taps()
                 if should_exit:
@@ -150,16 +205,21 @@ async def main(vs_ai=False, settings=None):
                 if pu_mgr: pu_mgr.reset()
                 paused = False
                 touch.clear_taps()
+                renderer.invalidate()
                 result = await countdown(WIN, draw_full_scene)
                 if result == 'quit': return
             elif action == 'menu':
                 return
 
+        profiler.lap('events')
+
         # Update juice effects
         juice.update()
+        profiler.lap('juice')
 
         # Draw scene
         draw_full_scene()
+        profiler.lap('world')
 
         if paused:
             pause_menu.draw(WIN)
@@ -169,14 +229,23 @@ async def main(vs_ai=False, settings=None):
             footer_text = "Press [SPACE] to pause | [R] to restart | [M] to return | [ESC] to quit | [H] to hide"
         else:
             footer_text = "Press [H] for help"
-        footer = FONT_SMALL_DIGITAL.render(footer_text, True, GREY)
+        footer = render_text(FONT_SMALL_DIGITAL, footer_text, GREY)
         WIN.blit(footer, (GAME_MARGIN_X, GAME_FOOTER[1]))
 
         draw_touch_zones(WIN, touch)
         touch.update_ripples()
         touch.draw_ripples(WIN)
         draw_touch_buttons(WIN, paused)
-        pygame.display.update()
+        profiler.lap('effects')
+        profiler.draw(WIN)
+
+        # Scores, footer, pause state and blind overlay change pixels outside the entity rects
+        renderer.watch(left_score, right_score, footer_text, paused,
+                       pu_mgr.get_blind_side() if pu_mgr else None)
+        renderer.present(dirty_rects(),
+                         full=(juice.needs_full_redraw or paused or touch.has_ripples or profiler.needs_full_redraw
+                               or (pu_mgr is not None and len(pu_mgr.extra_balls) > DIRTY_MAX_BALLS)))
+        profiler.lap('flip')
 
         if not paused:
             # Freeze guard: save positions for frozen paddles
@@ -189,8 +258,10 @@ async def main(vs_ai=False, settings=None):
                 frozen_l = frozen_r = False
 
             handle_paddle_movement(keys, left_paddle, right_paddle, ai_right=vs_ai, touch=touch)
+            profiler.lap('physics')
             if vs_ai:
                 ai_move_paddle(right_paddle, ball, difficulty=ai_diff)
+            profiler.lap('ai')
 
             # Enforce freeze: restore position, zero velocity
             if frozen_l:
@@ -204,34 +275,18 @@ async def main(vs_ai=False, settings=None):
             right_paddle.update()
 
             ball.move()
+            contacts = resolve_contacts(ball, left_paddle, right_paddle, 'classic', HEIGHT)
+            audio.play_contacts(contacts)
+            juice.on_contacts(contacts, l_color, r_color)
+            profiler.lap('physics')
 
-            old_vx = ball.vel[0]
-            old_vy = ball.vel[1]
-            handle_ball_collision(ball, left_paddle, right_paddle, HEIGHT)
-
-            # Wall bounce detection — check if vy flipped sign
-            if old_vy != 0 and (old_vy > 0) != (ball.vel[1] > 0):
-                audio.play('wall_bounce')
-                wall_y = ball.radius if ball.pos[1] <= HEIGHT // 2 else HEIGHT - ball.radius
-                juice.on_wall_bounce(ball.pos[0], wall_y)
-
-            # Detect paddle hit — check if vx flipped sign
-            if old_vx < 0 and ball.vel[0] > 0:
-                audio.play('paddle_hit')
-                juice.on_paddle_hit(left_paddle.pos[0] + left_paddle.width, ball.pos[1], l_color)
-                if pu_mgr: pu_mgr.set_last_hit('left')
-            elif old_vx > 0 and ball.vel[0] < 0:
-                audio.play('paddle_hit')
-                juice.on_paddle_hit(right_paddle.pos[0], ball.pos[1], r_color)
-                if pu_mgr: pu_mgr.set_last_hit('right')
-
-            # Extra balls physics
             if pu_mgr:
-                for eb in pu_mgr.extra_balls:
-                    eb.move()
-                    handle_ball_collision(eb, left_paddle, right_paddle, HEIGHT)
+                pu_mgr.on_contacts(contacts)
+                # Extra balls: one vectorized move / collide / cull
+                pu_mgr.step_extra_balls('classic', HEIGHT)
                 pu_mgr.update(ball)
                 pu_mgr.create_extra_balls(ball, mode='classic')
+            profiler.lap('powerups')
 
             # Scoring
             scored = False
@@ -242,10 +297,6 @@ async def main(vs_ai=False, settings=None):
                         pu_mgr.park_main_ball(ball, 'left')
                     elif ball.pos[0] + ball.radius > WIDTH:
                         pu_mgr.park_main_ball(ball, 'right')
-                pu_mgr.extra_balls = [
-                    eb for eb in pu_mgr.extra_balls
-                    if -eb.radius <= eb.pos[0] <= WIDTH + eb.radius
-                ]
                 result = pu_mgr.check_multiball_done()
                 if result == 'right_scores':
                     right_score += 1
@@ -278,6 +329,8 @@ async def main(vs_ai=False, settings=None):
                 else:
                     juice.on_score(WIDTH * 3 // 4, 20 + 25, str(right_score), FONT_SCORE_GAME, LIGHT_PURPLE)
 
+        profiler.lap('physics')
+
         # Win condition
         if left_score >= win_score or right_score >= win_score:
             right_name = "AI" if vs_ai else "Right Player"
@@ -320,14 +373,16 @@ async def main(vs_ai=False, settings=None):
                 draw_touch_buttons(WIN, False)
                 pygame.display.update()
                 touch.clear_taps()
-                await asyncio.sleep(0)
+                await frame_scheduler.next_frame(idle=True)
 
             # Countdown before next match
+            renderer.invalidate()
             result = await countdown(WIN, draw_full_scene)
             if result == 'quit': return
 
         touch.clear_taps()
-        await asyncio.sleep(0)
+        quality.end()
+        await frame_scheduler.next_frame()
 
 if __name__ == '__main__':
     asyncio.run(main())
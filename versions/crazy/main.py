@@ -14,13 +14,17 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from pong.constants import *
 from pong.paddle import Paddle
 from pong.ball import BallClassic as Ball
-from pong.utilities import draw as draw_game, reset, handle_ball_collision
+from pong.utilities import draw as draw_game, reset
+from pong.render_cache import render_text
+from pong.contacts import resolve_contacts, paddle_hits
 from pong.helpers import handle_paddle_movement
 from pong.ai import ai_move_paddle, DIFFICULTY_NAMES
 from pong.touch import TouchHandler, draw_touch_buttons, draw_touch_zones
 from pong.powerups import PowerUpManager
-from pong import audio
+from pong import audio, frame_scheduler
 from pong.juice import JuiceManager
+from pong.quality import QualityGovernor
+from pong.profiler import FrameProfiler
 from pong.game_flow import countdown, PauseMenu, WinScreen, confirm_exit
 
 
@@ -126,11 +130,21 @@ async def main(vs_ai=False, settings=None):
     right_score = 0
 
     # Power-ups (always on in crazy mode)
-    pu_mgr = PowerUpManager(left_paddle, right_paddle)
+    pu_mgr = PowerUpManager(left_paddle, right_paddle,
+                            chaos=getattr(settings, 'multiball_chaos', False))
 
     # Juice (visual effects) with higher shake intensity
     juice = JuiceManager(settings)
 
+    # Adaptive effect quality (trail, aura, particle budgets)
+    quality = QualityGovernor(settings)
+    quality.apply(balls=[ball], juice=juice)
+
+    # Per-frame phase timings (F3 overlay)
+    profiler = FrameProfiler(settings)
+    profiler.track(lambda: {'particles': len(juice.particles),
+                            'extra_balls': len(pu_mgr.extra_balls) if pu_mgr else 0})
+
     # Crazy mode manager
     crazy = CrazyModeManager()
 
@@ -177,13 +191,13 @@ async def main(vs_ai=False, settings=None):
             pu_mgr.draw(WIN)
             pu_mgr.draw_extra_balls(WIN)
         
-        mode_text = FONT_SMALL_DIGITAL.render(mode_label, True, RED)
+        mode_text = render_text(FONT_SMALL_DIGITAL, mode_label, RED)
         WIN.blit(mode_text, (10, 10))
         
         # Show acceleration stats
-        speed_text = FONT_TINY_DIGITAL.render(
+        speed_text = render_text(FONT_TINY_DIGITAL,
             f"Speed: {crazy.get_ball_speed_multiplier():.2f}x | Size: {crazy.get_size_multiplier():.2f}x | Rally: {crazy.rally_count}",
-            True, GREY
+            GREY
         )
         WIN.blit(speed_text, (10, 35))
         
@@ -197,10 +211,15 @@ async def main(vs_ai=False, settings=None):
 
     while True:
         dt = clock.tick(FPS) / 1000.0
+        if quality.begin():
+            quality.apply(balls=[ball], juice=juice)
+        profiler.begin()
         keys = pygame.key.get_pressed()
 
         for event in pygame.event.get():
             touch.handle_event(event)
+            if profiler.handle_event(event):
+                continue
             if event.type == pygame.QUIT:
                 return
 
@@ -261,6 +280,8 @@ async def main(vs_ai=False, settings=None):
             elif action == 'menu':
                 return
 
+        profiler.lap('events')
+
         # Update crazy mode
         if not paused:
             crazy.update(dt)
@@ -292,11 +313,15 @@ async def main(vs_ai=False, settings=None):
             left_paddle.fixed_vel = orig_p_speed * paddle_speed_mult
             right_paddle.fixed_vel = orig_p_speed * paddle_speed_mult
 
+        profiler.lap('physics')
+
         # Update juice effects
         juice.update()
+        profiler.lap('juice')
 
         # Draw scene
         draw_full_scene()
+        profiler.lap('world')
 
         if paused:
             pause_menu.draw(WIN)
@@ -306,14 +331,17 @@ async def main(vs_ai=False, settings=None):
             footer_text = "Press [SPACE] to pause | [R] to restart | [M] to return | [ESC] to quit | [H] to hide"
         else:
             footer_text = "Press [H] for help"
-        footer = FONT_SMALL_DIGITAL.render(footer_text, True, GREY)
+        footer = render_text(FONT_SMALL_DIGITAL, footer_text, GREY)
         WIN.blit(footer, (GAME_MARGIN_X, GAME_FOOTER[1]))
 
         draw_touch_zones(WIN, touch)
         touch.update_ripples()
         touch.draw_ripples(WIN)
         draw_touch_buttons(WIN, paused)
+        profiler.lap('effects')
+        profiler.draw(WIN)
         pygame.display.update()
+        profiler.lap('flip')
 
         if not paused:
             # Freeze guard: save positions for frozen paddles
@@ -326,8 +354,10 @@ async def main(vs_ai=False, settings=None):
                 frozen_l = frozen_r = False
 
             handle_paddle_movement(keys, left_paddle, right_paddle, ai_right=vs_ai, touch=touch)
+            profiler.lap('physics')
             if vs_ai:
                 ai_move_paddle(right_paddle, ball, difficulty=ai_diff)
+            profiler.lap('ai')
 
             # Enforce freeze: restore position, zero velocity
             if frozen_l:
@@ -341,36 +371,20 @@ async def main(vs_ai=False, settings=None):
             right_paddle.update()
 
             ball.move()
-
-            old_vx = ball.vel[0]
-            old_vy = ball.vel[1]
-            handle_ball_collision(ball, left_paddle, right_paddle, HEIGHT)
-
-            # Wall bounce detection — check if vy flipped sign
-            if old_vy != 0 and (old_vy > 0) != (ball.vel[1] > 0):
-                audio.play('wall_bounce')
-                wall_y = ball.radius if ball.pos[1] <= HEIGHT // 2 else HEIGHT - ball.radius
-                juice.on_wall_bounce(ball.pos[0], wall_y)
-
-            # Detect paddle hit — check if vx flipped sign
-            if old_vx < 0 and ball.vel[0] > 0:
-                audio.play('paddle_hit')
+            contacts = resolve_contacts(ball, left_paddle, right_paddle, 'classic', HEIGHT)
+            audio.play_contacts(contacts)
+            for _ in paddle_hits(contacts):
                 crazy.on_rally_hit()  # Increment rally count
-                juice.on_paddle_hit(left_paddle.pos[0] + left_paddle.width, ball.pos[1], l_color)
-                if pu_mgr: pu_mgr.set_last_hit('left')
-            elif old_vx > 0 and ball.vel[0] < 0:
-                audio.play('paddle_hit')
-                crazy.on_rally_hit()  # Increment rally count
-                juice.on_paddle_hit(right_paddle.pos[0], ball.pos[1], r_color)
-                if pu_mgr: pu_mgr.set_last_hit('right')
+            juice.on_contacts(contacts, l_color, r_color)
+            profiler.lap('physics')
 
-            # Extra balls physics
             if pu_mgr:
-                for eb in pu_mgr.extra_balls:
-                    eb.move()
-                    handle_ball_collision(eb, left_paddle, right_paddle, HEIGHT)
+                pu_mgr.on_contacts(contacts)
+                # Extra balls: one vectorized move / collide / cull
+                pu_mgr.step_extra_balls('classic', HEIGHT)
                 pu_mgr.update(ball)
                 pu_mgr.create_extra_balls(ball, mode='classic')
+            profiler.lap('powerups')
 
             # Scoring
             scored = False
@@ -381,10 +395,6 @@ async def main(vs_ai=False, settings=None):
                         pu_mgr.park_main_ball(ball, 'left')
                     elif ball.pos[0] + ball.radius > WIDTH:
                         pu_mgr.park_main_ball(ball, 'right')
-                pu_mgr.extra_balls = [
-                    eb for eb in pu_mgr.extra_balls
-                    if -eb.radius <= eb.pos[0] <= WIDTH + eb.radius
-                ]
                 result = pu_mgr.check_multiball_done()
                 if result == 'right_scores':
                     right_score += 1
@@ -419,6 +429,8 @@ async def main(vs_ai=False, settings=None):
                 # Reset rally count on score
                 crazy.rally_count = 0
 
+        profiler.lap('physics')
+
         # Win condition (dynamic based on round)
         win_score = crazy.get_win_score()
         if left_score >= win_score or right_score >= win_score:
@@ -466,14 +478,15 @@ async def main(vs_ai=False, settings=None):
                 draw_touch_buttons(WIN, False)
                 pygame.display.update()
                 touch.clear_taps()
-                await asyncio.sleep(0)
+                await frame_scheduler.next_frame(idle=True)
 
             # Countdown before next match
             result = await countdown(WIN, draw_full_scene)
             if result == 'quit': return
 
         touch.clear_taps()
-        await asyncio.sleep(0)
+        quality.end()
+        await frame_scheduler.next_frame()
 
 if __name__ == '__main__':
     asyncio.run(main())
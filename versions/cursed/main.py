@@ -25,13 +25,18 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from pong.constants import *
 from pong.paddle import Paddle
 from pong.ball import Ball
-from pong.utilities import draw as draw_game, reset
-from pong.helpers import handle_ball_collision_cursed, handle_paddle_movement_cursed
+from pong.utilities import draw as draw_game, draw_scores, reset
+from pong.render_cache import render_text, static_layer, render_target, flip_vertical
+from pong.helpers import handle_paddle_movement_cursed
+from pong.contacts import resolve_contacts, paddle_hits
 from pong.ai import ai_move_paddle, DIFFICULTY_NAMES
 from pong.touch import TouchHandler, draw_touch_buttons, draw_touch_zones
 from pong.powerups import PowerUpManager
-from pong import audio
+from pong import audio, frame_recorder, frame_scheduler
 from pong.juice import JuiceManager
+from pong.quality import QualityGovernor
+from pong.render_scale import InternalResolution
+from pong.profiler import FrameProfiler
 from pong.game_flow import countdown, PauseMenu, WinScreen, confirm_exit
 from pong.cursed import CursedEventManager
 from pong.cursed_combat import CursedCombatManager, MODE_FORCE, MODE_SABER, CHARGE_FORCE_TIME
@@ -84,7 +89,8 @@ async def main(vs_ai=False, settings=None):
     right_score = 0
 
     power_ups_on = settings.power_ups_enabled if settings else False
-    pu_mgr = PowerUpManager(left_paddle, right_paddle) if power_ups_on else None
+    chaos = getattr(settings, 'multiball_chaos', False)
+    pu_mgr = PowerUpManager(left_paddle, right_paddle, chaos=chaos) if power_ups_on else None
     juice = JuiceManager(settings)
     cursed = CursedEventManager() if cursed_events_on else None
     combat = CursedCombatManager(left_color=l_color, right_color=r_color, screen_w=CW, screen_h=CH)
@@ -97,6 +103,20 @@ async def main(vs_ai=False, settings=None):
     ability_mgr.register('right', 'pull', ForcePull())
     force_fx = ForceEffectSystem()
 
+    # Adaptive effect quality (trail, aura, particle budgets)
+    quality = QualityGovernor(settings)
+    quality.apply(balls=[ball], juice=juice, blood=combat.blood, force=force_fx)
+
+    # World at the configured internal resolution, HUD at native
+    view = InternalResolution(getattr(settings, 'render_scale', 1.0), (CW, CH))
+
+    # Per-frame phase timings (F3 overlay)
+    profiler = FrameProfiler(settings)
+    profiler.track(lambda: {'particles': len(juice.particles), 'blood': len(combat.blood),
+                            'force': len(force_fx),
+                            'extra_balls': len(pu_mgr.extra_balls) if pu_mgr else 0,
+                            'cursed_events': len(cursed.active_events) if cursed else 0})
+
     pause_menu = PauseMenu()
     win_screen = WinScreen()
 
@@ -118,29 +138,32 @@ async def main(vs_ai=False, settings=None):
     else:
         mode_label = f"CURSED{events_label}"
 
-    def _draw_goal_nets(target):
+    def _build_goal_net(surf):
+        """Paint one golden goal net frame and its mesh."""
+        net_depth, net_h = surf.get_size()
+        gold = (255, 215, 0)
+        dark_gold = (180, 150, 0)
+
+        # Frame
+        pygame.draw.rect(surf, gold, (0, 0, net_depth, net_h), 2)
+        # Net mesh lines
+        mesh_spacing = 12
+        for y in range(0, net_h, mesh_spacing):
+            pygame.draw.line(surf, dark_gold, (0, y), (net_depth, y), 1)
+        for x in range(0, net_depth, mesh_spacing // 2):
+            pygame.draw.line(surf, dark_gold, (x, 0), (x, net_h), 1)
+
+    def _draw_goal_nets(target, scale=1.0):
         """Draw golden goal net frames on left and right edges."""
         if not goal_net_on:
             return
         net_h = int(CH * goal_frac)
         net_top = CH // 2 - net_h // 2
-        net_bottom = net_top + net_h
         net_depth = 20
-        gold = (255, 215, 0)
-        dark_gold = (180, 150, 0)
-
+        size = (max(1, round(net_depth * scale)), max(1, round(net_h * scale)))
+        net = static_layer('goal_net', size, _build_goal_net, alpha=True)
         for side_x in [0, CW - net_depth]:
-            # Frame
-            pygame.draw.rect(target, gold,
-                             (side_x, net_top, net_depth, net_h), 2)
-            # Net mesh lines
-            mesh_spacing = 12
-            for y in range(net_top, net_bottom, mesh_spacing):
-                pygame.draw.line(target, dark_gold,
-                                 (side_x, y), (side_x + net_depth, y), 1)
-            for x in range(side_x, side_x + net_depth, mesh_spacing // 2):
-                pygame.draw.line(target, dark_gold,
-                                 (x, net_top), (x, net_bottom), 1)
+            target.blit(net, (round(side_x * scale), round(net_top * scale)))
 
     def _ball_in_goal_zone(ball_y):
         """Check if ball Y is within the goal net zone."""
@@ -154,10 +177,9 @@ async def main(vs_ai=False, settings=None):
     def draw_full_scene():
         sx, sy = juice.shake.get_offset()
         if cursed and cursed.has_event('SCREEN FLIP'):
-            temp = pygame.Surface((CW, CH))
+            temp = render_target((CW, CH), tag='scene')
             _draw_scene_to(temp, sx, sy)
-            flipped = pygame.transform.flip(temp, False, True)
-            WIN.blit(flipped, (0, 0))
+            WIN.blit(flip_vertical(temp), (0, 0))
         else:
             _draw_scene_to(WIN, sx, sy)
 
@@ -175,23 +197,34 @@ async def main(vs_ai=False, settings=None):
         if not combat.right_cut:
             paddles_to_draw.append(right_paddle)
 
-        draw_game(target, paddles_to_draw, ball, left_score, right_score,
+        world, scale = view.begin(target), view.scale
+        draw_game(world, paddles_to_draw, ball, left_score, right_score,
                   use_font, bg_color, offset=(sx, sy),
                   hide_ball=(hide_ball or combat.ball_grabbed_by is not None),
-                  screen_w=CW, screen_h=CH)
+                  screen_w=CW, screen_h=CH, scale=scale, scores=not view.active)
 
         # Goal nets
-        _draw_goal_nets(target)
+        _draw_goal_nets(world, scale)
 
         if pu_mgr:
-            pu_mgr.draw(target)
-            pu_mgr.draw_extra_balls(target)
+            pu_mgr.draw(world, scale, labels=not view.active)
+            pu_mgr.draw_extra_balls(world, scale)
+        profiler.lap('world')
 
         # Combat visuals (blood, swords, cut paddles, grab indicators, lightning, mode badges)
-        combat.draw(target, left_paddle, right_paddle)
+        combat.draw(world, left_paddle, right_paddle, scale, overlays=not view.active)
+
+        # Force effects (shockwaves, particles)
+        force_fx.draw(world, scale)
+        juice.draw_world(world, scale)
 
-        # Force effects (shockwaves, particles) + cooldown bars
-        force_fx.draw(target)
+        if view.active:
+            # Stretch the world up, then the native-resolution layers over it
+            view.present(target)
+            draw_scores(target, left_score, right_score, use_font, CW)
+            if pu_mgr:
+                pu_mgr.draw_labels(target)
+            combat.draw_overlays(target, left_paddle, right_paddle)
         ability_mgr.draw_cooldown_bars(target, left_paddle, right_paddle)
 
         # Draw grabbed ball on top of paddle
@@ -202,23 +235,24 @@ async def main(vs_ai=False, settings=None):
         ball_speed = np.linalg.norm(ball.vel)
         lp_speed = np.linalg.norm(left_paddle.vel)
         rp_speed = np.linalg.norm(right_paddle.vel)
-        hud = FONT_TINY_DIGITAL.render(
-            f"Ball:{ball_speed:.0f} L:{lp_speed:.1f} R:{rp_speed:.1f}", True, GREY)
+        hud = render_text(FONT_TINY_DIGITAL,
+            f"Ball:{ball_speed:.0f} L:{lp_speed:.1f} R:{rp_speed:.1f}", GREY)
         target.blit(hud, (10, 55))
 
-        mode_text = FONT_MODE_GAME.render(mode_label, True, GREY)
+        mode_text = render_text(FONT_MODE_GAME, mode_label, GREY)
         target.blit(mode_text, (10, 10))
 
         # Controls hint
-        ctrl_text = FONT_TINY_DIGITAL.render(
+        ctrl_text = render_text(FONT_TINY_DIGITAL,
             "[E]=mode [G]=grab  Force:[F]push [Q]pull [F+Q]LIGHTNING  Saber:[F]swing [Q]block",
-            True, DARK_GREY)
+            DARK_GREY)
         target.blit(ctrl_text, (10, 35))
 
-        juice.draw(target)
+        juice.draw_hud(target)
         if cursed:
             cursed.draw_active_bar(target)
             cursed.draw_announcements(target)
+        profiler.lap('effects')
 
     # Initial countdown
     result = await countdown(WIN, draw_full_scene)
@@ -227,11 +261,16 @@ async def main(vs_ai=False, settings=None):
 
     while True:
         clock.tick(FPS)
+        if quality.begin():
+            quality.apply(balls=[ball], juice=juice, blood=combat.blood, force=force_fx)
+        profiler.begin()
         keys = pygame.key.get_pressed()
         now = time.monotonic()
 
         for event in pygame.event.get():
             touch.handle_event(event)
+            if profiler.handle_event(event):
+                continue
             if event.type == pygame.QUIT:
                 # Restore window size before returning
                 pygame.display.set_mode((WIDTH, HEIGHT))
@@ -366,6 +405,7 @@ async def main(vs_ai=False, settings=None):
                         direction = _get_force_dir(combat.left_sword, left_paddle, 0.0)
                         if hold >= CHARGE_FORCE_TIME:
                             ab = ChargedForcePush()
+                            frame_recorder.note('charged push')
                             ab.try_activate(origin=origin, direction=direction)
                             ab.apply_to_objects(_force_targets('left'),
                                                 grabbed_obj=ball if combat.ball_grabbed_by else None)
@@ -391,6 +431,7 @@ async def main(vs_ai=False, settings=None):
                         direction = _get_force_dir(combat.left_sword, left_paddle, 0.0)
                         if hold >= CHARGE_FORCE_TIME:
                             ab = ChargedForcePull()
+                            frame_recorder.note('charged pull')
                             ab.try_activate(origin=origin, direction=direction)
                             ab.apply_to_objects(_force_targets('left'),
                                                 grabbed_obj=ball if combat.ball_grabbed_by else None)
@@ -415,6 +456,7 @@ async def main(vs_ai=False, settings=None):
                         direction = _get_force_dir(combat.right_sword, right_paddle, math.pi)
                         if hold >= CHARGE_FORCE_TIME:
                             ab = ChargedForcePush()
+                            frame_recorder.note('charged push')
                             ab.try_activate(origin=origin, direction=direction)
                             ab.apply_to_objects(_force_targets('right'),
                                                 grabbed_obj=ball if combat.ball_grabbed_by else None)
@@ -440,6 +482,7 @@ async def main(vs_ai=False, settings=None):
                         direction = _get_force_dir(combat.right_sword, right_paddle, math.pi)
                         if hold >= CHARGE_FORCE_TIME:
                             ab = ChargedForcePull()
+                            frame_recorder.note('charged pull')
                             ab.try_activate(origin=origin, direction=direction)
                             ab.apply_to_objects(_force_targets('right'),
                                                 grabbed_obj=ball if combat.ball_grabbed_by else None)
@@ -496,12 +539,15 @@ async def main(vs_ai=False, settings=None):
                 pygame.display.set_mode((WIDTH, HEIGHT))
                 return
 
+        profiler.lap('events')
         juice.update()
+        profiler.lap('juice')
 
         skip_frame = False
         if not paused and cursed:
             cursed.update(ball, left_paddle, right_paddle, pu_mgr)
             skip_frame = cursed.should_skip_frame()
+        profiler.lap('cursed')
 
         # Draw
         draw_full_scene()
@@ -513,14 +559,17 @@ async def main(vs_ai=False, settings=None):
             footer_text = "[SPACE] pause | [R] restart | [M] menu | [E] mode | [G] grab | [F/Q] Force/Swing | [F+Q] LIGHTNING"
         else:
             footer_text = "Press [H] for help"
-        footer = FONT_SMALL_DIGITAL.render(footer_text, True, GREY)
+        footer = render_text(FONT_SMALL_DIGITAL, footer_text, GREY)
         WIN.blit(footer, (GAME_MARGIN_X, CH - 30))
 
         draw_touch_zones(WIN, touch)
         touch.update_ripples()
         touch.draw_ripples(WIN)
         draw_touch_buttons(WIN, paused)
+        profiler.lap('effects')
+        profiler.draw(WIN)
         pygame.display.update()
+        profiler.lap('flip')
 
         if not paused and not skip_frame:
             dt = 1 / 60
@@ -561,8 +610,10 @@ async def main(vs_ai=False, settings=None):
                 if keys[pygame.K_LEFT]: right_paddle.accelerate_x(forward=True)
                 if keys[pygame.K_RIGHT]: right_paddle.accelerate_x(forward=False)
 
+            profiler.lap('physics')
             if vs_ai and right_can_move:
                 ai_move_paddle(right_paddle, ball, difficulty=ai_diff)
+            profiler.lap('ai')
 
             # ---- Saber block: Q/RCTRL held in saber mode ----
             if combat.mode_left == MODE_SABER:
@@ -609,6 +660,7 @@ async def main(vs_ai=False, settings=None):
                 _l_lightning_was_charging = True
             if r_both:
                 _r_lightning_was_charging = True
+            profiler.lap('combat')
 
             # Enforce freeze
             if frozen_l:
@@ -647,33 +699,20 @@ async def main(vs_ai=False, settings=None):
                 ball.update()
                 ball.vel *= BALL_FRICTION
 
-                old_vx = ball.vel[0]
-                old_vy = ball.vel[1]
-                hit = handle_ball_collision_cursed(ball, left_paddle, right_paddle,
-                                                  screen_h=CH)
-
-                # Wall bounce effects
-                if old_vy != 0 and (old_vy > 0) != (ball.vel[1] > 0):
-                    audio.play('wall_bounce')
-                    wall_y = ball.radius if ball.pos[1] <= CH // 2 else CH - ball.radius
-                    juice.on_wall_bounce(ball.pos[0], wall_y)
-
-                # Paddle hit effects
-                if hit == 'left':
-                    audio.play('paddle_hit')
-                    hit_speed = np.linalg.norm(ball.vel)
-                    shake_mag = min(15, 3 + hit_speed * 0.5)
-                    juice.shake.trigger(shake_mag, 0.15)
-                    juice.on_paddle_hit(left_paddle.pos[0] + left_paddle.width,
-                                        ball.pos[1], l_color)
-                    if pu_mgr: pu_mgr.set_last_hit('left')
-                elif hit == 'right':
-                    audio.play('paddle_hit')
-                    hit_speed = np.linalg.norm(ball.vel)
-                    shake_mag = min(15, 3 + hit_speed * 0.5)
-                    juice.shake.trigger(shake_mag, 0.15)
-                    juice.on_paddle_hit(right_paddle.pos[0], ball.pos[1], r_color)
-                    if pu_mgr: pu_mgr.set_last_hit('right')
+                contacts = resolve_contacts(ball, left_paddle, right_paddle, 'cursed', CH)
+                audio.play_contacts(contacts)
+                for c in paddle_hits(contacts):
+                    juice.shake.trigger(min(15, 3 + c.speed * 0.5), 0.15)
+                juice.on_contacts(contacts, l_color, r_color)
+                if pu_mgr:
+                    pu_mgr.on_contacts(contacts)
+
+            profiler.lap('physics')
+
+            # Extra balls (power-ups): one vectorized move / collide / cull
+            if pu_mgr:
+                pu_mgr.step_extra_balls('cursed', CH, CW)
+            profiler.lap('powerups')
 
             # Combat system update (swords, blood, ramming, lightning)
             combat.update(left_paddle, right_paddle, ball)
@@ -681,15 +720,13 @@ async def main(vs_ai=False, settings=None):
             # Force abilities & effects
             ability_mgr.update(dt)
             force_fx.update(dt)
+            profiler.lap('combat')
 
             # Extra balls (power-ups)
             if pu_mgr:
-                for eb in pu_mgr.extra_balls:
-                    eb.update()
-                    handle_ball_collision_cursed(eb, left_paddle, right_paddle,
-                                                screen_h=CH)
                 pu_mgr.update(ball)
                 pu_mgr.create_extra_balls(ball, mode='physics')
+            profiler.lap('powerups')
 
             # Scoring
             scored = False
@@ -709,10 +746,6 @@ async def main(vs_ai=False, settings=None):
                             else:
                                 ball.pos[0] = CW - ball.radius
                                 ball.vel[0] = -abs(ball.vel[0])
-                    pu_mgr.extra_balls = [
-                        eb for eb in pu_mgr.extra_balls
-                        if -eb.radius <= eb.pos[0] <= CW + eb.radius
-                    ]
                     result = pu_mgr.check_multiball_done()
                     if result == 'right_scores':
                         right_score += 1
@@ -757,6 +790,8 @@ async def main(vs_ai=False, settings=None):
                         juice.on_score(CW * 3 // 4, 20 + 25, str(right_score),
                                        FONT_SCORE_GAME, LIGHT_PURPLE)
 
+        profiler.lap('physics')
+
         # Win condition
         if left_score >= win_score or right_score >= win_score:
             right_name = "AI" if vs_ai else "Right Player"
@@ -822,7 +857,7 @@ async def main(vs_ai=False, settings=None):
                 draw_touch_buttons(WIN, False)
                 pygame.display.update()
                 touch.clear_taps()
-                await asyncio.sleep(0)
+                await frame_scheduler.next_frame(idle=True)
 
             result = await countdown(WIN, draw_full_scene)
             if result == 'quit':
@@ -830,7 +865,8 @@ async def main(vs_ai=False, settings=None):
                 return
 
         touch.clear_taps()
-        await asyncio.sleep(0)
+        quality.end()
+        await frame_scheduler.next_frame()
 
 
 class _ReversedKeys:
@@ -14,13 +14,18 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from pong.constants import *
 from pong.paddle import Paddle
 from pong.ball import Ball
-from pong.utilities import draw, reset
-from pong.helpers import handle_ball_collision, handle_paddle_movement
+from pong.utilities import draw, draw_scores, reset
+from pong.render_cache import render_text
+from pong.helpers import handle_paddle_movement
+from pong.contacts import resolve_contacts
 from pong.ai import ai_move_paddle, DIFFICULTY_NAMES
 from pong.touch import TouchHandler, draw_touch_buttons, draw_touch_zones
 from pong.powerups import PowerUpManager
-from pong import audio
+from pong import audio, frame_scheduler
 from pong.juice import JuiceManager
+from pong.quality import QualityGovernor
+from pong.profiler import FrameProfiler
+from pong.render_scale import InternalResolution
 from pong.game_flow import countdown, PauseMenu, WinScreen, confirm_exit
 
 async def main(vs_ai=False, settings=None):
@@ -59,11 +64,24 @@ async def main(vs_ai=False, settings=None):
 
     # Power-ups
     power_ups_on = settings.power_ups_enabled if settings else False
-    pu_mgr = PowerUpManager(left_paddle, right_paddle) if power_ups_on else None
+    chaos = getattr(settings, 'multiball_chaos', False)
+    pu_mgr = PowerUpManager(left_paddle, right_paddle, chaos=chaos) if power_ups_on else None
 
     # Juice (visual effects) — respects settings
     juice = JuiceManager(settings)
 
+    # Optional internal-resolution world rendering (HUD stays native)
+    view = InternalResolution(getattr(settings, 'render_scale', 1.0), (WIDTH, HEIGHT))
+
+    # Adaptive effect quality (trail, aura, particle budgets)
+    quality = QualityGovernor(settings)
+    quality.apply(balls=[ball], juice=juice)
+
+    # Per-frame phase timings (F3 overlay)
+    profiler = FrameProfiler(settings)
+    profiler.track(lambda: {'particles': len(juice.particles),
+                            'extra_balls': len(pu_mgr.extra_balls) if pu_mgr else 0})
+
     # Pause menu & win screen
     pause_menu = PauseMenu()
     win_screen_ui = WinScreen()
@@ -77,10 +95,18 @@ async def main(vs_ai=False, settings=None):
 
     def draw_full_scene():
         """Draw the complete game scene."""
-        draw(WIN, [left_paddle, right_paddle], ball, left_score, right_score, FONT_SCORE_GAME, bg_color)
+        world, scale = view.begin(WIN), view.scale
+        draw(world, [left_paddle, right_paddle], ball, left_score, right_score, FONT_SCORE_GAME, bg_color,
+             scale=scale, scores=not view.active)
         if pu_mgr:
-            pu_mgr.draw(WIN)
-            pu_mgr.draw_extra_balls(WIN)
+            pu_mgr.draw(world, scale, labels=not view.active)
+            pu_mgr.draw_extra_balls(world, scale)
+        juice.draw_world(world, scale)
+        if view.active:
+            view.present(WIN)
+            draw_scores(WIN, left_score, right_score, FONT_SCORE_GAME)
+            if pu_mgr:
+                pu_mgr.draw_labels(WIN)
 
         # Physics debug info
         vel_text = FONT_SMALL_DIGITAL.render(f"Velocity: [{ball.vel[0]:.2f}, {ball.vel[1]:.2f}]", True, GREY)
@@ -88,9 +114,9 @@ async def main(vs_ai=False, settings=None):
         WIN.blit(vel_text, (10, 60))
         WIN.blit(spin_text, (10, 85))
 
-        mode_text = FONT_MODE_GAME.render(mode_label, True, GREY)
+        mode_text = render_text(FONT_MODE_GAME, mode_label, GREY)
         WIN.blit(mode_text, (10, 10))
-        juice.draw(WIN)
+        juice.draw_hud(WIN)
 
     # Initial countdown
     result = await countdown(WIN, draw_full_scene)
@@ -100,9 +126,14 @@ async def main(vs_ai=False, settings=None):
     run = True
     while run:
         dt = clock.tick(FPS) / 1000.0
+        if quality.begin():
+            quality.apply(balls=[ball], juice=juice)
+        profiler.begin()
 
         for event in pygame.event.get():
             touch.handle_event(event)
+            if profiler.handle_event(event):
+                continue
             if event.type == pygame.QUIT:
                 run = False
                 break
@@ -161,11 +192,15 @@ async def main(vs_ai=False, settings=None):
             elif action == 'menu':
                 return
 
+        profiler.lap('events')
+
         # Update juice effects
         juice.update()
+        profiler.lap('juice')
 
         # Draw scene
         draw_full_scene()
+        profiler.lap('world')
 
         if paused:
             pause_menu.draw(WIN)
@@ -175,14 +210,17 @@ async def main(vs_ai=False, settings=None):
             footer_text = "Press [SPACE] to pause | [R] to restart | [M] to return | [ESC] to quit | [H] to hide"
         else:
             footer_text = "Press [H] for help"
-        footer = FONT_SMALL_DIGITAL.render(footer_text, True, GREY)
+        footer = render_text(FONT_SMALL_DIGITAL, footer_text, GREY)
         WIN.blit(footer, (GAME_MARGIN_X, GAME_FOOTER[1]))
 
         draw_touch_zones(WIN, touch)
         touch.update_ripples()
         touch.draw_ripples(WIN)
         draw_touch_buttons(WIN, paused)
+        profiler.lap('effects')
+        profiler.draw(WIN)
         pygame.display.update()
+        profiler.lap('flip')
 
         keys = pygame.key.get_pressed()
         if not paused:
@@ -196,8 +234,10 @@ async def main(vs_ai=False, settings=None):
                 frozen_l = frozen_r = False
 
             handle_paddle_movement(keys, left_paddle, right_paddle, ai_right=vs_ai, touch=touch)
+            profiler.lap('physics')
             if vs_ai:
                 ai_move_paddle(right_paddle, ball, difficulty=ai_diff)
+            profiler.lap('ai')
 
             if frozen_l:
                 left_paddle.pos[:] = saved_l
@@ -209,34 +249,18 @@ async def main(vs_ai=False, settings=None):
             left_paddle.update()
             right_paddle.update()
             ball.update()
+            contacts = resolve_contacts(ball, left_paddle, right_paddle, 'physics')
+            audio.play_contacts(contacts)
+            juice.on_contacts(contacts, l_color, r_color)
+            profiler.lap('physics')
 
-            old_vx = ball.vel[0]
-            old_vy = ball.vel[1]
-            handle_ball_collision(ball, left_paddle, right_paddle)
-
-            # Wall bounce detection — check if vy flipped sign
-            if old_vy != 0 and (old_vy > 0) != (ball.vel[1] > 0):
-                audio.play('wall_bounce')
-                wall_y = ball.radius if ball.pos[1] <= HEIGHT // 2 else HEIGHT - ball.radius
-                juice.on_wall_bounce(ball.pos[0], wall_y)
-
-            # Detect paddle hit — check if vx flipped sign
-            if old_vx < 0 and ball.vel[0] > 0:
-                audio.play('paddle_hit')
-                juice.on_paddle_hit(left_paddle.pos[0] + left_paddle.width, ball.pos[1], l_color)
-                if pu_mgr: pu_mgr.set_last_hit('left')
-            elif old_vx > 0 and ball.vel[0] < 0:
-                audio.play('paddle_hit')
-                juice.on_paddle_hit(right_paddle.pos[0], ball.pos[1], r_color)
-                if pu_mgr: pu_mgr.set_last_hit('right')
-
-            # Extra balls
             if pu_mgr:
-                for eb in pu_mgr.extra_balls:
-                    eb.update()
-                    handle_ball_collision(eb, left_paddle, right_paddle)
+                pu_mgr.on_contacts(contacts)
+                # Extra balls: one vectorized move / collide / cull
+                pu_mgr.step_extra_balls('physics')
                 pu_mgr.update(ball)
                 pu_mgr.create_extra_balls(ball, mode='physics')
+            profiler.lap('powerups')
 
             # Scoring
             scored = False
@@ -246,10 +270,6 @@ async def main(vs_ai=False, settings=None):
                         pu_mgr.park_main_ball(ball, 'left')
                     elif ball.pos[0] > WIDTH:
                         pu_mgr.park_main_ball(ball, 'right')
-                pu_mgr.extra_balls = [
-                    eb for eb in pu_mgr.extra_balls
-                    if -eb.radius <= eb.pos[0] <= WIDTH + eb.radius
-                ]
                 result = pu_mgr.check_multiball_done()
                 if result == 'right_scores':
                     right_score += 1
@@ -280,6 +300,8 @@ async def main(vs_ai=False, settings=None):
                 else:
                     juice.on_score(WIDTH * 3 // 4, 20 + 25, str(right_score), FONT_SCORE_GAME, LIGHT_PURPLE)
 
+        profiler.lap('physics')
+
         # Win condition
         if left_score >= win_score or right_score >= win_score:
             right_name = "AI" if vs_ai else "Right Player"
@@ -320,13 +342,14 @@ async def main(vs_ai=False, settings=None):
                 draw_touch_buttons(WIN, False)
                 pygame.display.update()
                 touch.clear_taps()
-                await asyncio.sleep(0)
+                await frame_scheduler.next_frame(idle=True)
 
             result = await countdown(WIN, draw_full_scene)
             if result == 'quit': return
 
         touch.clear_taps()
-        await asyncio.sleep(0)
+        quality.end()
+        await frame_scheduler.next_frame()
     return
 
 if __name__ == '__main__':
@@ -12,11 +12,16 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from pong.constants import *
 from pong.paddle import Paddle
 from pong.ball import Ball
-from pong.utilities import draw as draw_game, reset, handle_ball_collision
+from pong.utilities import draw as draw_game, reset
+from pong.render_cache import render_text
+from pong.contacts import resolve_contacts, paddle_hits
 from pong.helpers import handle_paddle_movement
 from pong.touch import TouchHandler, draw_touch_buttons, draw_touch_zones
-from pong import audio
+from pong import audio, frame_scheduler
 from pong.juice import JuiceManager
+from pong.quality import QualityGovernor
+from pong.profiler import FrameProfiler
+from pong.memory_tracker import MemoryTracker
 from pong.game_flow import PauseMenu, confirm_exit
 
 def draw_debug_info(win, ball, left_paddle, right_paddle):
@@ -32,11 +37,20 @@ def draw_debug_info(win, ball, left_paddle, right_paddle):
 
     y_offset = 40
     for i, line in enumerate(debug_lines):
-        text = FONT_TINY_DIGITAL.render(line, True, GREEN)
+        text = render_text(FONT_TINY_DIGITAL, line, GREEN)
         win.blit(text, (10, y_offset + i * 16))
 
 
 async def main(settings=None):
+    # tracemalloc and the gc hook must not outlive the mode, however it exits
+    mem = MemoryTracker()
+    try:
+        return await _run(settings, mem)
+    finally:
+        mem.stop()
+
+
+async def _run(settings, mem):
     WIN = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Pong - Sandbox")
     clock = pygame.time.Clock()
@@ -73,24 +87,41 @@ async def main(settings=None):
     # Juice (visual effects) — respects settings
     juice = JuiceManager(settings)
 
+    # Adaptive effect quality (trail, aura, particle budgets)
+    quality = QualityGovernor(settings)
+    quality.apply(balls=[ball], juice=juice)
+
+    # Per-frame phase timings (F3 overlay)
+    profiler = FrameProfiler(settings)
+    profiler.track(lambda: {'particles': len(juice.particles)})
+
     # Pause menu
     pause_menu = PauseMenu()
 
     def draw_full_scene():
         """Draw the complete game scene."""
         draw_game(WIN, [left_paddle, right_paddle], ball, left_hits, right_hits, FONT_SCORE_GAME, bg_color)
-        mode_text = FONT_MODE_GAME.render("MODE: SANDBOX", True, GREEN)
+        mode_text = render_text(FONT_MODE_GAME, "MODE: SANDBOX", GREEN)
         WIN.blit(mode_text, (10, 10))
         if show_debug:
             draw_debug_info(WIN, ball, left_paddle, right_paddle)
+            mem.draw(WIN, (10, 150))
         juice.draw(WIN)
 
     while True:
         clock.tick(FPS)
+        if quality.begin():
+            quality.apply(balls=[ball], juice=juice)
+        profiler.begin()
+        mem.frame(particles=len(juice.particles))
         keys = pygame.key.get_pressed()
 
         for event in pygame.event.get():
             touch.handle_event(event)
+            if profiler.handle_event(event):
+                continue
+            if show_debug and mem.handle_event(event):
+                continue
             if event.type == pygame.QUIT:
                 return
 
@@ -160,28 +191,35 @@ async def main(settings=None):
             elif action == 'menu':
                 return
 
+        profiler.lap('events')
+
         # Update juice effects
         juice.update()
+        profiler.lap('juice')
 
         # Draw scene
         draw_full_scene()
+        profiler.lap('world')
 
         if paused:
             pause_menu.draw(WIN)
 
         # Footer instructions
         if show_instructions:
-            footer_text = "[SPACE] pause | [R] reset | [D] debug | [M] menu | [ESC] quit | [H] hide"
+            footer_text = "[SPACE] pause | [R] reset | [D] debug | [T] memory | [M] menu | [ESC] quit | [H] hide"
         else:
             footer_text = "Press [H] for help | [D] toggle debug"
-        footer = FONT_SMALL_DIGITAL.render(footer_text, True, GREY)
+        footer = render_text(FONT_SMALL_DIGITAL, footer_text, GREY)
         WIN.blit(footer, (GAME_MARGIN_X, GAME_FOOTER[1]))
 
         draw_touch_zones(WIN, touch)
         touch.update_ripples()
         touch.draw_ripples(WIN)
         draw_touch_buttons(WIN, paused)
+        profiler.lap('effects')
+        profiler.draw(WIN)
         pygame.display.update()
+        profiler.lap('flip')
 
         if not paused:
             handle_paddle_movement(keys, left_paddle, right_paddle, touch=touch)
@@ -190,25 +228,11 @@ async def main(settings=None):
 
             ball.update()
 
-            old_vx = ball.vel[0]
-            old_vy = ball.vel[1]
-            handle_ball_collision(ball, left_paddle, right_paddle, HEIGHT)
-
-            # Wall bounce detection — check if vy flipped sign
-            if old_vy != 0 and (old_vy > 0) != (ball.vel[1] > 0):
-                audio.play('wall_bounce')
-                wall_y = ball.radius if ball.pos[1] <= HEIGHT // 2 else HEIGHT - ball.radius
-                juice.on_wall_bounce(ball.pos[0], wall_y)
-
-            # Detect paddle hits — check if vx flipped sign
-            if old_vx < 0 and ball.vel[0] > 0:
-                left_hits += 1
-                audio.play('paddle_hit')
-                juice.on_paddle_hit(left_paddle.pos[0] + left_paddle.width, ball.pos[1], l_color)
-            elif old_vx > 0 and ball.vel[0] < 0:
-                right_hits += 1
-                audio.play('paddle_hit')
-                juice.on_paddle_hit(right_paddle.pos[0], ball.pos[1], r_color)
+            contacts = resolve_contacts(ball, left_paddle, right_paddle, 'classic', HEIGHT)
+            left_hits += len(paddle_hits(contacts, 'left'))
+            right_hits += len(paddle_hits(contacts, 'right'))
+            audio.play_contacts(contacts)
+            juice.on_contacts(contacts, l_color, r_color)
 
             # In sandbox, ball bounces off all walls (no scoring)
             if ball.pos[0] - ball.radius < 0:
@@ -221,9 +245,11 @@ async def main(settings=None):
                 ball.pos[0] = WIDTH - ball.radius
                 audio.play('wall_bounce')
                 juice.on_wall_bounce(WIDTH - ball.radius, ball.pos[1])
+        profiler.lap('physics')
 
         touch.clear_taps()
-        await asyncio.sleep(0)
+        quality.end()
+        await frame_scheduler.next_frame()
 
 
 if __name__ == '__main__':